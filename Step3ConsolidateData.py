@@ -5,6 +5,7 @@ Run this after Step1DataProcessing.ipynb and Step2CleanData.ipynb.
 import pandas as pd
 from pathlib import Path
 from config.ScoringConfig import league_default_scoring_config as scoring
+from utility import Schema, Trace
 
 
 def calculate_offensive_points(row):
@@ -104,9 +105,15 @@ def calculate_kicking_points(row):
     return points
 
 
-def main():
-    """Main consolidation function."""
-    cleaned_path = Path("data/cleaned/")
+def main(cleaned_path="data/cleaned/"):
+    """
+    Main consolidation function.
+
+    Args:
+        cleaned_path: Directory with the cleaned summaries; the consolidated
+            data is written there too
+    """
+    cleaned_path = Path(cleaned_path)
 
     print("=" * 60)
     print("CONSOLIDATING PLAYER DATA")
@@ -114,36 +121,42 @@ def main():
 
     # Read cleaned data
     print("\n1. Loading cleaned data...")
+    stage = Trace.span("step3.load")
     try:
-        off_df = pd.read_csv(cleaned_path / "off_position_year_summary.csv")
+        off_df = Schema.read_csv(cleaned_path / "off_position_year_summary.csv")
         print(f"Loaded {len(off_df)} offensive records")
     except FileNotFoundError:
         print("off_position_year_summary.csv not found!")
         return None
 
     try:
-        def_df = pd.read_csv(cleaned_path / "def_position_year_summary.csv")
+        def_df = Schema.read_csv(cleaned_path / "def_position_year_summary.csv")
         print(f"Loaded {len(def_df)} defensive records")
     except FileNotFoundError:
         print("def_position_year_summary.csv not found!")
         return None
 
     try:
-        team_def_df = pd.read_csv(cleaned_path / "team_defense_summary.csv")
+        team_def_df = Schema.read_csv(cleaned_path / "team_defense_summary.csv")
         print(f"Loaded {len(team_def_df)} team defense records")
     except FileNotFoundError:
         print("Error: team_defense_summary.csv not found! Skipping team defense...")
         return None
 
     try:
-        kick_df = pd.read_csv(cleaned_path / "kicking_position_summary.csv")
+        kick_df = Schema.read_csv(cleaned_path / "kicking_position_summary.csv")
         print(f"Loaded {len(kick_df)} kicking records")
     except FileNotFoundError:
         print("kicking_position_summary.csv not found!")
         return None
 
+    for name, frame in [('off_df', off_df), ('def_df', def_df), ('team_def_df', team_def_df), ('kick_df', kick_df)]:
+        Trace.frame_memory(name, frame)
+    stage.end()
+
     # Calculate fantasy points
     print("\nCalculating fantasy points...")
+    stage = Trace.span("step3.score")
     off_df['fantasy_points'] = off_df.apply(calculate_offensive_points, axis=1)
     def_df['fantasy_points'] = def_df.apply(calculate_defensive_points, axis=1)
     kick_df['fantasy_points'] = kick_df.apply(calculate_kicking_points, axis=1)
@@ -159,8 +172,11 @@ def main():
     team_def_df['player_type'] = 'team_defense'
     kick_df['player_type'] = 'kicker'
 
+    stage.end()
+
     # Standardize columns
     print("\n3. Standardizing columns...")
+    stage = Trace.span("step3.standardize")
 
     # Offensive players
     off_cols = ['position', 'season', 'games_played_season', 'fantasy_points', 'player_type']
@@ -185,9 +201,14 @@ def main():
 
     print("Columns standardized across all datasets")
 
+    stage.end()
+
     # Combine all datasets
     print("\nCombining datasets...")
-    combined_df = pd.concat([off_final, def_final, kick_final, team_def_final], ignore_index=True)
+    stage = Trace.span("step3.combine")
+    combined_df = Schema.categorize(
+        pd.concat([off_final, def_final, kick_final, team_def_final], ignore_index=True)
+    )
     print(f"  Combined into {len(combined_df)} total player-seasons")
 
     # Calculate points per game
@@ -201,9 +222,13 @@ def main():
     filtered_count = original_count - len(combined_df)
     print(f"Filtered {filtered_count} records with < 4 games played")
 
+    Trace.frame_memory('combined_df', combined_df)
+    stage.end()
+
     # Save consolidated dataset
     output_path = cleaned_path / "consolidated_player_data.csv"
-    combined_df.to_csv(output_path, index=False)
+    with Trace.span("step3.save", rows=len(combined_df)):
+        combined_df.to_csv(output_path, index=False)
     print(f"\n✓ Saved consolidated data to: {output_path}")
 
     # Print summary statistics
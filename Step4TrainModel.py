@@ -11,6 +11,21 @@ from sklearn.metrics import mean_absolute_error, r2_score
 import joblib
 
 from config.LeagueConfig import league_teams_default_config
+from recommender.ComparablesIndex import ComparablesIndex
+from recommender.PositionAnalysis import PositionAnalysis
+from utility import Schema, Trace
+
+# Model inputs (see prepare_features)
+FEATURE_COLUMNS = [
+    'position_encoded',
+    'games_played_season',
+    'prev_season_points',
+    'prev_season_ppg',
+    'position_avg_points',
+    'position_avg_ppg',
+    'points_vs_position_avg',
+    'ppg_vs_position_avg'
+]
 
 
 def create_position_rankings(df):
@@ -43,11 +58,11 @@ def prepare_features(df):
     # Sort by position and season for lag features
     data = data.sort_values(['position', 'season'])
     # Create lag features
-    data['prev_season_points'] = data.groupby('position')['fantasy_points'].shift(1)
-    data['prev_season_ppg'] = data.groupby('position')['points_per_game'].shift(1)
+    data['prev_season_points'] = data.groupby('position', observed=True)['fantasy_points'].shift(1)
+    data['prev_season_ppg'] = data.groupby('position', observed=True)['points_per_game'].shift(1)
     # Position avg per season
-    data['position_avg_points'] = data.groupby(['position', 'season'])['fantasy_points'].transform('mean')
-    data['position_avg_ppg'] = data.groupby(['position', 'season'])['points_per_game'].transform('mean')
+    data['position_avg_points'] = data.groupby(['position', 'season'], observed=True)['fantasy_points'].transform('mean')
+    data['position_avg_ppg'] = data.groupby(['position', 'season'], observed=True)['points_per_game'].transform('mean')
     # Player's dev from position avg
     data['points_vs_position_avg'] = data['fantasy_points'] - data['position_avg_points']
     data['ppg_vs_position_avg'] = data['points_per_game'] - data['position_avg_ppg']
@@ -58,7 +73,7 @@ def prepare_features(df):
     return data, le
 
 
-def filter_to_draftable_players(df, league_size=10):
+def filter_to_draftable_players(df, league_size=10, max_per_position=None):
     """
     Filter to only keep draftable players per position.
     Keeps top N players per position based on league roster limits.
@@ -66,6 +81,7 @@ def filter_to_draftable_players(df, league_size=10):
     Args:
         df: DataFrame with position rankings
         league_size: Number of teams in league
+        max_per_position: Roster limit per position (default: the default league's)
 
     Returns:
         Filtered DataFrame
@@ -73,7 +89,7 @@ def filter_to_draftable_players(df, league_size=10):
     from config.LeagueConfig import league_teams_default_config
 
     # Calculate draftable count per position (adding a 20% buffer)
-    max_per_pos = league_teams_default_config['max_per_position']
+    max_per_pos = max_per_position or league_teams_default_config['max_per_position']
 
     draftable_counts = {}
     for pos, max_allowed in max_per_pos.items():
@@ -105,27 +121,26 @@ def filter_to_draftable_players(df, league_size=10):
     return result
 
 
-def main():
-    """Main training function."""
-    print("="*60)
-    print("  STEP 4: TRAINING DRAFT PREDICTION MODEL")
-    print("="*60)
-    # Load consolidated data
-    print("\nLoading consolidated data...")
-    try:
-        df = pd.read_csv("data/cleaned/consolidated_player_data.csv")
-        print(f"  Loaded {len(df)} player-season records")
-    except FileNotFoundError:
-        print("   Error: consolidated_player_data.csv not found!")
-        print("   Please run Step3ConsolidateData.py first")
-        return
+def build_rankings(df, league_size=10, max_per_position=None):
+    """
+    Rank the consolidated player-seasons and keep the draft pool.
+
+    Args:
+        df: Consolidated player data (Step 3 output)
+        league_size: Number of teams in league
+        max_per_position: Roster limit per position (default: the default league's)
+
+    Returns:
+        Rankings DataFrame (as saved to player_rankings.csv)
+    """
     # Create position rankings
     print("\nCreating position rankings...")
     df_ranked = create_position_rankings(df)
     # Filter to only draftable players
     print("\n   Filtering to draftable players only...")
     original_count = len(df_ranked)
-    df_ranked = filter_to_draftable_players(df_ranked, league_size=league_teams_default_config['league_size'])
+    df_ranked = filter_to_draftable_players(df_ranked, league_size=league_size,
+                                            max_per_position=max_per_position)
     filtered_count = original_count - len(df_ranked)
     print(f"   ✓ Removed {filtered_count} non-draftable players")
     print(f"   ✓ Kept {len(df_ranked)} draftable players")
@@ -136,23 +151,59 @@ def main():
             df_ranked.loc[pos_mask, 'points_per_game']
             .rank(pct=True)
         )
+    return df_ranked
+
+
+def train_model(X_train, y_train):
+    """Fit the Random Forest PPG model."""
+    model = RandomForestRegressor(
+        n_estimators=100,
+        max_depth=10,
+        min_samples_split=5,
+        random_state=42,
+        n_jobs=-1,
+        verbose=0
+    )
+    model.fit(X_train, y_train)
+    return model
+
+
+def main():
+    """Main training function."""
+    print("="*60)
+    print("  STEP 4: TRAINING DRAFT PREDICTION MODEL")
+    print("="*60)
+    # Load consolidated data
+    print("\nLoading consolidated data...")
+    stage = Trace.span("step4.load")
+    try:
+        df = Schema.read_csv("data/cleaned/consolidated_player_data.csv")
+        print(f"  Loaded {len(df)} player-season records")
+    except FileNotFoundError:
+        print("   Error: consolidated_player_data.csv not found!")
+        print("   Please run Step3ConsolidateData.py first")
+        return
+    Trace.frame_memory('df', df)
+    stage.end()
+    stage = Trace.span("step4.rankings")
+    df_ranked = build_rankings(df, league_size=league_teams_default_config['league_size'])
     # Save rankings
     rankings_path = "data/summary/player_rankings.csv"
     df_ranked.to_csv(rankings_path, index=False)
+    Trace.frame_memory('df_ranked', df_ranked)
+    stage.end()
     print(f"  Rankings created and saved to {rankings_path}")
+    # Scarcity and tier tables for the analysis view and recommender, keyed
+    # by the hash of the rankings as they are read back from the CSV
+    analysis_path = "data/summary/position_analysis.pkl"
+    with Trace.span("step4.position_analysis"):
+        PositionAnalysis.build(Schema.read_csv(rankings_path)).save(analysis_path)
+    print(f"  Position analysis saved to {analysis_path}")
     # Prepare features
     print("\nPreparing features for modeling...")
+    stage = Trace.span("step4.features")
     data, label_encoder = prepare_features(df_ranked)
-    feature_columns = [
-        'position_encoded',
-        'games_played_season',
-        'prev_season_points',
-        'prev_season_ppg',
-        'position_avg_points',
-        'position_avg_ppg',
-        'points_vs_position_avg',
-        'ppg_vs_position_avg'
-    ]
+    feature_columns = list(FEATURE_COLUMNS)
     # Remove rows with NaN in features or target
     data_clean = data.dropna(subset=feature_columns + ['points_per_game'])
     print(f"Prepared {len(data_clean)} records for training")
@@ -162,26 +213,23 @@ def main():
     X_train, X_test, y_train, y_test = train_test_split(
         X, y, test_size=0.2, random_state=42
     )
+    Trace.frame_memory('data', data)
+    Trace.frame_memory('data_clean', data_clean)
+    stage.end()
     print(f"   Training set: {len(X_train)} samples")
     print(f"   Test set:     {len(X_test)} samples")
 
     # Train Random Forest model
     print("\nTraining Random Forest model...")
-    model = RandomForestRegressor(
-        n_estimators=100,
-        max_depth=10,
-        min_samples_split=5,
-        random_state=42,
-        n_jobs=-1,
-        verbose=0
-    )
-    model.fit(X_train, y_train)
+    with Trace.span("step4.train", rows=len(X_train)):
+        model = train_model(X_train, y_train)
     print("   Model training complete!")
 
     # Evaluate model performance
     print("\nEvaluating model performance...")
-    train_pred = model.predict(X_train)
-    test_pred = model.predict(X_test)
+    with Trace.span("step4.evaluate"):
+        train_pred = model.predict(X_train)
+        test_pred = model.predict(X_test)
 
     train_mae = mean_absolute_error(y_train, train_pred)
     test_mae = mean_absolute_error(y_test, test_pred)
@@ -210,6 +258,7 @@ def main():
 
     # Save model
     print("\nSaving model...")
+    stage = Trace.span("step4.save")
     models_path = Path("models")
     models_path.mkdir(exist_ok=True)
 
@@ -217,10 +266,16 @@ def main():
     joblib.dump(label_encoder, models_path / 'position_encoder.pkl')
     joblib.dump(feature_columns, models_path / 'feature_columns.pkl')
 
+    # Comparable player-seasons index (per-position KD-trees)
+    comparables = ComparablesIndex.build(data_clean, feature_columns)
+    comparables.save(models_path / 'comparables_index.pkl')
+    stage.end()
+
     print(f"Model saved to {models_path}/")
     print(f"     - draft_model.pkl")
     print(f"     - position_encoder.pkl")
     print(f"     - feature_columns.pkl")
+    print(f"     - comparables_index.pkl")
 
     # Summary
     print("\n" + "="*60)
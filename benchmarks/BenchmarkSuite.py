@@ -0,0 +1,311 @@
+"""
+Performance benchmarks for the recommender, simulator and data pipeline.
+
+Every case runs on fixed data sizes: the real rankings / consolidated data
+and seeded synthetic sets of fixed size, so results are comparable between
+runs and machines stay the only variable. Each case is warmed up once and
+then timed `repeat` times; the median is what gets compared.
+
+    py -m benchmarks.BenchmarkSuite run [--out benchmarks/baseline.json] [--only draft]
+    py -m benchmarks.BenchmarkSuite compare [--baseline benchmarks/baseline.json] [--threshold 0.25]
+
+`compare` runs the suite (or reads --current) and exits with status 1 if
+any case's median is more than `threshold` slower than the baseline.
+"""
+import argparse
+import contextlib
+import io
+import json
+import platform
+import statistics
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from benchmarks import SyntheticData
+from utility import Schema
+
+BASELINE_PATH = "benchmarks/baseline.json"
+DEFAULT_THRESHOLD = 0.25
+SEASON = 2024
+
+# Synthetic data sizes (multiples of the real player counts, see benchmarks.SyntheticData)
+SYNTHETIC_SCALE = 10
+SYNTHETIC_STEP3_SCALE = 1
+SYNTHETIC_TRAINING_SCALE = 3
+
+
+def synthetic_rankings():
+    """Rankings of SYNTHETIC_SCALE times the real players (about 10,000 rows)."""
+    return SyntheticData.synthetic_rankings(scale=SYNTHETIC_SCALE, seed=0)
+
+
+def synthetic_stats():
+    """Step 3 inputs (offensive, defensive, kicking, team defense stat rows)."""
+    tables = SyntheticData.synthetic_step3_inputs(scale=SYNTHETIC_STEP3_SCALE, seed=0)
+    return {
+        'offense': tables['off_position_year_summary.csv'],
+        'defense': tables['def_position_year_summary.csv'],
+        'kicking': tables['kicking_position_summary.csv'],
+        'team_defense': tables['team_defense_summary.csv'],
+    }
+
+
+def _real_rankings():
+    from recommender import DataLoader
+    return DataLoader.load_rankings()
+
+
+DATASETS = {
+    'real': _real_rankings,
+    'synthetic': synthetic_rankings,
+}
+
+
+def _mid_draft(rankings, league_config):
+    """A recommender with the first three rounds drafted (best PPG) and a matching roster."""
+    from recommender.DraftRecommender import DraftRecommender
+
+    recommender = DraftRecommender(rankings=rankings)
+    recommender.reset_draft()
+    season = rankings[rankings['season'] == SEASON]
+    for player in season.nlargest(3 * league_config['league_size'], 'points_per_game').index:
+        recommender.mark_player_drafted(int(player))
+    roster = {pos: 0 for pos in list(league_config['starters_per_pos']) + ['FLEX', 'BENCH']}
+    roster.update({'QB': 1, 'RB': 1, 'WR': 1})
+    recommender.get_recommendations(roster, league_config, SEASON)  # Warm the season caches
+    return recommender, roster
+
+
+def case_get_recommendations(rankings, league_config):
+    recommender, roster = _mid_draft(rankings, league_config)
+    return lambda: recommender.get_recommendations(roster, league_config, SEASON, top_n=10)
+
+
+def case_get_best_available(rankings, league_config):
+    recommender, _ = _mid_draft(rankings, league_config)
+    positions = list(league_config['starters_per_pos'])
+    return lambda: [recommender.get_best_available_by_position(pos, SEASON, n=5) for pos in positions]
+
+
+def case_apply_fol_filter(rankings, league_config):
+    recommender, roster = _mid_draft(rankings, league_config)
+    recs = recommender.rank_available(recommender.get_position_needs(roster, league_config), SEASON, 200)
+    return lambda: recommender.apply_fol_filter(roster, recs, league_config, SEASON)
+
+
+def case_get_position_scarcity(rankings, league_config):
+    from recommender.DraftRecommender import DraftRecommender
+    recommender = DraftRecommender(rankings=rankings)
+    return lambda: recommender.get_position_scarcity(SEASON)
+
+
+def case_position_analysis_build(rankings, league_config):
+    from recommender.PositionAnalysis import PositionAnalysis
+    return lambda: PositionAnalysis.build(rankings)
+
+
+def case_full_draft(rankings, league_config):
+    """A complete non-interactive draft: every seat takes its top recommendation it has room for."""
+    from live.LiveDraft import LiveDraftSession
+    from recommender.DraftRecommender import DraftRecommender
+
+    analysis = DraftRecommender(rankings=rankings)
+    analysis._get_position_lookups(SEASON)
+
+    def draft():
+        recommender = DraftRecommender(rankings=rankings)
+        recommender.share_season_caches(analysis)
+        session = LiveDraftSession(recommender, league_config, user_seat=1, season=SEASON)
+        while not session.is_complete():
+            seat = session.current_seat()
+            if seat == session.user_seat:
+                recs = session.get_recommendations(top_n=5)
+            else:
+                recs = recommender.get_recommendations(session.rosters[seat], league_config, SEASON, 5)
+            # A recommended position can already be full; fall back to the
+            # next recommendation, then to the best player of any position
+            events = [{'seat': seat, 'player': int(player)} for player in recs.index]
+            events += [{'seat': seat, 'position': pos} for pos in league_config['max_per_position']]
+            for event in events:
+                try:
+                    session.apply_event(event)
+                    break
+                except ValueError:
+                    continue
+            else:
+                break
+        return session
+
+    return draft
+
+
+def case_step3_scoring(stats, league_config):
+    from Step3ConsolidateData import (calculate_defensive_points, calculate_kicking_points,
+                                      calculate_offensive_points, calculate_team_defense_points)
+
+    def score():
+        stats['offense'].apply(calculate_offensive_points, axis=1)
+        stats['defense'].apply(calculate_defensive_points, axis=1)
+        stats['kicking'].apply(calculate_kicking_points, axis=1)
+        stats['team_defense'].apply(calculate_team_defense_points, axis=1)
+
+    return score
+
+
+def case_step4_training(consolidated, league_config):
+    from sklearn.model_selection import train_test_split
+    from Step4TrainModel import FEATURE_COLUMNS, build_rankings, prepare_features, train_model
+
+    def train():
+        with contextlib.redirect_stdout(io.StringIO()):
+            rankings = build_rankings(consolidated, league_config['league_size'])
+        data, _ = prepare_features(rankings)
+        data = data.dropna(subset=FEATURE_COLUMNS + ['points_per_game'])
+        X_train, _, y_train, _ = train_test_split(data[FEATURE_COLUMNS], data['points_per_game'],
+                                                  test_size=0.2, random_state=42)
+        return train_model(X_train, y_train)
+
+    return train
+
+
+def _consolidated(dataset):
+    if dataset == 'real':
+        return Schema.read_csv("data/cleaned/consolidated_player_data.csv")
+    return SyntheticData.synthetic_consolidated(scale=SYNTHETIC_TRAINING_SCALE, seed=0)
+
+
+# name -> (datasets, data loader(dataset), case setup(data, league_config) -> callable, repeat)
+CASES = {
+    'get_recommendations': (('real', 'synthetic'), lambda d: DATASETS[d](), case_get_recommendations, 30),
+    'get_best_available_by_position': (('real', 'synthetic'), lambda d: DATASETS[d](), case_get_best_available, 30),
+    'apply_fol_filter': (('real', 'synthetic'), lambda d: DATASETS[d](), case_apply_fol_filter, 30),
+    'get_position_scarcity': (('real', 'synthetic'), lambda d: DATASETS[d](), case_get_position_scarcity, 30),
+    'position_analysis_build': (('real', 'synthetic'), lambda d: DATASETS[d](), case_position_analysis_build, 5),
+    'full_draft': (('real', 'synthetic'), lambda d: DATASETS[d](), case_full_draft, 3),
+    'step3_scoring': (('synthetic',), lambda d: synthetic_stats(), case_step3_scoring, 3),
+    'step4_training': (('real', 'synthetic'), _consolidated, case_step4_training, 3),
+}
+
+
+def measure(func, repeat):
+    """Median and min seconds per call over `repeat` timed calls (after one warm-up)."""
+    func()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return {'median': statistics.median(times), 'min': min(times), 'repeat': repeat}
+
+
+def run_suite(only=None, repeat=None, progress=print):
+    """
+    Run the benchmark cases.
+
+    Args:
+        only: Optional substring; only cases whose name contains it run
+        repeat: Override every case's repeat count
+        progress: Callback for one line per finished case (None for quiet)
+
+    Returns:
+        Dict with 'meta' (environment) and 'results' ('case[dataset]' -> timing)
+    """
+    from config.LeagueConfig import league_teams_default_config
+
+    results = {}
+    for name, (datasets, load, setup, case_repeat) in CASES.items():
+        if only and only not in name:
+            continue
+        for dataset in datasets:
+            key = f"{name}[{dataset}]"
+            timing = measure(setup(load(dataset), league_teams_default_config), repeat or case_repeat)
+            results[key] = timing
+            if progress:
+                progress(f"  {key:45s} {timing['median'] * 1000:10.2f} ms (min {timing['min'] * 1000:.2f})")
+
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'pandas': pd.__version__,
+            'machine': platform.machine(),
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'results': results,
+    }
+
+
+def compare(baseline, current, threshold=DEFAULT_THRESHOLD):
+    """
+    Compare two suite results.
+
+    Returns:
+        List of (case, baseline median, current median, ratio, status) where
+        status is 'SLOWER' beyond the threshold, 'faster', 'ok' or 'new'
+    """
+    rows = []
+    for key, timing in current['results'].items():
+        base = baseline['results'].get(key)
+        if base is None:
+            rows.append((key, None, timing['median'], None, 'new'))
+            continue
+        ratio = timing['median'] / base['median']
+        status = 'SLOWER' if ratio > 1 + threshold else 'faster' if ratio < 1 / (1 + threshold) else 'ok'
+        rows.append((key, base['median'], timing['median'], ratio, status))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Recommender, simulator and pipeline benchmarks")
+    commands = parser.add_subparsers(dest='command', required=True)
+    run = commands.add_parser('run', help="Run the suite and write the results")
+    run.add_argument('--out', default=None, help=f"JSON file to write (e.g. {BASELINE_PATH} to reset the baseline)")
+    run.add_argument('--only', default=None, help="Only cases whose name contains this")
+    run.add_argument('--repeat', type=int, default=None)
+    check = commands.add_parser('compare', help="Flag cases slower than the baseline")
+    check.add_argument('--baseline', default=BASELINE_PATH)
+    check.add_argument('--current', default=None, help="Results JSON to compare (default: run the suite now)")
+    check.add_argument('--only', default=None)
+    check.add_argument('--repeat', type=int, default=None)
+    check.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                       help="Allowed slowdown as a fraction (0.25 = 25%%)")
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        print("\nRunning benchmarks...")
+        results = run_suite(args.only, args.repeat)
+        if args.out:
+            with open(args.out, 'w') as f:
+                json.dump(results, f, indent=2)
+            print(f"\nResults saved to {args.out}")
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if args.current:
+        with open(args.current) as f:
+            current = json.load(f)
+    else:
+        print("\nRunning benchmarks...")
+        current = run_suite(args.only, args.repeat)
+
+    rows = compare(baseline, current, args.threshold)
+    print(f"\n  {'case':45s} {'baseline ms':>12s} {'current ms':>11s} {'ratio':>6s}")
+    for key, base, cur, ratio, status in rows:
+        base_text = f"{base * 1000:12.2f}" if base is not None else f"{'-':>12s}"
+        ratio_text = f"{ratio:6.2f}" if ratio is not None else f"{'-':>6s}"
+        print(f"  {key:45s} {base_text} {cur * 1000:11.2f} {ratio_text}  {status}")
+
+    slower = [row for row in rows if row[4] == 'SLOWER']
+    if slower:
+        print(f"\nFAIL: {len(slower)} case(s) more than {args.threshold:.0%} slower than {args.baseline}")
+        return 1
+    print("\nOK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
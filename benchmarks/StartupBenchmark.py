@@ -0,0 +1,87 @@
+"""
+Cold-start benchmark for main.py.
+
+Reports an `-X importtime` profile of `import main` (slowest modules by
+cumulative and self time) and the wall time from launching `main.py` until
+the menu banner is printed, checked against STARTUP_TARGET_SECONDS.
+
+Run with: py -m benchmarks.StartupBenchmark [--runs 5] [--top 15]
+Exits with status 1 if the median time to banner misses the target.
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+# Tracked target: launch to banner, median of the runs
+STARTUP_TARGET_SECONDS = 0.15
+
+BANNER = "FANTASY FOOTBALL DRAFT ASSISTANT"
+
+
+def import_profile(module='main'):
+    """
+    Profile importing a module in a fresh interpreter.
+
+    Returns:
+        List of (module, self_us, cumulative_us) in import order
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True, text=True, check=True
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def time_to_banner():
+    """Seconds from launching main.py until the banner is printed."""
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, 'main.py'], stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+    )
+    try:
+        for line in process.stdout:
+            if BANNER in line:
+                return time.perf_counter() - start
+        raise RuntimeError("main.py exited before printing the banner")
+    finally:
+        process.kill()
+        process.wait()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Profile main.py cold start")
+    parser.add_argument('--runs', type=int, default=5, help="Launches to time")
+    parser.add_argument('--top', type=int, default=15, help="Modules to list")
+    parser.add_argument('--target', type=float, default=STARTUP_TARGET_SECONDS)
+    args = parser.parse_args(argv)
+
+    rows = import_profile()
+    total_us = next(cumulative for name, _, cumulative in rows if name == 'main')
+    print(f"\nimport main: {total_us / 1000:.1f} ms")
+    print(f"\n  {'cumulative ms':>13s} {'self ms':>8s}  module")
+    for name, self_us, cumulative_us in sorted(rows, key=lambda row: -row[2])[:args.top]:
+        print(f"  {cumulative_us / 1000:13.1f} {self_us / 1000:8.1f}  {name}")
+
+    times = [time_to_banner() for _ in range(args.runs)]
+    median = statistics.median(times)
+    print(f"\nLaunch to banner: median {median * 1000:.0f} ms, "
+          f"min {min(times) * 1000:.0f} ms over {args.runs} runs (target {args.target * 1000:.0f} ms)")
+
+    if median > args.target:
+        print("FAIL: startup target missed")
+        return 1
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
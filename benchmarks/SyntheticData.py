@@ -0,0 +1,278 @@
+"""
+Synthetic player data for load testing.
+
+The real data has about 6,000 player-seasons and 1,000 ranked players, which
+hides most scaling problems. This module fits a small profile to the real
+consolidated data (players per season, the empirical PPG and games-played
+distributions of every position and the rank correlation between the two)
+and samples any number of player-seasons from it. Rankings are then built by
+Step 4's own ranking and draft-pool code, so position_rank and
+position_percentile mean exactly what they do in the real rankings.
+
+    py -m benchmarks.SyntheticData --scale 100 --league-size 32 --bench 10 --out data/synthetic
+
+writes consolidated_player_data.csv, player_rankings.csv and league_config.json
+(plus Step 3's four cleaned summaries with --step3) to the output directory.
+"""
+import argparse
+import contextlib
+import copy
+import io
+import json
+import math
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from config.LeagueConfig import league_teams_default_config
+from utility import Schema
+
+CONSOLIDATED_PATH = "data/cleaned/consolidated_player_data.csv"
+OUTPUT_DIR = "data/synthetic"
+CONSOLIDATED_COLUMNS = ['position', 'season', 'games_played_season', 'fantasy_points', 'player_type',
+                        'points_per_game']
+
+# Per-game stat rates of an average player-season, for Step 3's cleaned summaries
+# (team defense rates are per game too; Pts/G is drawn separately)
+STAT_RATES = {
+    'QB': {'passing_yards': 230, 'pass_touchdown': 1.5, 'interception': 0.7, 'rushing_yards': 15,
+           'rush_touchdown': 0.1, 'receiving_yards': 0, 'total_tds': 0.1, 'fumble': 0.2},
+    'RB': {'passing_yards': 0, 'pass_touchdown': 0, 'interception': 0, 'rushing_yards': 55,
+           'rush_touchdown': 0.4, 'receiving_yards': 20, 'total_tds': 0.55, 'fumble': 0.1},
+    'WR': {'passing_yards': 0, 'pass_touchdown': 0, 'interception': 0, 'rushing_yards': 2,
+           'rush_touchdown': 0.01, 'receiving_yards': 55, 'total_tds': 0.4, 'fumble': 0.05},
+    'TE': {'passing_yards': 0, 'pass_touchdown': 0, 'interception': 0, 'rushing_yards': 0,
+           'rush_touchdown': 0, 'receiving_yards': 35, 'total_tds': 0.3, 'fumble': 0.03},
+    'IDP': {'sack': 0.2, 'solo_tackle': 3, 'assist_tackle': 1.5, 'tackle_with_assist': 4.5, 'interception': 0.05,
+            'fumble_forced': 0.05, 'def_touchdown': 0.01, 'safety': 0.002},
+    'K': {'fg_made_0_19': 0.03, 'fg_made_20_29': 0.5, 'fg_made_30_39': 0.5, 'fg_made_40_49': 0.45,
+          'fg_made_50_59': 0.25, 'fg_made_60_': 0.005, 'pat_made': 2.2, 'pat_missed': 0.1, 'fg_missed': 0.3},
+    'D/ST': {'sack': 2.5, 'interception': 0.7, 'fumble': 0.5, 'def_touchdown': 0.15, 'safety': 0.02},
+}
+# Step 3 summary file -> positions it holds
+STEP3_FILES = {
+    'off_position_year_summary.csv': ['QB', 'RB', 'WR', 'TE'],
+    'def_position_year_summary.csv': ['IDP'],
+    'kicking_position_summary.csv': ['K'],
+    'team_defense_summary.csv': ['D/ST'],
+}
+
+
+class DataProfile:
+    """Distributions of the real consolidated data, per position."""
+
+    def __init__(self, positions, seasons):
+        """
+        Args:
+            positions: Dict of position -> {'player_type', 'players_per_season',
+                'ppg' (sorted values), 'games' (sorted values), 'rank_corr'}
+            seasons: Seasons of the fitted data
+        """
+        self.positions = positions
+        self.seasons = seasons
+
+    @classmethod
+    def from_consolidated(cls, consolidated):
+        """Fit the profile to consolidated player data (Step 3 output)."""
+        positions = {}
+        for position, rows in consolidated.groupby('position', sort=False, observed=True):
+            corr = rows['points_per_game'].rank().corr(rows['games_played_season'].rank())
+            positions[position] = {
+                'player_type': rows['player_type'].iloc[0],
+                'players_per_season': len(rows) / rows['season'].nunique(),
+                'ppg': np.sort(rows['points_per_game'].to_numpy()),
+                'games': np.sort(rows['games_played_season'].to_numpy()),
+                'rank_corr': 0.0 if np.isnan(corr) else float(corr),
+            }
+        return cls(positions, sorted(consolidated['season'].unique().tolist()))
+
+    @classmethod
+    def load(cls, path=CONSOLIDATED_PATH):
+        """Profile of the consolidated data file."""
+        return cls.from_consolidated(Schema.read_csv(path))
+
+    def sample(self, position, n, rng):
+        """
+        Draw n player-seasons of a position.
+
+        PPG and games played each follow the position's empirical distribution
+        (inverse CDF of the real values), tied together by a Gaussian copula
+        with the real rank correlation.
+
+        Returns:
+            (points_per_game, games_played_season) arrays
+        """
+        spec = self.positions[position]
+        # Spearman rank correlation -> correlation of the underlying normals
+        rho = 2 * math.sin(math.pi * spec['rank_corr'] / 6)
+        z = rng.standard_normal((2, n))
+        z[1] = rho * z[0] + math.sqrt(1 - rho ** 2) * z[1]
+        # Uniforms from the ranks of the normals (exact marginals, no scipy needed)
+        u = (z.argsort(axis=1).argsort(axis=1) + rng.random((2, n))) / n
+        ppg = np.quantile(spec['ppg'], u[0])
+        games = np.quantile(spec['games'], u[1], method='inverted_cdf')
+        return ppg, games
+
+
+def synthetic_consolidated(profile=None, scale=10.0, seasons=None, seed=0):
+    """
+    Consolidated player data (Step 3 schema) with `scale` times the real
+    number of players per season and position.
+
+    Args:
+        profile: DataProfile (default: fitted to the real consolidated data)
+        scale: Player count multiplier
+        seasons: Seasons to generate (default: the profile's)
+        seed: Random seed
+
+    Returns:
+        DataFrame with CONSOLIDATED_COLUMNS
+    """
+    profile = profile or DataProfile.load()
+    rng = np.random.default_rng(seed)
+    frames = []
+    for season in seasons or profile.seasons:
+        for position, spec in profile.positions.items():
+            n = max(1, round(spec['players_per_season'] * scale))
+            ppg, games = profile.sample(position, n, rng)
+            fantasy_points = ppg * games
+            frames.append(pd.DataFrame({
+                'position': position,
+                'season': season,
+                'games_played_season': games.astype(float),
+                'fantasy_points': fantasy_points,
+                'player_type': spec['player_type'],
+                'points_per_game': (fantasy_points / games).round(2),
+            }))
+    return Schema.categorize(pd.concat(frames, ignore_index=True)[CONSOLIDATED_COLUMNS])
+
+
+def synthetic_rankings(consolidated=None, league_config=None, scale=10.0, draftable_only=True, **kwargs):
+    """
+    Rankings (player_rankings.csv schema) built by Step 4 from synthetic data.
+
+    Step 4 keeps a draft pool sized for the league. With `scale` times the
+    players, the pool is sized for a league `scale` times the default one
+    (or the given league, if bigger), so it is the same fraction of the
+    players as in the real rankings and its PPG distribution matches them.
+
+    Args:
+        consolidated: Consolidated data (default: synthetic_consolidated(scale=scale, **kwargs))
+        league_config: League the pool must cover (default league if None)
+        scale: Player count multiplier of the consolidated data
+        draftable_only: False ranks every player instead of keeping the pool
+
+    Returns:
+        Rankings DataFrame
+    """
+    from Step4TrainModel import build_rankings, create_position_rankings
+
+    if consolidated is None:
+        consolidated = synthetic_consolidated(scale=scale, **kwargs)
+    league_config = league_config or league_teams_default_config
+    if not draftable_only:
+        rankings = create_position_rankings(consolidated)
+        rankings['position_percentile'] = rankings.groupby('position', observed=True)['points_per_game'].rank(pct=True)
+        return rankings
+    pool_league_size = max(league_config['league_size'], round(league_teams_default_config['league_size'] * scale))
+    with contextlib.redirect_stdout(io.StringIO()):
+        return build_rankings(consolidated, pool_league_size, league_config['max_per_position'])
+
+
+def synthetic_league_config(league_size=10, bench_spots=None):
+    """
+    The default league resized to `league_size` teams and `bench_spots` bench
+    spots; position limits grow with the bench so deeper rosters can fill.
+    """
+    config = copy.deepcopy(league_teams_default_config)
+    config['league_size'] = league_size
+    if bench_spots is not None:
+        extra = max(0, bench_spots - config['bench_spots'])
+        per_position = math.ceil(extra / len(config['max_per_position']))
+        config['max_per_position'] = {pos: limit + per_position for pos, limit in config['max_per_position'].items()}
+        config['bench_spots'] = bench_spots
+    return config
+
+
+def synthetic_step3_inputs(profile=None, scale=10.0, seasons=None, seed=0):
+    """
+    Cleaned stat summaries in the shape Step3ConsolidateData.py reads.
+
+    Every player-season has a talent factor (gamma distributed, mean 1) that
+    scales its position's per-game rates; stat totals are Poisson draws over
+    1-17 games, so Step 3's < 4 games filter has rows to drop.
+
+    Returns:
+        Dict of file name (see STEP3_FILES) -> DataFrame
+    """
+    profile = profile or DataProfile.load()
+    rng = np.random.default_rng(seed)
+    tables = {}
+    for file_name, positions in STEP3_FILES.items():
+        frames = []
+        for season in seasons or profile.seasons:
+            for position in positions:
+                n = max(1, round(profile.positions[position]['players_per_season'] * scale))
+                games = rng.integers(1, 18, n) if position != 'D/ST' else np.full(n, 17)
+                talent = rng.gamma(4.0, 0.25, n)
+                frame = {'position': position, 'season': season, 'games_played_season': games}
+                for stat, rate in STAT_RATES[position].items():
+                    frame[stat] = rng.poisson(rate * talent * games)
+                if position == 'D/ST':
+                    frame['Pts/G'] = rng.normal(22, 4, n).clip(8, 38).round(1)
+                frames.append(pd.DataFrame(frame))
+        table = pd.concat(frames, ignore_index=True)
+        if file_name == 'team_defense_summary.csv':
+            table = table.rename(columns={'games_played_season': 'Gms'})
+        tables[file_name] = table
+    return tables
+
+
+def write_dataset(out_dir=OUTPUT_DIR, scale=10.0, league_size=10, bench_spots=None, seed=0, step3=False):
+    """
+    Write a synthetic dataset (consolidated data, rankings and league config).
+
+    Returns:
+        Dict of file name -> rows written
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    profile = DataProfile.load()
+    league_config = synthetic_league_config(league_size, bench_spots)
+    consolidated = synthetic_consolidated(profile, scale, seed=seed)
+    rankings = synthetic_rankings(consolidated, league_config, scale)
+
+    written = {}
+    if step3:
+        for file_name, table in synthetic_step3_inputs(profile, scale, seed=seed).items():
+            table.to_csv(out_dir / file_name, index=False)
+            written[file_name] = len(table)
+    consolidated.to_csv(out_dir / "consolidated_player_data.csv", index=False)
+    rankings.to_csv(out_dir / "player_rankings.csv", index=False)
+    with open(out_dir / "league_config.json", 'w') as f:
+        json.dump(league_config, f, indent=2)
+    written["consolidated_player_data.csv"] = len(consolidated)
+    written["player_rankings.csv"] = len(rankings)
+    return written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate synthetic player data for load testing")
+    parser.add_argument('--scale', type=float, default=10.0, help="Players per season/position vs the real data")
+    parser.add_argument('--league-size', type=int, default=10)
+    parser.add_argument('--bench', type=int, default=None, help="Bench spots (default: the default league's)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--step3', action='store_true', help="Also write Step 3's cleaned summaries")
+    parser.add_argument('--out', default=OUTPUT_DIR)
+    args = parser.parse_args(argv)
+
+    print(f"\nGenerating {args.scale:g}x players for a {args.league_size}-team league...")
+    written = write_dataset(args.out, args.scale, args.league_size, args.bench, args.seed, args.step3)
+    for file_name, rows in written.items():
+        print(f"  {file_name:32s} {rows:>10,d} rows")
+    print(f"\nSaved to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
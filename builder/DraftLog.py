@@ -0,0 +1,183 @@
+"""
+Append-only binary log of a draft's picks (event sourcing).
+
+Layout (little endian):
+    header  8s magic, u64 seed, u16 season, u8 league size, u8 user seat
+    record  u8 seat, u32 player index       (one per pick, 5 bytes)
+
+Every pick is flushed as soon as it is made, so a crashed session can be
+resumed from the log: resume_draft rebuilds the drafted players and every
+roster in O(picks) without running any recommendation logic. replay
+fast-forwards a whole log with NumPy (no per-pick Python) for analysis.
+A torn final record from a crash mid-write is ignored.
+"""
+import os
+import struct
+
+import numpy as np
+
+from builder.RosterBuilder import build_roster_skeleton
+
+MAGIC = b'FFBDLOG\x01'
+HEADER = struct.Struct('<8sQHBB')
+RECORD = struct.Struct('<BI')
+RECORD_DTYPE = np.dtype([('seat', 'u1'), ('player', '<u4')])
+
+# Roster slot codes in replay results
+STARTER, FLEX, BENCH, REJECTED = 0, 1, 2, 3
+
+
+class DraftLog:
+    """Writer for a draft log file."""
+
+    def __init__(self, path, file, header):
+        self.path = path
+        self.header = header
+        self._file = file
+
+    @classmethod
+    def create(cls, path, seed, season, league_size, user_seat):
+        """Start a new log (overwrites an existing file)."""
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        file = open(path, 'wb')
+        file.write(HEADER.pack(MAGIC, seed, season, league_size, user_seat))
+        file.flush()
+        header = {'seed': seed, 'season': season, 'league_size': league_size, 'user_seat': user_seat}
+        return cls(path, file, header)
+
+    @classmethod
+    def append_to(cls, path):
+        """Reopen an existing log to keep appending picks."""
+        header, picks = read_log(path)
+        file = open(path, 'r+b')
+        # Drop a torn final record so new picks stay aligned
+        file.truncate(HEADER.size + len(picks) * RECORD.size)
+        file.seek(0, os.SEEK_END)
+        return cls(path, file, header)
+
+    def append(self, seat, player):
+        """Record one pick and flush it to disk."""
+        self._file.write(RECORD.pack(seat, player))
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+def read_log(path):
+    """
+    Read a draft log.
+
+    Returns:
+        Tuple of (header dict, structured array of picks with 'seat' and 'player')
+
+    Raises:
+        ValueError: If the file is not a draft log
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    if len(data) < HEADER.size or data[:len(MAGIC)] != MAGIC:
+        raise ValueError(f"{path} is not a draft log")
+    _, seed, season, league_size, user_seat = HEADER.unpack_from(data)
+    header = {'seed': seed, 'season': season, 'league_size': league_size, 'user_seat': user_seat}
+
+    body = memoryview(data)[HEADER.size:]
+    complete = len(body) - len(body) % RECORD.size
+    picks = np.frombuffer(body[:complete], dtype=RECORD_DTYPE)
+    return header, picks
+
+
+def _group_rank(keys, mask):
+    """For rows where mask is set, 0-based order of each row within its key (others -1)."""
+    rank = np.full(len(keys), -1, dtype=np.int64)
+    rows = np.flatnonzero(mask)
+    if len(rows) == 0:
+        return rank
+    # Keys are small, and 16-bit keys get NumPy's radix sort
+    row_keys = keys[rows].astype(np.uint16) if keys.max() < 2 ** 16 else keys[rows]
+    order = rows[np.argsort(row_keys, kind='stable')]
+    sorted_keys = keys[order]
+    starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+    group_start = np.repeat(starts, np.diff(np.r_[starts, len(order)]))
+    rank[order] = np.arange(len(order)) - group_start
+    return rank
+
+
+def replay(picks, positions, league_config):
+    """
+    Fast-forward picks to the final draft state, vectorized.
+
+    Applies the same slotting as update_roster (starter, then FLEX if
+    eligible, then BENCH) to every pick at once.
+
+    Args:
+        picks: Structured array from read_log (or any prefix of it)
+        positions: Array mapping player index -> position code
+        league_config: League configuration dict
+
+    Returns:
+        Dict with 'position' and 'slot' per pick (slot codes STARTER, FLEX,
+        BENCH, REJECTED) and 'rosters' (seat -> roster counts)
+    """
+    seats = picks['seat'].astype(np.int64)
+    # Encode positions once per player, not once per pick
+    codes, player_codes = np.unique(np.asarray(positions).astype(str), return_inverse=True)
+    position_index = player_codes.ravel()[picks['player']]
+
+    starters = league_config['starters_per_pos']
+    max_allowed = league_config['max_per_position']
+    required = np.array([starters.get(pos, 0) for pos in codes])
+    maximum = np.array([max_allowed.get(pos, 99) for pos in codes])
+    eligible = np.isin(codes, league_config['flex_eligible'])[position_index]
+
+    # n-th pick of this position by this seat
+    nth = _group_rank(seats * len(codes) + position_index, np.ones(len(seats), dtype=bool))
+    starter = nth < np.minimum(required, maximum)[position_index]
+    # Starters never exceed the max, so it only blocks picks when max <= required
+    blocked = (maximum <= required)[position_index] & (nth >= maximum[position_index])
+
+    overflow = ~starter & ~blocked
+    flex = overflow & eligible
+    flex &= _group_rank(seats, flex) < league_config['flex_spots']
+    bench = overflow & ~flex
+    bench &= _group_rank(seats, bench) < league_config['bench_spots']
+
+    slot = np.full(len(seats), REJECTED, dtype=np.int8)
+    slot[starter] = STARTER
+    slot[flex] = FLEX
+    slot[bench] = BENCH
+
+    skeleton = build_roster_skeleton(league_config)
+    rosters = {seat: {pos: 0 for pos in skeleton} for seat in range(1, league_config['league_size'] + 1)}
+    for (seat, code), count in zip(*np.unique(np.c_[seats[starter], position_index[starter]], axis=0, return_counts=True)):
+        rosters[int(seat)][codes[code]] = int(count)
+    for column, mask in (('FLEX', flex), ('BENCH', bench)):
+        for seat, count in zip(*np.unique(seats[mask], return_counts=True)):
+            rosters[int(seat)][column] = int(count)
+
+    return {'position': codes[position_index], 'slot': slot, 'rosters': rosters}
+
+
+def resume_draft(path, recommender, league_config):
+    """
+    Rebuild an interrupted draft from its log.
+
+    Args:
+        path: Draft log file
+        recommender: DraftRecommender (its draft state is reset)
+        league_config: League configuration dict
+
+    Returns:
+        Dict with the log 'header', 'rosters' and 'picks_made'
+    """
+    header, picks = read_log(path)
+
+    recommender.reset_draft()
+    for player in picks['player'].tolist():
+        recommender.mark_player_drafted(player)
+
+    rankings = recommender.rankings
+    positions = rankings['position'].reindex(np.arange(rankings.index.max() + 1)).to_numpy()
+    state = replay(picks, positions, league_config)
+    return {'header': header, 'rosters': state['rosters'], 'picks_made': len(picks)}
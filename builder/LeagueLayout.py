@@ -0,0 +1,172 @@
+"""
+League config compiled to fixed position indices and capacity arrays.
+
+A roster is a small int array laid out like build_roster_skeleton:
+[counts per starting position..., FLEX, BENCH], positions in
+starters_per_pos order. Needs, at-max and full checks are then array
+comparisons, and a (seats, columns) array holds every roster of a draft
+(or of many simulated drafts) at once.
+"""
+import copy
+
+import numpy as np
+
+ROSTER_DTYPE = np.int16
+
+# league config snapshot -> LeagueLayout, see compile_league_config
+_compiled = {}
+
+
+class LeagueLayout:
+    """Compiled form of a league config; rosters are count arrays."""
+
+    def __init__(self, league_config):
+        """
+        Args:
+            league_config: League configuration dict
+        """
+        starters = league_config['starters_per_pos']
+        max_per_position = league_config.get('max_per_position', {})
+
+        self.positions = list(starters.keys())
+        self.columns = self.positions + ['FLEX', 'BENCH']
+        self.index = {pos: code for code, pos in enumerate(self.columns)}
+        self.flex_col = len(self.positions)
+        self.bench_col = len(self.positions) + 1
+
+        self.required = np.array([starters[pos] for pos in self.positions])
+        self.max_allowed = np.array([max_per_position.get(pos, 99) for pos in self.positions])
+        self.flex_eligible = np.array([pos in league_config['flex_eligible'] for pos in self.positions])
+        self.flex_spots = league_config['flex_spots']
+        self.bench_spots = league_config['bench_spots']
+        # Roster size per column (build_roster_skeleton as an array)
+        self.capacity = np.append(self.required, [self.flex_spots, self.bench_spots])
+
+    def empty(self, seats=None):
+        """Empty roster, or a (seats, columns) array of empty rosters."""
+        shape = len(self.columns) if seats is None else (seats, len(self.columns))
+        return np.zeros(shape, dtype=ROSTER_DTYPE)
+
+    def encode(self, roster):
+        """Roster dict (or array, returned as is) to a count array."""
+        if isinstance(roster, np.ndarray):
+            return roster
+        return np.array([roster.get(column, 0) for column in self.columns], dtype=ROSTER_DTYPE)
+
+    def decode(self, roster):
+        """Count array to a roster dict."""
+        return dict(zip(self.columns, np.asarray(roster).tolist()))
+
+    def stack(self, all_rosters):
+        """
+        Every seat's roster as one (seats, columns) array.
+
+        Args:
+            all_rosters: (seats, columns) array (returned as is), or dict of
+                seat: roster dict with seats numbered from 1
+        """
+        if isinstance(all_rosters, np.ndarray):
+            return all_rosters
+        return np.stack([self.encode(all_rosters[seat]) for seat in sorted(all_rosters)])
+
+    def key(self, roster):
+        """Hashable roster counts."""
+        return tuple(self.encode(roster).tolist())
+
+    def needs(self, rosters):
+        """
+        Remaining spots per position (get_position_needs for count arrays).
+
+        Args:
+            rosters: (..., columns) roster counts
+
+        Returns:
+            (..., positions) array of remaining spots needed
+        """
+        filled = rosters[..., :self.flex_col]
+        starters = np.maximum(self.required - filled, 0)
+        flex = (rosters[..., self.flex_col] < self.flex_spots)[..., None] & self.flex_eligible
+        bench = (rosters[..., self.bench_col] < self.bench_spots)[..., None]
+        return (filled < self.max_allowed) * (starters + flex + bench)
+
+    def needs_position(self, rosters):
+        """NeedsPosition(roster, position) from DraftRules for every position: (..., positions)."""
+        filled = rosters[..., :self.flex_col]
+        bench_open = (rosters[..., self.bench_col] < self.bench_spots)[..., None]
+        return (filled < self.required) | ((filled < self.max_allowed) & bench_open)
+
+    def at_max(self, rosters):
+        """AtMax(roster, position) from DraftRules for every position: (..., positions)."""
+        return rosters[..., :self.flex_col] >= self.max_allowed
+
+    def is_full(self, rosters):
+        """Every column filled to its roster size: (...) bool."""
+        return (rosters >= self.capacity).all(axis=-1)
+
+    def needs_dict(self, roster):
+        """Position needs of one roster as the dict get_position_needs returns."""
+        needs = self.needs(self.encode(roster)).tolist()
+        return {pos: need for pos, need in zip(self.positions, needs) if need}
+
+    def add_picks(self, rosters, codes):
+        """
+        Vectorized update_roster (starter, then FLEX, then BENCH), in place.
+
+        Args:
+            rosters: (n, columns) roster counts, one row per picking roster
+            codes: (n,) position codes, -1 for no pick
+
+        Returns:
+            (n,) bool array, False where the roster had no spot
+        """
+        rows = np.arange(len(rosters))
+        picked = codes >= 0
+        codes = np.where(picked, codes, 0)
+        filled = rosters[rows, codes]
+
+        room = picked & (filled < self.max_allowed[codes])
+        starter = room & (filled < self.required[codes])
+        flex = room & ~starter & self.flex_eligible[codes] & (rosters[:, self.flex_col] < self.flex_spots)
+        bench = room & ~starter & ~flex & (rosters[:, self.bench_col] < self.bench_spots)
+
+        rosters[rows[starter], codes[starter]] += 1
+        rosters[flex, self.flex_col] += 1
+        rosters[bench, self.bench_col] += 1
+        return starter | flex | bench
+
+    def add_pick(self, roster, position):
+        """
+        update_roster for one count array, in place.
+
+        Returns:
+            True if successful, False if no spot available
+        """
+        code = self.index.get(position)
+        if code is None or code >= self.flex_col:
+            return False
+        filled = roster[code]
+        if filled >= self.max_allowed[code]:
+            return False
+        if filled < self.required[code]:
+            roster[code] += 1
+        elif self.flex_eligible[code] and roster[self.flex_col] < self.flex_spots:
+            roster[self.flex_col] += 1
+        elif roster[self.bench_col] < self.bench_spots:
+            roster[self.bench_col] += 1
+        else:
+            return False
+        return True
+
+
+def compile_league_config(league_config):
+    """
+    LeagueLayout for a league config, compiled once per distinct config.
+
+    The cache compares against a snapshot, so a config edited in place is
+    recompiled rather than served stale.
+    """
+    entry = _compiled.get(id(league_config))
+    if entry is None or entry[0] != league_config:
+        entry = (copy.deepcopy(league_config), LeagueLayout(league_config))
+        _compiled[id(league_config)] = entry
+    return entry[1]
@@ -0,0 +1,331 @@
+"""
+Columnar log of picks from many drafts, with streaming ADP statistics.
+
+Where DraftLog records one draft for resuming it, a pick log collects the
+picks of any number of drafts (real or simulated) for analysis. Picks are
+buffered in fixed-size NumPy columns and written as chunks:
+
+    header  8s magic, u16 season, u8 league size, u16 names length,
+            then the position names (comma separated, LeagueLayout order)
+    chunk   u32 n, then n values of each column in COLUMNS order
+
+A pick is 12 bytes on disk and in memory. iter_chunks reads one chunk at a
+time, so PickStats aggregates millions of picks in memory proportional to
+a chunk plus its tables (players x overall picks), not to the log. A torn
+final chunk from a crash mid-write is ignored.
+"""
+import os
+import struct
+
+import numpy as np
+
+from builder.DraftLog import read_log
+
+MAGIC = b'FFBPCOL\x01'
+HEADER = struct.Struct('<8sHBH')
+CHUNK = struct.Struct('<I')
+COLUMNS = (
+    ('draft', np.dtype('<u4')),     # Draft id
+    ('pick', np.dtype('<u2')),      # Overall pick (1-based)
+    ('seat', np.dtype('u1')),       # Drafting seat (1-based)
+    ('player', np.dtype('<u4')),    # Player index in the rankings
+    ('position', np.dtype('u1')),   # Position code (index into the header's positions)
+)
+CHUNK_SIZE = 65536
+
+
+class PickLogWriter:
+    """Buffered writer for a pick log file."""
+
+    def __init__(self, path, file, header, next_draft=0, chunk_size=CHUNK_SIZE):
+        self.path = path
+        self.header = header
+        self.next_draft = next_draft
+        self._file = file
+        self._buffers = {name: np.empty(chunk_size, dtype=dtype) for name, dtype in COLUMNS}
+        self._size = 0
+
+    @classmethod
+    def create(cls, path, season, league_size, positions, chunk_size=CHUNK_SIZE):
+        """Start a new log (overwrites an existing file)."""
+        names = ",".join(positions).encode('ascii')
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        file = open(path, 'wb')
+        file.write(HEADER.pack(MAGIC, season, league_size, len(names)) + names)
+        file.flush()
+        header = {'season': season, 'league_size': league_size, 'positions': list(positions)}
+        return cls(path, file, header, chunk_size=chunk_size)
+
+    @classmethod
+    def append_to(cls, path, season=None, league_size=None, positions=None, chunk_size=CHUNK_SIZE):
+        """
+        Reopen an existing log to keep appending drafts (ids continue after the last one).
+
+        Args:
+            path: Pick log file
+            season, league_size, positions: Header the new picks are coded
+                against; each one given must match the log's
+
+        Raises:
+            ValueError: If the log's header does not match
+        """
+        header = read_header(path)
+        expected = {'season': season, 'league_size': league_size,
+                    'positions': list(positions) if positions is not None else None}
+        for key, value in expected.items():
+            if value is not None and header[key] != value:
+                raise ValueError(f"{path} was written for {key} {header[key]}, not {value}")
+        end, next_draft = header['data_start'], 0
+        for chunk in iter_chunks(path):
+            end = chunk['end']
+            if len(chunk['draft']):
+                next_draft = max(next_draft, int(chunk['draft'].max()) + 1)
+        file = open(path, 'r+b')
+        # Drop a torn final chunk so new chunks stay aligned
+        file.truncate(end)
+        file.seek(0, os.SEEK_END)
+        header = {key: header[key] for key in ('season', 'league_size', 'positions')}
+        return cls(path, file, header, next_draft, chunk_size)
+
+    def append(self, draft, pick, seat, player, position):
+        """Buffer one pick (written when the chunk fills, or on flush)."""
+        for name, value in zip(('draft', 'pick', 'seat', 'player', 'position'), (draft, pick, seat, player, position)):
+            self._buffers[name][self._size] = value
+        self._size += 1
+        if self._size == len(self._buffers['draft']):
+            self.flush()
+
+    def extend(self, draft, pick, seat, player, position):
+        """Buffer many picks given as equal-length arrays (or scalars to broadcast)."""
+        columns = np.broadcast_arrays(draft, pick, seat, player, position)
+        total, done = len(columns[0]), 0
+        capacity = len(self._buffers['draft'])
+        while done < total:
+            size = min(capacity - self._size, total - done)
+            for (name, _), values in zip(COLUMNS, columns):
+                self._buffers[name][self._size:self._size + size] = values[done:done + size]
+            self._size += size
+            done += size
+            if self._size == capacity:
+                self.flush()
+
+    def new_draft(self):
+        """Reserve the next draft id."""
+        self.next_draft += 1
+        return self.next_draft - 1
+
+    def flush(self):
+        """Write the buffered picks as one chunk."""
+        if self._size:
+            self._file.write(CHUNK.pack(self._size))
+            for name, _ in COLUMNS:
+                self._file.write(self._buffers[name][:self._size].tobytes())
+            self._size = 0
+        self._file.flush()
+
+    def close(self):
+        self.flush()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def record_draft(path, draft_log_path, rankings, layout):
+    """
+    Append a finished draft's picks (from its DraftLog) to a pick log.
+
+    Args:
+        path: Pick log file (created if missing)
+        draft_log_path: DraftLog file of the draft
+        rankings: Rankings DataFrame the logged player indices refer to
+        layout: LeagueLayout giving the position codes
+
+    Returns:
+        The draft's id in the pick log
+
+    Raises:
+        ValueError: If the pick log was written for another season, league
+            size or position layout
+    """
+    header, picks = read_log(draft_log_path)
+    index = {pos: code for code, pos in enumerate(layout.positions)}
+    players = picks['player'].astype(np.int64)
+    codes = [index[pos] for pos in rankings['position'].reindex(players).tolist()]
+
+    if os.path.exists(path):
+        writer = PickLogWriter.append_to(path, header['season'], header['league_size'], layout.positions)
+    else:
+        writer = PickLogWriter.create(path, header['season'], header['league_size'], layout.positions)
+    with writer:
+        draft = writer.new_draft()
+        writer.extend(draft, np.arange(1, len(picks) + 1), picks['seat'], players, codes)
+    return draft
+
+
+def read_header(path):
+    """
+    Read a pick log's header.
+
+    Returns:
+        Dict with 'season', 'league_size', 'positions' and 'data_start' (byte offset)
+
+    Raises:
+        ValueError: If the file is not a pick log
+    """
+    with open(path, 'rb') as f:
+        data = f.read(HEADER.size)
+        if len(data) < HEADER.size or data[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} is not a pick log")
+        _, season, league_size, names_length = HEADER.unpack(data)
+        names = f.read(names_length).decode('ascii')
+    return {
+        'season': season,
+        'league_size': league_size,
+        'positions': names.split(",") if names else [],
+        'data_start': HEADER.size + names_length,
+    }
+
+
+def iter_chunks(path):
+    """
+    Read a pick log one chunk at a time.
+
+    Yields:
+        Dict of column arrays (see COLUMNS), plus 'end': the chunk's end offset
+    """
+    row_size = sum(dtype.itemsize for _, dtype in COLUMNS)
+    with open(path, 'rb') as f:
+        f.seek(read_header(path)['data_start'])
+        while True:
+            data = f.read(CHUNK.size)
+            if len(data) < CHUNK.size:
+                return
+            (size,) = CHUNK.unpack(data)
+            body = f.read(size * row_size)
+            if len(body) < size * row_size:
+                return  # Torn final chunk
+            chunk, offset = {}, 0
+            for name, dtype in COLUMNS:
+                chunk[name] = np.frombuffer(body, dtype=dtype, count=size, offset=offset)
+                offset += size * dtype.itemsize
+            chunk['end'] = f.tell()
+            yield chunk
+
+
+def read_pick_log(path):
+    """Whole pick log as a header dict and a dict of concatenated column arrays."""
+    chunks = list(iter_chunks(path))
+    columns = {
+        name: np.concatenate([chunk[name] for chunk in chunks]) if chunks else np.empty(0, dtype=dtype)
+        for name, dtype in COLUMNS
+    }
+    return read_header(path), columns
+
+
+class PickStats:
+    """
+    Streaming draft statistics over pick log chunks.
+
+    Only fixed-size count tables are kept: picks per (player, overall pick)
+    and per (round, position). Tables grow when a larger player index or
+    pick appears, so their size is bounded by the player pool and draft
+    length no matter how many drafts are added.
+    """
+
+    def __init__(self, league_size, positions):
+        """
+        Args:
+            league_size: Teams per draft (picks per round)
+            positions: Position names, indexed by the log's position codes
+        """
+        self.league_size = league_size
+        self.positions = list(positions)
+        self.drafts = 0
+        self.picks = 0
+        self.pick_counts = np.zeros((0, 0), dtype=np.int64)
+        self.round_counts = np.zeros((0, len(self.positions)), dtype=np.int64)
+
+    @classmethod
+    def from_log(cls, path):
+        """Aggregate a whole pick log, one chunk at a time."""
+        header = read_header(path)
+        stats = cls(header['league_size'], header['positions'])
+        for chunk in iter_chunks(path):
+            stats.update(chunk)
+        return stats
+
+    def update(self, chunk):
+        """Add a chunk of picks (dict with 'pick', 'player' and 'position' arrays)."""
+        picks = np.asarray(chunk['pick'], dtype=np.int64)
+        players = np.asarray(chunk['player'], dtype=np.int64)
+        codes = np.asarray(chunk['position'], dtype=np.int64)
+        if len(picks) == 0:
+            return
+        rounds = (picks - 1) // self.league_size
+
+        self.pick_counts = _grow(self.pick_counts, (int(players.max()) + 1, int(picks.max())))
+        self.round_counts = _grow(self.round_counts, (int(rounds.max()) + 1, len(self.positions)))
+        shape = self.pick_counts.shape
+        self.pick_counts += np.bincount(players * shape[1] + picks - 1, minlength=shape[0] * shape[1]).reshape(shape)
+        shape = self.round_counts.shape
+        self.round_counts += np.bincount(rounds * shape[1] + codes, minlength=shape[0] * shape[1]).reshape(shape)
+
+        # Every draft has exactly one first overall pick
+        self.drafts += int((picks == 1).sum())
+        self.picks += len(picks)
+
+    def merge(self, other):
+        """Add another PickStats over the same league (e.g. from another process)."""
+        self.pick_counts = _grow(self.pick_counts, other.pick_counts.shape)
+        self.round_counts = _grow(self.round_counts, other.round_counts.shape)
+        rows, cols = other.pick_counts.shape
+        self.pick_counts[:rows, :cols] += other.pick_counts
+        self.round_counts[:len(other.round_counts)] += other.round_counts
+        self.drafts += other.drafts
+        self.picks += other.picks
+        return self
+
+    def adp(self, min_drafted=1):
+        """
+        Average draft position of every player drafted at least min_drafted times.
+
+        Returns:
+            Dict of arrays sorted by ADP: 'player', 'adp', 'min_pick',
+            'max_pick' and 'drafted_rate' (share of drafts the player went in)
+        """
+        counts = self.pick_counts
+        drafted = counts.sum(axis=1)
+        players = np.flatnonzero(drafted >= max(min_drafted, 1))
+        counts, drafted = counts[players], drafted[players]
+        pick_numbers = np.arange(1, counts.shape[1] + 1)
+        adp = counts @ pick_numbers / drafted
+        seen = counts > 0
+        order = np.lexsort((players, adp))
+        return {
+            'player': players[order],
+            'adp': adp[order],
+            'min_pick': seen.argmax(axis=1)[order] + 1,
+            'max_pick': counts.shape[1] - seen[:, ::-1].argmax(axis=1)[order],
+            'drafted_rate': drafted[order] / max(self.drafts, 1),
+        }
+
+    def pick_histogram(self, player):
+        """Times a player went at each overall pick (index 0 is pick 1)."""
+        if player >= len(self.pick_counts):
+            return np.zeros(self.pick_counts.shape[1], dtype=np.int64)
+        return self.pick_counts[player].copy()
+
+    def round_position_frequencies(self):
+        """(rounds, positions) share of each round's picks that went to each position."""
+        totals = self.round_counts.sum(axis=1, keepdims=True)
+        return self.round_counts / np.maximum(totals, 1)
+
+
+def _grow(table, shape):
+    """Zero-pad a count table to at least `shape`."""
+    pad = [(0, max(want - have, 0)) for have, want in zip(table.shape, shape)]
+    return np.pad(table, pad) if any(after for _, after in pad) else table
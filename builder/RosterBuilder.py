@@ -11,4 +11,31 @@ def build_roster_skeleton(league_config):
     roster["FLEX"] = league_config["flex_spots"]
     roster["BENCH"] = league_config["bench_spots"]
 
-    return roster
\ No newline at end of file
+    return roster
+
+
+def update_roster(roster, position, league_config):
+    """
+    Update roster with drafted player.
+    Returns True if successful, False if no spot available.
+    """
+
+    max_allowed = league_config['max_per_position'].get(position, 99)
+    current_at_position = roster.get(position, 0)
+
+    if current_at_position >= max_allowed:
+        return False  # reached max number of players for this position
+
+    starter_needed = league_config['starters_per_pos'].get(position, 0)
+    if roster[position] < starter_needed:
+        roster[position] += 1
+        return True
+    elif (position in league_config['flex_eligible'] and
+          roster['FLEX'] < league_config['flex_spots']):
+        roster['FLEX'] += 1
+        return True
+    elif roster['BENCH'] < league_config['bench_spots']:
+        roster['BENCH'] += 1
+        return True
+
+    return False
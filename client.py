@@ -0,0 +1,189 @@
+"""
+Thin command-line client for the warm draft daemon (service/DraftDaemon.py).
+
+Only uses the standard library, so each invocation starts in tens of
+milliseconds; the daemon is started in the background on first use and
+keeps the rankings loaded for every command after that.
+
+Usage:
+    py client.py scarcity
+    py client.py tiers RB
+    py client.py new --seat 3
+    py client.py recommend <draft_id> [--seat N] [--top 10]
+    py client.py pick <draft_id> <seat> <POS or player index>
+    py client.py state <draft_id>
+    py client.py stop
+"""
+import argparse
+import json
+import os
+import socket
+import sys
+import time
+
+from config.DaemonConfig import daemon_socket_path
+
+# Seconds to wait for a freshly started daemon to load the data
+DAEMON_START_TIMEOUT = 60.0
+
+
+class DaemonClient:
+    """Sends JSON requests to the daemon over its Unix socket."""
+
+    def __init__(self, socket_path=daemon_socket_path, autostart=True):
+        self.socket_path = socket_path
+        self._sock = self._connect(autostart)
+        self._file = self._sock.makefile('rb')
+
+    def _connect(self, autostart):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(self.socket_path)
+            return sock
+        except (FileNotFoundError, ConnectionRefusedError):
+            sock.close()
+            if not autostart:
+                raise
+
+        # Start the daemon in the background and wait for it to listen
+        # (subprocess is only imported here to keep the warm path fast)
+        import subprocess
+        print("Starting draft daemon (first run loads the data)...", file=sys.stderr)
+        subprocess.Popen(
+            [sys.executable, '-m', 'service.DraftDaemon', '--socket', self.socket_path],
+            cwd=os.path.dirname(os.path.abspath(__file__)), start_new_session=True,
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        deadline = time.monotonic() + DAEMON_START_TIMEOUT
+        while True:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                sock.connect(self.socket_path)
+                return sock
+            except (FileNotFoundError, ConnectionRefusedError):
+                sock.close()
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(f"Draft daemon did not start on {self.socket_path}")
+                time.sleep(0.05)
+
+    def request(self, method, path, body=None):
+        """
+        Send one request.
+
+        Returns:
+            Tuple of (status, response body)
+        """
+        message = {'method': method, 'path': path}
+        if body is not None:
+            message['body'] = body
+        self._sock.sendall(json.dumps(message).encode() + b'\n')
+        response = json.loads(self._file.readline())
+        return response['status'], response['body']
+
+    def close(self):
+        self._file.close()
+        self._sock.close()
+
+
+def print_scarcity(rows):
+    print(f"\n  {'POS':5s} {'Players':>8s} {'Top10 PPG':>10s} {'Median':>8s} {'Drop-off':>9s} {'Scarcity':>9s}")
+    for row in rows:
+        print(f"  {row['position']:5s} {row['total_players']:8d} {row['top_10_avg_ppg']:10.2f} "
+              f"{row['median_ppg']:8.2f} {row['drop_off']:9.2f} {row['scarcity_score']:9.2f}")
+
+
+def print_tiers(position, tiers):
+    print(f"\n  {position} TIER BREAKDOWN")
+    for tier_name, stats in tiers.items():
+        print(f"\n  {tier_name}:")
+        print(f"    Players:  {stats['count']}")
+        print(f"    Avg PPG:  {stats['avg_ppg']:.2f}")
+        print(f"    Range:    {stats['min_ppg']:.2f} - {stats['max_ppg']:.2f}")
+
+
+def print_recommendations(recs):
+    for i, rec in enumerate(recs, 1):
+        print(f"  {i:2d}. {rec['position']:5s} #{rec['player']:<5d} {rec['points_per_game']:.1f} PPG "
+              f"(Rank #{int(rec['position_rank'])}, Value: {rec['value_score']:.1f}, VORP: {rec['vorp']:+.1f})")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Draft assistant client (talks to the warm daemon)")
+    parser.add_argument('--socket', default=daemon_socket_path)
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    commands.add_parser('scarcity', help="Position scarcity ranking")
+    tiers = commands.add_parser('tiers', help="Tier breakdown for a position")
+    tiers.add_argument('position')
+    new = commands.add_parser('new', help="Start a draft")
+    new.add_argument('--seat', type=int, default=1, help="Your draft position")
+    recommend = commands.add_parser('recommend', help="Recommendations for a seat")
+    recommend.add_argument('draft_id')
+    recommend.add_argument('--seat', type=int, help="Defaults to your seat")
+    recommend.add_argument('--top', type=int, default=10)
+    pick = commands.add_parser('pick', help="Record a pick")
+    pick.add_argument('draft_id')
+    pick.add_argument('seat', type=int)
+    pick.add_argument('choice', help="Position (drafts the best available) or player index")
+    state = commands.add_parser('state', help="Draft state")
+    state.add_argument('draft_id')
+    commands.add_parser('stop', help="Stop the daemon")
+    args = parser.parse_args(argv)
+
+    try:
+        client = DaemonClient(args.socket, autostart=args.command != 'stop')
+    except (FileNotFoundError, ConnectionRefusedError):
+        print("Draft daemon is not running.")
+        return 0
+
+    try:
+        if args.command == 'scarcity':
+            status, body = client.request('GET', '/analysis/scarcity')
+        elif args.command == 'tiers':
+            status, body = client.request('GET', f"/analysis/tiers/{args.position.upper()}")
+        elif args.command == 'new':
+            status, body = client.request('POST', '/drafts', {'user_seat': args.seat})
+        elif args.command == 'recommend':
+            seat = f"seat={args.seat}&" if args.seat else ""
+            status, body = client.request('GET', f"/drafts/{args.draft_id}/recommendations?{seat}top_n={args.top}")
+        elif args.command == 'pick':
+            event = {'seat': args.seat}
+            if args.choice.isdigit():
+                event['player'] = int(args.choice)
+            else:
+                event['position'] = args.choice.upper()
+            status, body = client.request('POST', f"/drafts/{args.draft_id}/picks", event)
+        elif args.command == 'state':
+            status, body = client.request('GET', f"/drafts/{args.draft_id}")
+        else:
+            status, body = client.request('POST', '/shutdown')
+    finally:
+        client.close()
+
+    if status >= 400:
+        print(f"Error: {body['error']}")
+        return 1
+
+    if args.command == 'scarcity':
+        print_scarcity(body)
+    elif args.command == 'tiers':
+        print_tiers(args.position.upper(), body)
+    elif args.command == 'new':
+        print(f"Draft {body['draft_id']} started: you are seat {body['user_seat']} of {body['league_size']}")
+    elif args.command == 'recommend':
+        print_recommendations(body)
+    elif args.command == 'pick':
+        print(f"Pick #{body['overall_pick']}: Drafter {body['seat']} → {body['position']} "
+              f"(#{body['player']}, {body['points_per_game']:.1f} PPG)")
+    elif args.command == 'state':
+        print(f"Draft {body['draft_id']}: {body['picks_made']} picks made, "
+              f"Drafter {body['on_the_clock']} on the clock")
+        for pos, count in body['rosters'][str(body['user_seat'])].items():
+            print(f"  {pos:6s}: {count}")
+    else:
+        print("Draft daemon stopped.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,6 @@
+import os
+
+# Unix socket the warm draft daemon listens on (service/DraftDaemon.py, client.py)
+daemon_socket_path = os.environ.get(
+    'FFBDRAFT_SOCKET', os.path.join(os.environ.get('TMPDIR', '/tmp'), f"ffbdraft-{os.getuid()}.sock")
+)
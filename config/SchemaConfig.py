@@ -0,0 +1,14 @@
+from utility.AbbrToTeamNameMap import ABBR_TO_TEAM_NAME
+
+# Fixed categories of the player data's string columns (utility/Schema.py).
+# Sorted, so groupby/sort order on the categorical codes matches the
+# alphabetical order of the old string columns
+categorical_columns = {
+    "position": ["D/ST", "IDP", "K", "QB", "RB", "TE", "WR"],
+    "player_type": ["defensive", "kicker", "offensive", "team_defense"],
+    # Current abbreviations plus the relocated teams still in older seasons
+    "team": sorted(set(ABBR_TO_TEAM_NAME) | {"OAK", "SD", "STL"}),
+}
+
+# Open-ended identifiers: stored as categoricals with the categories found in the data
+interned_columns = ["player_name"]
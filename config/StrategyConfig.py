@@ -0,0 +1,22 @@
+# Weights of DraftRecommender.calculate_player_value (tuned with simulation/StrategySweep.py)
+default_strategy_config = {
+    # Share of PPG above the position average added to a player's value
+    "position_diff_weight": 0.5,
+    # Value multiplier per open roster spot at the position
+    "need_boost": 0.2,
+    # Value multiplier when the roster has no spot open at the position
+    "off_need_factor": 0.5,
+    # Value multiplier for elite players (top 20% at their position)
+    "elite_bonus": 1.3,
+    # Scarcity multipliers: the first (threshold, multiplier) the position's
+    # scarcity score is above, else the low multiplier below the low threshold
+    "scarcity_tiers": [(1.8, 1.25), (1.2, 1.15), (0.8, 1.05)],
+    "low_scarcity_threshold": 0.5,
+    "low_scarcity_multiplier": 0.95,
+    # Scarcity score the multipliers use: "season" (the draft season alone),
+    # or a blend of it with earlier seasons: "rolling" (mean of the last
+    # trend_window seasons) or "ewm" (half-life of trend_halflife seasons)
+    "scarcity_baseline": "season",
+    "trend_window": 3,
+    "trend_halflife": 1.0,
+}
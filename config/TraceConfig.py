@@ -0,0 +1,20 @@
+import os
+
+# Timing spans (utility/Trace.py) are recorded when a path is set: a .json
+# path gets Chrome trace format (chrome://tracing, Perfetto), anything else
+# JSON lines
+trace_path = os.environ.get('FFBDRAFT_TRACE')
+
+# cProfile stats of the traced run are written here when set (pstats format)
+profile_path = os.environ.get('FFBDRAFT_PROFILE')
+
+# Memory accounting per span: 'tracemalloc' (peak Python/numpy allocations,
+# portable) or 'rss' (sampled resident set size, Linux); off when unset
+memory_mode = os.environ.get('FFBDRAFT_MEMORY')
+
+# A span whose peak exceeds its budget (MB) fails the run with
+# MemoryBudgetExceeded; stage budgets override the overall one
+memory_budget_mb = float(os.environ['FFBDRAFT_MEMORY_BUDGET_MB']) if os.environ.get('FFBDRAFT_MEMORY_BUDGET_MB') else None
+stage_memory_budgets_mb = {
+    # 'step3.score': 512,
+}
@@ -0,0 +1,217 @@
+"""
+Live draft session: follows picks made by the other teams in a real draft.
+
+Picks arrive as events (see live.PickEvents) and are applied one at a time
+through mark_player_drafted and update_roster. Only the structures a pick
+touches are updated:
+- availability: a best-available pointer per position
+- scarcity: recomputed lazily, and only for positions that lost a player
+- recommendations: the user's ranked pool is kept until the user's roster
+  changes or too few ranked players are left, so bursts of picks at the turn
+  cost no recomputation.
+"""
+import pandas as pd
+
+from builder.RosterBuilder import build_roster_skeleton, update_roster
+from live.PickEvents import parse_event
+from simulation.DraftOrder import snake_order
+
+
+class LiveDraftSession:
+    """Incrementally maintained state of a live snake draft."""
+
+    def __init__(self, recommender, league_config, user_seat, season=2024):
+        """
+        Args:
+            recommender: DraftRecommender (its draft state is reset)
+            league_config: League configuration dict
+            user_seat: The user's draft position (1-based)
+            season: Season the draft pool is taken from
+        """
+        self.recommender = recommender
+        self.league_config = league_config
+        self.user_seat = user_seat
+        self.season = season
+        recommender.reset_draft()
+
+        skeleton = build_roster_skeleton(league_config)
+        self.num_teams = league_config['league_size']
+        self.order = snake_order(self.num_teams, sum(skeleton.values()))
+        self.rosters = {seat: {pos: 0 for pos in skeleton} for seat in range(1, self.num_teams + 1)}
+        self.picks = []
+
+        # Availability: each position's pool sorted by PPG plus a best-available pointer
+        rankings = recommender.rankings
+        season_data = rankings[rankings['season'] == season]
+        self._position_of = season_data['position'].to_dict()
+        self._ppg = season_data['points_per_game'].to_dict()
+        self._pools = {}
+        for pos, pos_data in season_data.groupby('position', observed=True):
+            self._pools[pos] = pos_data.sort_values('points_per_game', ascending=False, kind='stable').index.tolist()
+        self._pointer = {pos: 0 for pos in self._pools}
+        self.remaining = {pos: len(pool) for pos, pool in self._pools.items()}
+
+        # Scarcity of the remaining pool, refreshed only for dirty positions
+        self._scarcity = {}
+        self._dirty = set(self._pools)
+
+        # User's ranked pool (see DraftRecommender.rank_available)
+        self._ranked = None
+        self._ranked_depth = 0
+
+        self.tracker = recommender.get_replacement_tracker(league_config, season)
+
+    def current_seat(self):
+        """Seat on the clock, or None once the draft is complete."""
+        if len(self.picks) >= len(self.order):
+            return None
+        return self.order[len(self.picks)][2]
+
+    def is_complete(self):
+        """True once every pick has been made or the user's roster is full."""
+        if self.current_seat() is None:
+            return True
+        return not self.recommender.get_position_needs(self.rosters[self.user_seat], self.league_config)
+
+    def best_available(self, position):
+        """Index of the best available player at a position (None if none are left)."""
+        pool = self._pools.get(position, [])
+        pointer = self._pointer.get(position, 0)
+        drafted = self.recommender.drafted_players
+        while pointer < len(pool) and pool[pointer] in drafted:
+            pointer += 1
+        if position in self._pointer:
+            self._pointer[position] = pointer
+        return pool[pointer] if pointer < len(pool) else None
+
+    def apply_event(self, event):
+        """
+        Apply one pick.
+
+        Args:
+            event: Dict with 'seat' and 'position' or 'player', and optionally
+                'overall_pick' (see parse_event)
+
+        Returns:
+            Dict describing the pick
+
+        Raises:
+            ValueError: If the seat, position or player is not valid, or the
+                seat is not on the clock
+        """
+        seat = event['seat']
+        if seat not in self.rosters:
+            raise ValueError(f"Unknown seat {seat}")
+        expected = self.current_seat()
+        if expected is None:
+            raise ValueError("The draft is complete")
+        # A duplicated or out-of-order feed line would shift the snake order for
+        # every later pick; a pick made off the clock (e.g. a traded pick) must
+        # name the overall pick it fills
+        overall_pick = event.get('overall_pick')
+        if overall_pick is not None:
+            if overall_pick != len(self.picks) + 1:
+                raise ValueError(f"Pick #{overall_pick} is not the current pick (#{len(self.picks) + 1})")
+        elif seat != expected:
+            raise ValueError(f"Drafter {seat} is not on the clock (Drafter {expected} is)")
+
+        if 'player' in event:
+            player = event['player']
+            if player not in self._position_of:
+                raise ValueError(f"Unknown player index {player}")
+            if player in self.recommender.drafted_players:
+                raise ValueError(f"Player {player} was already drafted")
+            position = self._position_of[player]
+        else:
+            position = event['position']
+            player = self.best_available(position)
+            if player is None:
+                raise ValueError(f"No available players at {position}")
+
+        # Other teams' picks happened in the real draft, so the player is
+        # gone even if our roster limits would not have allowed it
+        rostered = update_roster(self.rosters[seat], position, self.league_config)
+        if not rostered and seat == self.user_seat:
+            raise ValueError(f"That position {position} is full!")
+
+        self.recommender.mark_player_drafted(player)
+        self.remaining[position] -= 1
+        self._dirty.add(position)
+        if seat == self.user_seat:
+            self._ranked = None  # Roster needs changed
+
+        pick = {
+            'overall_pick': len(self.picks) + 1,
+            'seat': seat,
+            'expected_seat': expected,
+            'position': position,
+            'player': player,
+            'points_per_game': self._ppg[player],
+            'rostered': rostered,
+        }
+        self.picks.append(pick)
+        return pick
+
+    def ingest(self, lines):
+        """
+        Apply a burst of raw event lines.
+
+        Returns:
+            List of pick dicts, or error strings for rejected events
+        """
+        results = []
+        for line in lines:
+            try:
+                results.append(self.apply_event(parse_event(line)))
+            except ValueError as e:
+                results.append(f"Rejected event {line.strip()!r}: {e}")
+        return results
+
+    def get_recommendations(self, top_n=10):
+        """Recommendations for the user, reusing the ranked pool when still valid."""
+        roster = self.rosters[self.user_seat]
+        recommender = self.recommender
+
+        if self._ranked is not None:
+            remaining = self._ranked[~self._ranked.index.isin(recommender.drafted_players)]
+            if len(remaining) < top_n * 2 and len(self._ranked) >= self._ranked_depth:
+                self._ranked = None
+
+        if self._ranked is None:
+            position_needs = recommender.get_position_needs(roster, self.league_config)
+            if not position_needs:
+                return pd.DataFrame()
+            # Rank two extra rounds deep so other teams' picks rarely force a re-rank
+            self._ranked_depth = top_n * 2 + self.num_teams * 2
+            self._ranked = recommender.rank_available(position_needs, self.season, self._ranked_depth)
+            remaining = self._ranked
+
+        if remaining.empty:
+            return pd.DataFrame()
+
+        return recommender.finalize_recommendations(roster, remaining.head(top_n * 2), self.league_config, self.season)
+
+    def get_live_scarcity(self):
+        """
+        Scarcity of the players still available (same metrics as
+        get_position_scarcity), refreshing only positions that lost players.
+        """
+        drafted = self.recommender.drafted_players
+        for pos in self._dirty:
+            ppg = pd.Series([self._ppg[i] for i in self._pools[pos] if i not in drafted], dtype=float)
+            if ppg.empty:
+                self._scarcity.pop(pos, None)
+                continue
+            top_10_ppg = ppg.nlargest(max(1, len(ppg) // 10)).mean()
+            median_ppg = ppg.median()
+            self._scarcity[pos] = {
+                'position': pos,
+                'total_players': len(ppg),
+                'top_10_avg_ppg': round(top_10_ppg, 2),
+                'median_ppg': round(median_ppg, 2),
+                'drop_off': round(top_10_ppg - median_ppg, 2),
+                'scarcity_score': round((top_10_ppg - median_ppg) / median_ppg, 2)
+            }
+        self._dirty = set()
+
+        return pd.DataFrame(list(self._scarcity.values())).sort_values('scarcity_score', ascending=False)
@@ -0,0 +1,235 @@
+"""
+Sources of live pick events from other teams.
+
+Each source yields newline-delimited events. An event is either a JSON
+object or plain "<seat> <position>" text:
+
+    {"seat": 4, "position": "RB"}
+    {"seat": 4, "player": 937}
+    {"seat": 4, "player": 937, "overall_pick": 17}
+    4 RB
+
+Three local transports are supported: tailing a file, reading a named pipe
+(FIFO) and accepting connections on a Unix or localhost TCP socket.
+"""
+import json
+import os
+import select
+import selectors
+import socket
+import time
+
+
+def parse_event(line):
+    """
+    Parse one event line.
+
+    Args:
+        line: Raw event text
+
+    Returns:
+        Dict with 'seat' and either 'position' or 'player', plus
+        'overall_pick' if the event names the pick it fills
+
+    Raises:
+        ValueError: If the line is not a valid event
+    """
+    line = line.strip()
+    if line.startswith('{'):
+        event = json.loads(line)
+    else:
+        parts = line.split()
+        if len(parts) != 2:
+            raise ValueError(f"Expected '<seat> <position>', got: {line!r}")
+        event = {'seat': parts[0], 'position': parts[1]}
+
+    if not isinstance(event, dict) or 'seat' not in event or ('position' not in event and 'player' not in event):
+        raise ValueError(f"Event needs a seat and a position or player: {line!r}")
+
+    try:
+        parsed = {'seat': int(event['seat'])}
+        if 'player' in event:
+            parsed['player'] = int(event['player'])
+        elif event['position'] is None:
+            raise ValueError(f"Event position is null: {line!r}")
+        else:
+            parsed['position'] = str(event['position']).upper()
+        if event.get('overall_pick') is not None:
+            parsed['overall_pick'] = int(event['overall_pick'])
+    except TypeError:
+        # JSON null (or a list/object) where a number is expected
+        raise ValueError(f"Event fields must be numbers: {line!r}") from None
+    return parsed
+
+
+class LineSource:
+    """Base class: splits incoming bytes into complete lines."""
+
+    def __init__(self):
+        self._pending = b''
+
+    def poll(self, timeout=0.0):
+        """
+        Return all complete lines available, waiting up to `timeout`
+        seconds for the first one.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            lines = self._split(self._read())
+            if lines or time.monotonic() >= deadline:
+                return lines
+            self._wait(max(deadline - time.monotonic(), 0))
+
+    def close(self):
+        """Release the underlying file or socket."""
+
+    def _split(self, data):
+        self._pending += data
+        *lines, self._pending = self._pending.split(b'\n')
+        return [line.decode() for line in lines if line.strip()]
+
+    def _read(self):
+        raise NotImplementedError
+
+    def _wait(self, timeout):
+        time.sleep(min(timeout, 0.05))
+
+
+class FileTailSource(LineSource):
+    """Follows a file as picks are appended (existing lines are read first)."""
+
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+        open(path, 'ab').close()  # Create if missing
+        self._file = open(path, 'rb')
+
+    def _read(self):
+        return self._file.read()
+
+    def close(self):
+        self._file.close()
+
+
+class NamedPipeSource(LineSource):
+    """Reads a FIFO; writers may come and go."""
+
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+        if not os.path.exists(path):
+            os.mkfifo(path)
+        self._fd = self._open()
+        self._writer_closed = False
+
+    def _open(self):
+        return os.open(self.path, os.O_RDONLY | os.O_NONBLOCK)
+
+    def _read(self):
+        try:
+            data = os.read(self._fd, 65536)
+        except BlockingIOError:
+            return b''
+        self._writer_closed = data == b''
+        if self._writer_closed:
+            # No writer (or the last one closed); reopen to wait for the next one
+            os.close(self._fd)
+            self._fd = self._open()
+        return data
+
+    def _wait(self, timeout):
+        if self._writer_closed:
+            # A writerless FIFO always selects as readable (EOF), so just sleep
+            super()._wait(timeout)
+        else:
+            select.select([self._fd], [], [], min(timeout, 0.05))
+
+    def close(self):
+        os.close(self._fd)
+
+
+class SocketSource(LineSource):
+    """Accepts local connections that stream event lines."""
+
+    def __init__(self, address):
+        """
+        Args:
+            address: Unix socket path, or (host, port) for localhost TCP
+        """
+        super().__init__()
+        self.address = address
+        if isinstance(address, tuple):
+            self._server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self._server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        else:
+            if os.path.exists(address):
+                os.unlink(address)
+            self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._server.bind(address)
+        self._server.listen()
+        self._server.setblocking(False)
+
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._server, selectors.EVENT_READ)
+        self._buffers = {}
+
+    def poll(self, timeout=0.0):
+        deadline = time.monotonic() + timeout
+        while True:
+            lines = []
+            for key, _ in self._selector.select(timeout=0):
+                lines.extend(self._handle(key.fileobj))
+            if lines or time.monotonic() >= deadline:
+                return lines
+            self._selector.select(timeout=min(max(deadline - time.monotonic(), 0), 0.05))
+
+    def _handle(self, sock):
+        """Accept a new client or read lines from an existing one."""
+        if sock is self._server:
+            client, _ = self._server.accept()
+            client.setblocking(False)
+            self._selector.register(client, selectors.EVENT_READ)
+            self._buffers[client] = b''
+            return []
+
+        data = sock.recv(65536)
+        buffered = self._buffers[sock] + data
+        if data:
+            *lines, self._buffers[sock] = buffered.split(b'\n')
+        else:
+            # Client closed; flush any unterminated last line
+            self._selector.unregister(sock)
+            sock.close()
+            del self._buffers[sock]
+            lines = buffered.split(b'\n')
+        return [line.decode() for line in lines if line.strip()]
+
+    def close(self):
+        for sock in list(self._buffers):
+            sock.close()
+        self._selector.close()
+        self._server.close()
+        if not isinstance(self.address, tuple) and os.path.exists(self.address):
+            os.unlink(self.address)
+
+
+def open_source(spec):
+    """
+    Open an event source from a command-line style spec.
+
+    Args:
+        spec: 'file:<path>', 'pipe:<path>', 'unix:<path>' or 'tcp:<port>'
+
+    Returns:
+        LineSource
+    """
+    kind, _, target = spec.partition(':')
+    if kind == 'file':
+        return FileTailSource(target)
+    if kind == 'pipe':
+        return NamedPipeSource(target)
+    if kind == 'unix':
+        return SocketSource(target)
+    if kind == 'tcp':
+        return SocketSource(('127.0.0.1', int(target)))
+    raise ValueError(f"Unknown event source: {spec!r} (use file:, pipe:, unix: or tcp:)")
@@ -1,8 +1,24 @@
+import os
 import random
+import time
+from pathlib import Path
 
-from builder.RosterBuilder import build_roster_skeleton
 from config.LeagueConfig import league_teams_default_config
-from recommender.DraftRecommender import DraftRecommender
+from live.PickEvents import open_source
+from recommender import DataLoader
+from simulation.DraftOrder import picks_until_next_turn, snake_order
+from utility import Trace
+
+# pandas/numpy-backed modules are imported inside the menu options that use
+# them, so the menu appears before they load (see benchmarks/StartupBenchmark.py)
+
+# Seconds of analysis (survival estimates + lookahead search) allowed per user pick
+PICK_CLOCK_SECONDS = 1.0
+
+# Picks of the draft in progress (see builder/DraftLog.py); finished drafts are renamed
+DRAFT_LOG_PATH = "data/drafts/in_progress.draftlog"
+# Picks of every finished draft, for ADP (see builder/PickLog.py)
+PICK_HISTORY_PATH = "data/drafts/history.picklog"
 
 def view_position_analysis():
     """Show tier breakdowns and scarcity analysis for each position."""
@@ -11,6 +27,8 @@ def view_position_analysis():
     print("=" * 60)
 
     try:
+        from recommender.DraftRecommender import DraftRecommender
+
         # Initialize the recommender to access player data
         recommender = DraftRecommender()
 
@@ -23,6 +41,13 @@ def view_position_analysis():
         scarcity = recommender.get_position_scarcity()
         print(scarcity.to_string(index=False))
 
+        # Scarcity score by season, with the exponentially weighted blend of all seasons
+        trends = recommender.get_scarcity_trends()
+        table = trends.pivot(index='position', columns='season', values='scarcity_score')
+        table['blend'] = trends.groupby('position', observed=True)['scarcity_score_ewm'].last()
+        print("\n  Scarcity score by season (blend weights recent seasons most):\n")
+        print(table.sort_values('blend', ascending=False).round(2).to_string())
+
         input("\nPress Enter to see detailed tier breakdowns...")
 
         # List of positions to analyze
@@ -68,41 +93,85 @@ def run_draft():
     print("=" * 60)
 
     try:
+        from builder.DraftLog import DraftLog, resume_draft
+        from builder.LeagueLayout import compile_league_config
+        from builder.PickLog import record_draft
+        from recommender.DraftRecommender import DraftRecommender
+        from recommender.SpeculativeRecommender import SpeculativeRecommender
+        from simulation.LookaheadSearch import LookaheadSearch
+        from simulation.PickSurvival import PickSurvivalEngine
+
+        # Comparables (?POS) may be needed too; load them alongside the rankings
+        DataLoader.prefetch(comparables_path=DataLoader.COMPARABLES_PATH)
+
         recommender = DraftRecommender()
         recommender.reset_draft()
+        survival_engine = PickSurvivalEngine(recommender, league_teams_default_config)
+        lookahead = LookaheadSearch(recommender, league_teams_default_config)
+        speculator = SpeculativeRecommender(recommender)
+        num_teams = league_teams_default_config['league_size']
+        # Rosters are count arrays, one row per seat (seat 1 is row 0)
+        layout = compile_league_config(league_teams_default_config)
+        draft_log = None
+        picks_made = 0
+
+        # Offer to pick up a draft that was interrupted (rebuilt from its pick log)
+        if os.path.exists(DRAFT_LOG_PATH):
+            answer = input("\nAn unfinished draft was found. Resume it? (y/n): ").strip().lower()
+            if answer.startswith("y"):
+                state = resume_draft(DRAFT_LOG_PATH, recommender, league_teams_default_config)
+                if state['header']['league_size'] == num_teams:
+                    user_position = state['header']['user_seat']
+                    seed = state['header']['seed']
+                    all_rosters = layout.stack(state['rosters'])
+                    picks_made = state['picks_made']
+                    draft_log = DraftLog.append_to(DRAFT_LOG_PATH)
+                    print(f"\nResuming at pick #{picks_made + 1} - you are drafting from position #{user_position}")
+                else:
+                    print("That draft was for a different league size - starting a new draft.")
+                    recommender.reset_draft()
+
+        if draft_log is None:
+            # Get user's draft position
+            print("Draft Type: Snake Draft\nIn a Snake Draft, the order reverses each round.")
+            print("Ex: Round 1 goes 1→10, Round 2 goes 10→1")
+
+            while True:
+                try:
+                    user_position = int(
+                        input(f"\nEnter your draft position (1-{league_teams_default_config['league_size']}): ").strip())
+                    if 1 <= user_position <= league_teams_default_config['league_size']:
+                        break
+                    print(f"Error: Please enter a number between 1 and {league_teams_default_config['league_size']}")
+                except ValueError:
+                    print("Error: Please enter a valid number")
 
-        # Get user's draft position
-        print("Draft Type: Snake Draft\nIn a Snake Draft, the order reverses each round.")
-        print("Ex: Round 1 goes 1→10, Round 2 goes 10→1")
+            print(f"\nYou are drafting from position #{user_position}")
+            print(f"  League size: {league_teams_default_config['league_size']} teams")
+            input("\nPress Enter to start the draft...")
 
-        while True:
-            try:
-                user_position = int(
-                    input(f"\nEnter your draft position (1-{league_teams_default_config['league_size']}): ").strip())
-                if 1 <= user_position <= league_teams_default_config['league_size']:
-                    break
-                print(f"Error: Please enter a number between 1 and {league_teams_default_config['league_size']}")
-            except ValueError:
-                print("Error: Please enter a valid number")
+            # Initialize rosters for all teams
+            all_rosters = layout.empty(num_teams)
 
-        print(f"\nYou are drafting from position #{user_position}")
-        print(f"  League size: {league_teams_default_config['league_size']} teams")
-        input("\nPress Enter to start the draft...")
+            # Every pick is logged so the draft can be resumed after a crash
+            seed = random.randrange(2 ** 63)
+            draft_log = DraftLog.create(DRAFT_LOG_PATH, seed, 2024, num_teams, user_position)
 
-        # Initialize rosters for all teams
-        num_teams = league_teams_default_config['league_size']
-        all_rosters = {}
-        for i in range(1, num_teams + 1):
-            roster_skeleton = build_roster_skeleton(league_teams_default_config)
-            all_rosters[i] = {pos: 0 for pos in roster_skeleton.keys()}
+            # Rank the user's first recommendations while the seats ahead pick
+            speculator.speculate(all_rosters[user_position - 1], league_teams_default_config,
+                                 top_n=50, upcoming_picks=user_position - 1)
+
+        # Opponent choices are reproducible from the logged seed
+        rng = random.Random(seed + picks_made)
 
         # Calculate total picks needed
-        roster_size = sum(build_roster_skeleton(league_teams_default_config).values())
+        user_roster = all_rosters[user_position - 1]
+        roster_size = int(layout.capacity.sum())
         total_rounds = roster_size
 
         # Snake draft order
         draft_complete = False
-        current_round = 1
+        current_round = picks_made // num_teams + 1
 
         while not draft_complete:
             # Determine pick order for this round (snake draft)
@@ -115,6 +184,12 @@ def run_draft():
             print(f"  ROUND {current_round}")
             print("=" * 60)
 
+            # Rank the pool for every seat at once; deep enough to cover the picks made before each seat's turn
+            with Trace.span("draft.round_rankings", round=current_round):
+                round_rankings, _ = recommender.rank_available_batch(
+                    all_rosters, league_teams_default_config, limit=50 * 2 + num_teams
+                )
+
             for drafter_position in pick_order:
                 # Calculate overall pick number
                 if current_round % 2 == 1:
@@ -122,12 +197,11 @@ def run_draft():
                 else:
                     overall_pick = (current_round - 1) * num_teams + (num_teams - drafter_position + 1)
 
+                if overall_pick <= picks_made:
+                    continue  # Made before the draft was resumed
+
                 # Check if draft is complete
-                user_roster_full = all(
-                    all_rosters[user_position][pos] >= build_roster_skeleton(league_teams_default_config)[pos]
-                    for pos in all_rosters[user_position].keys()
-                )
-                if user_roster_full:
+                if layout.is_full(user_roster):
                     draft_complete = True
                     break
 
@@ -136,24 +210,26 @@ def run_draft():
                     print("\n" + "█" * 60)
                     print(f"  YOUR TURN - Pick #{overall_pick}")
                     print("█" * 60)
+                    pick_clock_start = time.perf_counter()
+                    # Analysis up to the prompt (time waiting on input is not traced)
+                    pick_span = Trace.span("draft.user_pick", pick=overall_pick)
 
                     # Show user's roster
                     print("\nYour Current Roster:")
-                    roster_skeleton = build_roster_skeleton(league_teams_default_config)
-                    for pos, count in all_rosters[user_position].items():
-                        needed = roster_skeleton[pos]
+                    for pos, count, needed in zip(layout.columns, user_roster.tolist(), layout.capacity.tolist()):
                         status = "F" if count >= needed else "o"
                         max_allowed = league_teams_default_config['max_per_position'].get(pos, needed)
                         print(f"  [{status}] {pos:6s}: {count}/{needed} (max: {max_allowed})")
 
                     # Get top 5 recommendations
-                    recommendations = recommender.get_recommendations(
-                        all_rosters[user_position],
+                    recommendations = speculator.get_recommendations(
+                        user_roster,
                         league_teams_default_config,
                         top_n=50 # this gets the top 25, making sure we get 5 distinct positions to draft
                     )
 
                     if recommendations.empty:
+                        pick_span.end()
                         print("\nYour roster is full!")
                         draft_complete = True
                         break
@@ -174,21 +250,43 @@ def run_draft():
                                 'ppg': row['points_per_game'],
                                 'rank': int(row['position_rank']),
                                 'value': row['value_score'],
+                                'vorp': row['vorp'],
                                 'index': idx
                             })
                             seen_positions.add(pos)
                             if len(top_positions) == 5:
                                 break
 
+                    # Chance the best player at each position is still there next turn
+                    upcoming_seats = picks_until_next_turn(user_position, overall_pick, num_teams, total_rounds)
+                    survival = survival_engine.estimate(all_rosters, upcoming_seats or [], time_budget=0.2)
+
+                    tier_tracker = recommender.get_tier_tracker()
                     for i, pos_info in enumerate(top_positions, 1):
+                        best_at_pos = recommender.get_best_available_by_position(pos_info['position'], n=1)
+                        survives = survival.get(best_at_pos.index[0], 1.0) if upcoming_seats is not None else 0.0
+                        tier, tier_left = tier_tracker.player_tier_remaining(pos_info['index'])
+                        tier_note = f", {tier.split(' (')[0]}: {tier_left} left" if tier else ""
                         print(
-                            f"  {i}. {pos_info['position']:5s} - {pos_info['ppg']:.1f} PPG (Rank #{pos_info['rank']}, Value: {pos_info['value']:.1f})")
+                            f"  {i}. {pos_info['position']:5s} - {pos_info['ppg']:.1f} PPG (Rank #{pos_info['rank']}, Value: {pos_info['value']:.1f}, VORP: {pos_info['vorp']:+.1f}, Next turn: {survives:.0%}{tier_note})")
+
+                    # Look ahead at future picks with whatever is left of the pick clock
+                    valid_positions = [p['position'] for p in top_positions]
+                    search_budget = PICK_CLOCK_SECONDS - (time.perf_counter() - pick_clock_start)
+                    suggestion = lookahead.search(
+                        all_rosters, user_position, overall_pick, total_rounds,
+                        time_budget=max(search_budget, 0), candidates=valid_positions
+                    )
+                    if suggestion['position'] is not None:
+                        print(f"\n  Lookahead ({suggestion['depth']} picks deep) suggests: {suggestion['position']}")
+                    pick_span.end()
 
                     # Simple input prompt to get user's draft choice
                     print("\n" + "-" * 60)
-                    valid_positions = [p['position'] for p in top_positions]
                     print(f"  Enter position to draft: {' / '.join(valid_positions)}")
                     print(f"  (or press ENTER to draft {valid_positions[0]})")
+                    print(f"  (enter ?POS, e.g. ?{valid_positions[0]}, to see historical comparables)")
+                    print("  (enter = to compare the positions in simulated what-if drafts)")
 
                     print("-" * 60)
 
@@ -198,6 +296,15 @@ def run_draft():
                         if choice == "":
                             choice = valid_positions[0]
 
+                        if choice.startswith("?"):
+                            show_comparables(recommender, choice[1:].strip())
+                            continue
+
+                        if choice == "=":
+                            show_what_if(recommender, all_rosters, user_position, overall_pick,
+                                         total_rounds, valid_positions)
+                            continue
+
                         if choice in valid_positions:
                             # Find the player to draft
                             selected_pos_info = next(p for p in top_positions if p['position'] == choice)
@@ -216,48 +323,39 @@ def run_draft():
                             recommender.mark_player_drafted(player_to_draft)
 
                             # Update roster
-                            if not update_roster(all_rosters[user_position], choice, league_teams_default_config):
+                            if not layout.add_pick(user_roster, choice):
                                 print(f"ERROR: That position {choice} is full!")
-                                recommender.drafted_players.remove(player_to_draft)
+                                recommender.unmark_player_drafted(player_to_draft)
                                 continue
 
+                            draft_log.append(user_position, player_to_draft)
                             drafted_player = best_at_pos.iloc[0]
                             print(f"\nYOU DRAFTED: {choice}")
                             print(f"PPG: {drafted_player['points_per_game']:.2f} | Position Rank: #{int(drafted_player['position_rank'])}")
+
+                            # Rank the user's next recommendations while the opponents pick
+                            if upcoming_seats is not None:
+                                speculator.speculate(user_roster, league_teams_default_config,
+                                                     top_n=50, upcoming_picks=len(upcoming_seats))
                             break
                         else:
                             print(f"Please enter one of: {' / '.join(valid_positions)}")
 
                 else:
                     # Sim other drafters for speed of testing
-                    computer_recommendations = recommender.get_recommendations(
-                        all_rosters[drafter_position],
-                        league_teams_default_config,
-                        top_n=50 # more options for random picking
-                    )
+                    # Top 5 unique positions of their recommendations (like user sees)
+                    with Trace.span("draft.opponent_pick", pick=overall_pick, seat=drafter_position):
+                        comp_top_positions = recommender.top_positions(
+                            round_rankings[drafter_position - 1],
+                            all_rosters[drafter_position - 1],
+                            league_teams_default_config,
+                            top_n=50 # more options for random picking
+                        )
 
-                    if not computer_recommendations.empty:
-                        # Get top 5 unique positions (like user sees)
-                        comp_top_positions = []
-                        seen_positions = set()
-
-                        for idx, row in computer_recommendations.iterrows():
-                            pos = row['position']
-                            if pos not in seen_positions:
-                                comp_top_positions.append({
-                                    'position': pos,
-                                    'index': idx
-                                })
-                                seen_positions.add(pos)
-                                if len(comp_top_positions) == 5:
-                                    break
-
-                        comp_position = None
-                        comp_player = None
-                        # Randomly select from top 5 positions (simulating drafter bias)
                         if comp_top_positions:
-                            selected = random.choice(comp_top_positions)
-                            comp_position = selected['position']
+                            comp_player = None
+                            # Randomly select from top 5 positions (simulating drafter bias)
+                            comp_position = rng.choice(comp_top_positions)
 
                             # Draft best available at selected position
                             best_at_pos = recommender.get_best_available_by_position(comp_position, n=1)
@@ -266,22 +364,36 @@ def run_draft():
                                 comp_player = best_at_pos.iloc[0]
 
                                 recommender.mark_player_drafted(comp_idx)
-                                update_roster(all_rosters[drafter_position], comp_position, league_teams_default_config)
-                        print(
-                            f"  Pick #{overall_pick}: Drafter {drafter_position} → {comp_position} ({comp_player['points_per_game']:.1f} PPG)")
+                                layout.add_pick(all_rosters[drafter_position - 1], comp_position)
+                                draft_log.append(drafter_position, comp_idx)
+                            print(
+                                f"  Pick #{overall_pick}: Drafter {drafter_position} → {comp_position} ({comp_player['points_per_game']:.1f} PPG)")
 
             if not draft_complete:
                 current_round += 1
 
+        speculator.shutdown()
+
+        # Keep the finished draft's log for replay/analysis
+        draft_log.close()
+        finished_log = os.path.join(os.path.dirname(DRAFT_LOG_PATH), f"draft-{time.strftime('%Y%m%d-%H%M%S')}.draftlog")
+        os.replace(DRAFT_LOG_PATH, finished_log)
+        try:
+            record_draft(PICK_HISTORY_PATH, finished_log, recommender.rankings, layout)
+        except ValueError as e:
+            # The history was started for another league; the draft log itself is kept
+            print(f"\nPick history not updated: {e}")
+
         # Draft complete
         print("\n" + "=" * 60)
         print("  DRAFT COMPLETE!")
         print("=" * 60)
         print("\nYour Final Roster:")
-        for pos, count in all_rosters[user_position].items():
-            needed = build_roster_skeleton(league_teams_default_config)[pos]
+        for pos, count, needed in zip(layout.columns, user_roster.tolist(), layout.capacity.tolist()):
             status = "✓" if count >= needed else "✗"
             print(f"  [{status}] {pos:6s}: {count}/{needed}")
+        print(f"\nDraft log saved to {finished_log}")
+        show_season_outlook(recommender, finished_log, user_position)
 
         input("\nPress Enter to return to main menu...")
 
@@ -298,31 +410,165 @@ def run_draft():
         input("\nPress Enter to continue...")
 
 
-def update_roster(roster, position, league_config):
-    """
-    Update roster with drafted player.
-    Returns True if successful, False if no spot available.
-    """
+def run_live_draft():
+    """Follow a real draft: other teams' picks stream in from a local event source."""
+    print("\n" + "=" * 60)
+    print("  LIVE DRAFT")
+    print("=" * 60)
 
-    max_allowed = league_config['max_per_position'].get(position, 99)
-    current_at_position = roster.get(position, 0)
+    source = None
+    try:
+        from live.LiveDraft import LiveDraftSession
+        from recommender.DraftRecommender import DraftRecommender
 
-    if current_at_position >= max_allowed:
-        return False  # reached max number of players for this position
+        recommender = DraftRecommender()
+        num_teams = league_teams_default_config['league_size']
 
-    starter_needed = league_config['starters_per_pos'].get(position, 0)
-    if roster[position] < starter_needed:
-        roster[position] += 1
-        return True
-    elif (position in league_config['flex_eligible'] and
-          roster['FLEX'] < league_config['flex_spots']):
-        roster['FLEX'] += 1
-        return True
-    elif roster['BENCH'] < league_config['bench_spots']:
-        roster['BENCH'] += 1
-        return True
+        while True:
+            try:
+                user_position = int(input(f"\nEnter your draft position (1-{num_teams}): ").strip())
+                if 1 <= user_position <= num_teams:
+                    break
+                print(f"Error: Please enter a number between 1 and {num_teams}")
+            except ValueError:
+                print("Error: Please enter a valid number")
 
-    return False
+        print("\nOther teams' picks are read as lines like  4 RB  or  {\"seat\": 4, \"position\": \"RB\"}")
+        print("Sources: file:<path> (tail), pipe:<path> (named pipe), unix:<path> or tcp:<port> (socket)")
+        spec = input("Event source [file:data/live/picks.txt]: ").strip() or "file:data/live/picks.txt"
+        if spec.startswith("file:"):
+            Path(spec[len("file:"):]).parent.mkdir(parents=True, exist_ok=True)
+        source = open_source(spec)
+
+        session = LiveDraftSession(recommender, league_teams_default_config, user_position)
+        waiting_for = None
+
+        while not session.is_complete():
+            seat = session.current_seat()
+
+            if seat != user_position:
+                if waiting_for != len(session.picks):
+                    print(f"\n  Waiting for pick #{len(session.picks) + 1} (Drafter {seat})...")
+                    waiting_for = len(session.picks)
+                for result in session.ingest(source.poll(timeout=0.5)):
+                    if isinstance(result, str):
+                        print(f"  {result}")
+                    else:
+                        print(f"  Pick #{result['overall_pick']}: Drafter {result['seat']} → "
+                              f"{result['position']} ({result['points_per_game']:.1f} PPG)")
+                continue
+
+            # USER'S TURN
+            print("\n" + "█" * 60)
+            print(f"  YOUR TURN - Pick #{len(session.picks) + 1}")
+            print("█" * 60)
+
+            recommendations = session.get_recommendations(top_n=50)
+            if recommendations.empty:
+                print("\nYour roster is full!")
+                break
+
+            top_positions = list(dict.fromkeys(recommendations['position']))[:5]
+            for i, pos in enumerate(top_positions, 1):
+                best = recommendations[recommendations['position'] == pos].iloc[0]
+                print(f"  {i}. {pos:5s} - {best['points_per_game']:.1f} PPG "
+                      f"(Value: {best['value_score']:.1f}, VORP: {best['vorp']:+.1f}, "
+                      f"{session.remaining[pos]} left)")
+
+            while True:
+                choice = input(f"\nDraft position ({' / '.join(top_positions)}, ENTER for {top_positions[0]}): ").strip().upper()
+                choice = choice or top_positions[0]
+                if choice not in top_positions:
+                    print(f"Please enter one of: {' / '.join(top_positions)}")
+                    continue
+                try:
+                    pick = session.apply_event({'seat': user_position, 'position': choice})
+                except ValueError as e:
+                    print(f"ERROR: {e}")
+                    continue
+                print(f"\nYOU DRAFTED: {choice} ({pick['points_per_game']:.2f} PPG)")
+                break
+
+        print("\n" + "=" * 60)
+        print("  LIVE DRAFT COMPLETE!")
+        print("=" * 60)
+        input("\nPress Enter to return to main menu...")
+
+    except KeyboardInterrupt:
+        print("\n\nLive draft stopped.")
+    except FileNotFoundError:
+        print("\nError: Required data files not found!")
+        print("\nPlease run the data pipeline first:")
+        print("  1. py Step3ConsolidateData.py")
+        print("  2. py Step4TrainModel.py")
+        input("\nPress Enter to continue...")
+    except Exception as e:
+        print(f"\nUnexpected error: {e}")
+        input("\nPress Enter to continue...")
+    finally:
+        if source is not None:
+            source.close()
+
+
+def show_season_outlook(recommender, log_path, user_position, seasons=10000):
+    """Simulate head-to-head seasons for every drafted roster and show the user's outlook."""
+    import numpy as np
+    from builder.DraftLog import read_log
+    from simulation.SeasonSimulator import SeasonSimulator
+
+    _, picks = read_log(log_path)
+    simulator = SeasonSimulator(league_teams_default_config)
+    mean, sd = simulator.rosters_from_picks(recommender.rankings, zip(picks['seat'].tolist(), picks['player'].tolist()))
+    outlook = simulator.simulate(mean, sd, seasons=seasons)
+
+    seat = user_position - 1
+    rank = int((outlook['win_rate'] > outlook['win_rate'][seat]).sum()) + 1
+    print(f"\nSeason outlook ({seasons} simulated {simulator.weeks}-week seasons):")
+    print(f"  Expected record: {outlook['expected_wins'][seat]:.1f}-{simulator.weeks - outlook['expected_wins'][seat]:.1f} "
+          f"(#{rank} of {len(outlook['win_rate'])} by win rate)")
+    print(f"  Playoff chance: {outlook['playoff_prob'][seat]:.0%} (top {simulator.playoff_teams} make it)")
+    print(f"  Weekly starting points: {outlook['points_for'][seat]:.1f} (league average {np.mean(outlook['points_for']):.1f})")
+
+
+def show_what_if(recommender, all_rosters, user_position, overall_pick, total_rounds, positions, branches=200):
+    """Compare drafting each position now by simulating the rest of the next two rounds in many branches."""
+    import numpy as np
+    from simulation.DraftState import DraftPool
+
+    num_teams = league_teams_default_config['league_size']
+    pool = DraftPool(recommender, league_teams_default_config)
+    root = pool.root(all_rosters, recommender.drafted_players)
+
+    # Everyone picks (the user with the computer drafters' policy) through the user's next two turns
+    seats = [seat for _, pick, seat in snake_order(num_teams, total_rounds) if pick > overall_pick]
+    user_turns = [i for i, seat in enumerate(seats) if seat == user_position][:2]
+    seats = seats[:user_turns[-1] + 1] if user_turns else seats
+
+    rng = np.random.default_rng()
+    print(f"\n  What-if: {branches} simulated drafts per choice through your next {len(user_turns)} picks")
+    for position in positions:
+        try:
+            fork = root.pick(user_position, position=position)
+        except ValueError:
+            continue
+        totals = [branch.drafted_ppg(user_position) for branch in fork.simulate(seats, rng, branches)]
+        print(f"    {position:5s} - {np.mean(totals):.1f} PPG added on average "
+              f"(10th-90th percentile {np.percentile(totals, 10):.1f}-{np.percentile(totals, 90):.1f})")
+
+
+def show_comparables(recommender, position, k=5):
+    """Show historical player-seasons similar to the best available player at a position."""
+    best_at_pos = recommender.get_best_available_by_position(position, n=1)
+    if best_at_pos.empty:
+        print(f"No available players at {position}")
+        return
+
+    comparables = recommender.get_comparables(best_at_pos.index[0], k=k)
+
+    print(f"\n  Comparables for best available {position} ({best_at_pos.iloc[0]['points_per_game']:.1f} PPG):")
+    for _, row in comparables.iterrows():
+        print(f"    {int(row['season'])} {row['position']:5s} - {row['points_per_game']:.1f} PPG "
+              f"({int(row['games_played_season'])} games, distance {row['distance']:.2f})")
 
 
 def main_menu():
@@ -337,6 +583,9 @@ def main_menu():
     print("=" * 50)
     print("\n  Data-driven draft recommendations")
     print("  to help you dominate your league!\n")
+
+    # Every option needs the rankings (and scarcity tables): load them while the banner is read
+    DataLoader.prefetch(position_analysis_path=DataLoader.POSITION_ANALYSIS_PATH)
     input("Press Enter to continue...")
 
     while run:
@@ -345,23 +594,26 @@ def main_menu():
         print("=" * 50)
         print("\n1. View position analysis")
         print("2. Start draft")
-        print("3. Quit")
+        print("3. Live draft (follow other teams' picks)")
+        print("4. Quit")
         print("\n" + "=" * 50)
 
-        choice = input("\nSelect an option (1-3): ").strip()
+        choice = input("\nSelect an option (1-4): ").strip()
 
         if choice == "1":
             view_position_analysis()
         elif choice == "2":
             run_draft()
         elif choice == "3":
+            run_live_draft()
+        elif choice == "4":
             run = False
             print("\n" + "=" * 50)
             print("  Thank you for using Draft Assistant!")
             print("  Good luck this season!")
             print("=" * 50 + "\n")
         else:
-            print("\nInvalid choice - please enter 1-3")
+            print("\nInvalid choice - please enter 1-4")
 
 
 if __name__ == "__main__":
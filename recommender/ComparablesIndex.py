@@ -0,0 +1,150 @@
+"""
+Nearest-neighbor index of comparable player-seasons.
+
+Step 4 builds one KD-tree per position over the standardized model feature
+matrix and saves it next to the model, so the draft tools can show
+historical comparables without scanning every row.
+"""
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.neighbors import KDTree
+from sklearn.preprocessing import StandardScaler
+
+
+class ComparablesIndex:
+    """Per-position KD-trees over the standardized feature space."""
+
+    # Columns kept alongside each indexed row for display
+    info_columns = ['position', 'season', 'points_per_game', 'fantasy_points', 'games_played_season']
+
+    def __init__(self, feature_columns, scaler, trees, row_ids, features, info):
+        """
+        Args:
+            feature_columns: Feature names the trees were built over
+            scaler: Fitted StandardScaler for those features
+            trees: Dict of position: KDTree
+            row_ids: Dict of position: array of rankings row indices (tree order)
+            features: Dict of position: standardized feature matrix (tree order)
+            info: DataFrame of display columns indexed by rankings row index
+        """
+        self.feature_columns = feature_columns
+        self.scaler = scaler
+        self.trees = trees
+        self.row_ids = row_ids
+        self.features = features
+        self.info = info
+        # row index -> (position, position in tree order)
+        self._lookup = {
+            row_id: (position, i)
+            for position, ids in row_ids.items()
+            for i, row_id in enumerate(ids)
+        }
+
+    @classmethod
+    def build(cls, data, feature_columns, leaf_size=16):
+        """
+        Build the index from the prepared training data.
+
+        Args:
+            data: DataFrame from prepare_features (index = rankings row index)
+            feature_columns: Model feature columns (position_encoded is skipped,
+                since every tree only holds a single position)
+            leaf_size: KD-tree leaf size
+
+        Returns:
+            ComparablesIndex
+        """
+        columns = [col for col in feature_columns if col != 'position_encoded']
+        scaler = StandardScaler().fit(data[columns].to_numpy(dtype=float))
+
+        trees, row_ids, features = {}, {}, {}
+        for position, pos_data in data.groupby('position', sort=False, observed=True):
+            scaled = scaler.transform(pos_data[columns].to_numpy(dtype=float))
+            trees[position] = KDTree(scaled, leaf_size=leaf_size)
+            row_ids[position] = pos_data.index.to_numpy()
+            features[position] = scaled
+
+        info = data[cls.info_columns].copy()
+        return cls(columns, scaler, trees, row_ids, features, info)
+
+    @classmethod
+    def from_rankings(cls, rankings):
+        """
+        Build the index from a rankings DataFrame the way Step 4 does, for
+        when the saved index is missing (e.g. a fresh checkout).
+        """
+        from Step4TrainModel import FEATURE_COLUMNS, prepare_features
+
+        data, _ = prepare_features(rankings)
+        return cls.build(data.dropna(subset=FEATURE_COLUMNS + ['points_per_game']), FEATURE_COLUMNS)
+
+    def save(self, path):
+        """Persist the index with joblib (alongside the model files)."""
+        joblib.dump(self, path)
+
+    @staticmethod
+    def load(path):
+        """Load an index saved by Step4TrainModel.py."""
+        return joblib.load(path)
+
+    def query(self, position, feature_values, k=5):
+        """
+        Find the k nearest player-seasons at a position.
+
+        Args:
+            position: Position code
+            feature_values: Dict (or Series) of raw, unscaled feature values
+            k: Number of neighbors
+
+        Returns:
+            DataFrame of comparables with a 'distance' column
+        """
+        if position not in self.trees:
+            return pd.DataFrame()
+
+        raw = np.array([[feature_values[col] for col in self.feature_columns]], dtype=float)
+        point = self.scaler.transform(raw)
+        order, distances = self.nearest(position, point, k)
+        return self._frame(position, order, distances)
+
+    def comparables_for(self, row_id, k=5):
+        """
+        Find the k nearest player-seasons to an indexed player-season,
+        excluding the player-season itself.
+
+        Args:
+            row_id: Rankings row index
+            k: Number of neighbors
+
+        Returns:
+            DataFrame of comparables with a 'distance' column
+        """
+        if row_id not in self._lookup:
+            return pd.DataFrame()
+
+        position, i = self._lookup[row_id]
+        order, distances = self.nearest(position, self.features[position][i:i + 1], k + 1)
+        keep = order != i
+        return self._frame(position, order[keep][:k], distances[keep][:k])
+
+    def nearest(self, position, point, k):
+        """
+        Raw k-NN query against a position's tree.
+
+        Args:
+            position: Position code
+            point: Standardized 1 x n_features array
+            k: Number of neighbors
+
+        Returns:
+            Tuple of (tree-order positions, distances)
+        """
+        k = min(k, len(self.row_ids[position]))
+        distances, order = self.trees[position].query(point, k=k)
+        return order[0], distances[0]
+
+    def _frame(self, position, order, distances):
+        """Attach display columns to a query result."""
+        neighbors = self.info.loc[self.row_ids[position][order]]
+        return neighbors.assign(distance=distances.round(3))
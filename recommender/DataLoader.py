@@ -0,0 +1,99 @@
+"""
+Lazily loaded, shared data artifacts.
+
+Each artifact (rankings CSV, comparables index, position analysis) is read at most once per
+process, on a background thread, the first time it is requested or
+prefetched. Prefetching several artifacts loads them concurrently, so the
+menu can start the slow pandas/scikit-learn imports and file reads while
+the user is still reading the banner. Only the standard library is
+imported at module level.
+"""
+import threading
+
+RANKINGS_PATH = "data/summary/player_rankings.csv"
+COMPARABLES_PATH = "models/comparables_index.pkl"
+POSITION_ANALYSIS_PATH = "data/summary/position_analysis.pkl"
+
+_lock = threading.RLock()
+_futures = {}
+_executor = None
+
+
+def _read_rankings(path):
+    from utility import Schema
+    return Schema.read_csv(path)
+
+
+def _read_comparables(path):
+    from recommender.ComparablesIndex import ComparablesIndex
+    return ComparablesIndex.load(path)
+
+
+def _read_position_analysis(path):
+    from recommender.PositionAnalysis import PositionAnalysis
+    return PositionAnalysis.load(path)
+
+
+def _submit(key, loader, path):
+    """Start loading an artifact unless it is already loaded or loading."""
+    global _executor
+    with _lock:
+        future = _futures.get(key)
+        # A missing file may be created later (e.g. by Step4TrainModel.py), so
+        # a failed load is retried. Checked here rather than evicted by a done
+        # callback, which can run after .result() has already woken the caller.
+        if future is None or (future.done() and future.exception() is not None):
+            if _executor is None:
+                from concurrent.futures import ThreadPoolExecutor
+                _executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='load')
+            future = _futures[key] = _executor.submit(loader, path)
+        return future
+
+
+def prefetch(rankings_path=RANKINGS_PATH, comparables_path=None, position_analysis_path=None):
+    """
+    Start loading artifacts in the background without waiting.
+
+    Args:
+        rankings_path: Rankings CSV to load (None to skip)
+        comparables_path: Comparables index to load (None to skip)
+        position_analysis_path: Position analysis to load (None to skip)
+    """
+    if rankings_path is not None:
+        _submit(('rankings', rankings_path), _read_rankings, rankings_path)
+    if comparables_path is not None:
+        _submit(('comparables', comparables_path), _read_comparables, comparables_path)
+    if position_analysis_path is not None:
+        _submit(('position_analysis', position_analysis_path), _read_position_analysis, position_analysis_path)
+
+
+def load_rankings(path=RANKINGS_PATH):
+    """
+    Shared rankings DataFrame (callers must not modify it).
+
+    Raises:
+        FileNotFoundError: If the rankings have not been generated
+    """
+    return _submit(('rankings', path), _read_rankings, path).result()
+
+
+def load_comparables(path=COMPARABLES_PATH):
+    """
+    Shared ComparablesIndex.
+
+    Raises:
+        FileNotFoundError: If Step4TrainModel.py has not built the index
+    """
+    return _submit(('comparables', path), _read_comparables, path).result()
+
+
+def load_position_analysis(path=POSITION_ANALYSIS_PATH):
+    """
+    Shared PositionAnalysis saved by Step4TrainModel.py, or None if it has
+    not been built (callers check its rankings_hash before using it).
+    """
+    try:
+        return _submit(('position_analysis', path), _read_position_analysis, path).result()
+    except Exception:
+        # Missing or unreadable (e.g. pickled by another pandas version): it is only a cache
+        return None
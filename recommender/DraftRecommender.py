@@ -2,20 +2,50 @@
 Draft recommendation system that suggests the best available position
 based on roster needs and value.
 """
+import numpy as np
 import pandas as pd
 
+from builder.LeagueLayout import compile_league_config
+from config.StrategyConfig import default_strategy_config
 from logic import DraftRules
+from recommender import DataLoader
+from recommender.PositionAnalysis import PositionAnalysis
+from recommender.ReplacementValue import ReplacementTracker
+from recommender.TierIndex import TierTracker
+from utility import Trace
 
 
 class DraftRecommender:
     """Recommends players based on roster needs and player value."""
 
-    def __init__(self, player_rankings_path="data/summary/player_rankings.csv"):
-        """Initialize with player rankings data."""
-        self.rankings = pd.read_csv(player_rankings_path)
+    def __init__(self, player_rankings_path="data/summary/player_rankings.csv", rankings=None,
+                 strategy_config=None):
+        """
+        Initialize with player rankings data.
+
+        Args:
+            player_rankings_path: Rankings CSV written by Step4TrainModel.py
+                (loaded on first use and shared, see DataLoader)
+            rankings: Already loaded rankings DataFrame to share instead of
+                reading the CSV (it is never modified)
+            strategy_config: Value weights (default: default_strategy_config)
+        """
+        self.player_rankings_path = player_rankings_path
+        self._rankings = rankings
+        self.strategy_config = default_strategy_config if strategy_config is None else strategy_config
         self.drafted_players = set()
         self._scarcity_cache = {}
-        self.fol_rules = None
+        self._position_lookups = {}
+        self._comparables = None
+        self._replacement = {}
+        self._tier_trackers = {}
+
+    @property
+    def rankings(self):
+        """Player rankings, loaded on first access."""
+        if self._rankings is None:
+            self._rankings = DataLoader.load_rankings(self.player_rankings_path)
+        return self._rankings
 
     @staticmethod
     def get_position_needs(roster, league_config):
@@ -23,43 +53,15 @@ class DraftRecommender:
         Determine which positions still need to be filled.
 
         Args:
-            roster: Dict with filled position counts
+            roster: Dict with filled position counts (or LeagueLayout count array)
             league_config: League configuration dict
 
         Returns:
             Dict of position: remaining_spots_needed
         """
-        needs = {}
-
-        # Check starter positions
-        for po, required in league_config['starters_per_pos'].items():
-            filled = roster.get(po, 0)
-            max_allowed = league_config.get('max_per_position', {}).get(po, 99)
-
-            if filled < max_allowed:
-                if filled < required:
-                    needs[po] = required - filled
-
-        # Check flex spots
-        flex_filled = roster.get('FLEX', 0)
-        if flex_filled < league_config['flex_spots']:
-            for po in league_config['flex_eligible']:
-                filled = roster.get(po, 0)
-                max_allowed = league_config.get('max_per_position', {}).get(po, 99)
-                if filled < max_allowed:
-                    needs[po] = needs.get(po, 0) + 1
-
-        # Always consider bench
-        bench_filled = roster.get('BENCH', 0)
-        if bench_filled < league_config['bench_spots']:
-            # All positions can fill bench (if at max or under)
-            for po in league_config['starters_per_pos'].keys():
-                filled = roster.get(po, 0)
-                max_allowed = league_config.get('max_per_position', {}).get(po, 99)
-                if filled < max_allowed:
-                    needs[po] = needs.get(po, 0) + 1
-
-        return needs
+        # Starter spots still open, plus one for an open FLEX spot (eligible
+        # positions) and one for an open bench spot, for positions under their max
+        return compile_league_config(league_config).needs_dict(roster)
 
     def calculate_player_value(self, player_row, position_needs, season):
         """
@@ -77,69 +79,177 @@ class DraftRecommender:
             Float value score
         """
         position = player_row['position']
+        strategy = self.strategy_config
 
         # Base value from performance
         base_value = player_row['points_per_game']
 
         # Bonus for being above position average
         position_diff = player_row.get('ppg_vs_position_avg', 0)
-        value_score = base_value + (position_diff * 0.5)
+        value_score = base_value + (position_diff * strategy['position_diff_weight'])
 
         # Apply need multiplier
         need_multiplier = position_needs.get(position, 0)
         if need_multiplier > 0:
             # Boost value if we need this position
-            value_score *= (1 + (need_multiplier * 0.2))
+            value_score *= (1 + (need_multiplier * strategy['need_boost']))
         else:
             # Penalize if we don't need this position
-            value_score *= 0.5
+            value_score *= strategy['off_need_factor']
 
         # Bonus for elite players (top 20% in their position)
         if player_row.get('position_percentile', 0) >= 0.8:
-            value_score *= 1.3
+            value_score *= strategy['elite_bonus']
 
-        if season not in self._scarcity_cache:
-            self._scarcity_cache[season] = self.get_position_scarcity(season=season)
+        scarcity_scores = self.get_scarcity_scores(season)
+        if position in scarcity_scores:
+            # Apply scarcity multiplier based on thresholds
+            value_score *= self.get_scarcity_multiplier(scarcity_scores[position], strategy)
 
-        scarcity_data = self._scarcity_cache[season]
-        pos_scarcity = scarcity_data[scarcity_data['position'] == position]
+        return value_score
 
-        if not pos_scarcity.empty:
-            scarcity_score = pos_scarcity.iloc[0]['scarcity_score']
+    def get_base_values(self, players, season=2024):
+        """
+        Vectorized calculate_player_value without the roster-need multiplier.
 
-            # Apply scarcity multiplier based on thresholds
-            if scarcity_score > 1.8:  # Very high scarcity (RB, WR, TE)
-                value_score *= 1.25
-            elif scarcity_score > 1.2:  # High scarcity
-                value_score *= 1.15
-            elif scarcity_score > 0.8:  # Medium scarcity
-                value_score *= 1.05
-            # Low scarcity positions get no boost
-            elif scarcity_score < 0.5:
-                value_score *= 0.95
+        The need multiplier is the only roster-dependent factor, so
+        value_score = base_value * need_factor for any roster.
 
-        return value_score
+        Args:
+            players: DataFrame of players
+            season: Scarcity calculation
+
+        Returns:
+            Series of base value scores
+        """
+        strategy = self.strategy_config
+        value = players['points_per_game'] + players.get('ppg_vs_position_avg', 0) * strategy['position_diff_weight']
+        value = value * np.where(players.get('position_percentile', 0) >= 0.8, strategy['elite_bonus'], 1.0)
+
+        multipliers = self._get_position_lookups(season)['multiplier']
+        return value * players['position'].map(multipliers).fillna(1.0).astype(float)
+
+    def get_scarcity_scores(self, season=2024):
+        """
+        Scarcity score per position used for value multipliers: the season's
+        own, or a multi-season blend (strategy's scarcity_baseline, see
+        PositionAnalysis.baseline_scarcity). The IsScarce rule always uses
+        the season's own scores.
+
+        Returns:
+            Dict of position: scarcity score
+        """
+        strategy = self.strategy_config
+        method = strategy['scarcity_baseline']
+        if method == 'season':
+            if season not in self._scarcity_cache:
+                self._scarcity_cache[season] = self.get_position_scarcity(season=season)
+            scarcity_data = self._scarcity_cache[season].drop_duplicates('position')
+            return dict(zip(scarcity_data['position'], scarcity_data['scarcity_score']))
+        return PositionAnalysis.for_rankings(self.rankings).baseline_scarcity(
+            season, method, strategy['trend_window'], strategy['trend_halflife'])
+
+    def get_scarcity_trends(self, position=None, window=3, halflife=1.0):
+        """
+        Scarcity and tier-average trends across every season in the rankings.
+
+        Args:
+            position: Optional position to restrict the table to
+            window: Rolling window in seasons
+            halflife: Exponential weighting half-life in seasons
+
+        Returns:
+            DataFrame per (position, season) with each metric and its
+            '_rolling' and '_ewm' blends (see PositionAnalysis.trends)
+        """
+        trends = PositionAnalysis.for_rankings(self.rankings).trends(window, halflife)
+        if position is not None:
+            trends = trends[trends['position'] == position]
+        return trends
+
+    def _get_position_lookups(self, season):
+        """Per-position scarcity multiplier, IsScarce flag and base values, cached per season."""
+        if season not in self._position_lookups:
+            if season not in self._scarcity_cache:
+                self._scarcity_cache[season] = self.get_position_scarcity(season=season)
+            scarcity_data = self._scarcity_cache[season]
+
+            positions = scarcity_data['position'].unique()
+            scores = self.get_scarcity_scores(season)
+            lookups = {
+                'multiplier': {
+                    pos: self.get_scarcity_multiplier(scores[pos], self.strategy_config)
+                    for pos in positions if pos in scores
+                },
+                'scarce': {pos: DraftRules.is_scarce(pos, scarcity_data) for pos in positions},
+            }
+            self._position_lookups[season] = lookups
+
+            # The season's pool and its roster-independent base values
+            season_data = self.rankings[self.rankings['season'] == season]
+            lookups['season_data'] = season_data
+            lookups['base_values'] = self.get_base_values(season_data, season).to_numpy()
+
+            # Per-player columns for the batched ranking: position and IsElite ∨ IsScarce
+            lookups['positions'] = season_data['position'].to_numpy()
+            # Integer position code of every player (categorical codes for schema rankings)
+            lookups['pool_codes'], positions = pd.factorize(season_data['position'])
+            lookups['pool_positions'] = positions.tolist()
+            lookups['elite_or_scarce'] = (
+                (season_data['position_percentile'] >= 0.8) |
+                season_data['position'].map(lookups['scarce']).fillna(False).astype(bool)
+            ).to_numpy()
+            lookups['position_codes'] = {}
+
+        return self._position_lookups[season]
+
+    def _get_position_codes(self, season, layout):
+        """LeagueLayout position code of every player in the season pool (unknown positions get len(positions))."""
+        lookups = self._get_position_lookups(season)
+        key = tuple(layout.positions)
+        if key not in lookups['position_codes']:
+            codes = {pos: code for code, pos in enumerate(layout.positions)}
+            lookups['position_codes'][key] = np.array(
+                [codes.get(pos, len(codes)) for pos in lookups['positions'].tolist()]
+            )
+        return lookups['position_codes'][key]
+
+    @staticmethod
+    def get_scarcity_multiplier(scarcity_score, strategy_config=default_strategy_config):
+        """Value multiplier for a position's scarcity score (see calculate_player_value)."""
+        # Very high (RB, WR, TE), high and medium scarcity get a boost
+        for threshold, multiplier in strategy_config['scarcity_tiers']:
+            if scarcity_score > threshold:
+                return multiplier
+        # Low scarcity positions get no boost, very low a small penalty
+        if scarcity_score < strategy_config['low_scarcity_threshold']:
+            return strategy_config['low_scarcity_multiplier']
+        return 1.0
+
+    def need_factor(self, needs):
+        """Value multiplier for open roster spots at a position (array in, array out)."""
+        strategy = self.strategy_config
+        return np.where(needs > 0, 1 + needs * strategy['need_boost'], strategy['off_need_factor'])
 
     def apply_fol_filter(self, roster, recs, league_config, season=2024):
         """
         Filter recommendations using First-Order Logic rules.
         Returns only players that satisfy FOL constraints.
         """
-        # Initialize FOL rules
-        if self.fol_rules is None:
-            self.fol_rules = DraftRules(league_config)
-        # Get scarcity data
-        if season not in self._scarcity_cache:
-            self._scarcity_cache[season] = self.get_position_scarcity(season=season)
-        scarcity_data = self._scarcity_cache[season]
-        # Filter using FOL
-        filtered = []
-        for idx, row in recs.iterrows():
-            if self.fol_rules.should_recommend(roster, row, scarcity_data):
-                filtered.append(idx)
+        # Get scarcity data (IsScarce per position)
+        scarce = self._get_position_lookups(season)['scarce']
+        # Filter using FOL: NeedsPosition ∧ ¬AtMax only depend on the position,
+        # so evaluate them for every position at once and IsElite as a column
+        layout = compile_league_config(league_config)
+        counts = layout.encode(roster)
+        allowed = dict(zip(layout.positions, (layout.needs_position(counts) & ~layout.at_max(counts)).tolist()))
+        positions = recs['position'].tolist()
+        elite = np.asarray(recs.get('position_percentile', 0) >= 0.8)
+        is_scarce = np.array([scarce.get(pos, False) for pos in positions], dtype=bool)
+        filtered = np.array([allowed.get(pos, False) for pos in positions], dtype=bool) & (elite | is_scarce)
         # Return filtered recommendations
-        if filtered:
-            return recs.loc[filtered]
+        if filtered.any():
+            return recs[filtered]
         else:
             return recs  # Return all if no rules applicable
 
@@ -156,47 +266,299 @@ class DraftRecommender:
         Returns:
             DataFrame of recommended players with value scores
         """
-        # Get position needs
-        position_needs = self.get_position_needs(roster, league_config)
+        with Trace.span("recommend.get_recommendations", season=season, top_n=top_n):
+            # Get position needs
+            with Trace.span("recommend.needs"):
+                position_needs = self.get_position_needs(roster, league_config)
 
-        if not position_needs:
-            return pd.DataFrame()  # Roster is full
+            if not position_needs:
+                return pd.DataFrame()  # Roster is full
 
-        # Filter to most recent season and available players
-        available = self.rankings[
-            (self.rankings['season'] == season) &
-            (~self.rankings.index.isin(self.drafted_players))
-            ].copy()
+            # Sort by value and get top N
+            recs = self.rank_available(position_needs, season, top_n * 2)  # get 2n for FOL filtering
 
-        if available.empty:
+            if recs.empty:
+                return pd.DataFrame()
+
+            return self.finalize_recommendations(roster, recs, league_config, season)
+
+    def rank_available(self, position_needs, season=2024, limit=20, drafted_players=None):
+        """
+        Score available players and return the highest valued.
+
+        Removing players from the pool never reorders the rest, so the top
+        `limit` here minus any players drafted later is still the top of the
+        smaller pool.
+
+        Args:
+            position_needs: Dict of position needs
+            season: Season to get recommendations for
+            limit: Number of players to return
+            drafted_players: Drafted set to use instead of the live one
+
+        Returns:
+            DataFrame of players sorted by value_score (highest first)
+        """
+        if drafted_players is None:
+            drafted_players = self.drafted_players
+
+        lookups = self._get_position_lookups(season)
+        season_data, base_values = lookups['season_data'], lookups['base_values']
+
+        # Filter to available players (the season pool is cached)
+        with Trace.span("recommend.filter"):
+            available = ~season_data.index.isin(drafted_players)
+        if not available.any():
             return pd.DataFrame()
 
-        # Calculate value for each player
-        available['value_score'] = available.apply(lambda row: self.calculate_player_value(row, position_needs, season),
-                                                   axis=1)
+        # Calculate value for each player (vectorized calculate_player_value)
+        with Trace.span("recommend.score"):
+            # Needs per position code (the extra last entry is for missing positions, code -1)
+            need_by_code = [position_needs.get(pos, 0) for pos in lookups['pool_positions']] + [0]
+            need = np.array(need_by_code, dtype=float)[lookups['pool_codes']]
+            value = np.where(available, base_values * self.need_factor(need), -np.inf)
+
+        # Top `limit` by value, highest first (ties keep ranking order like nlargest)
+        with Trace.span("recommend.top", limit=limit):
+            limit = min(limit, int(available.sum()))
+            top = np.argpartition(-value, limit - 1)[:limit] if limit < len(value) else np.arange(len(value))
+            top = top[np.lexsort((top, -value[top]))]
+
+            return season_data.iloc[top].assign(value_score=value[top])
+
+    def rank_available_batch(self, rosters, league_config, season=2024, limit=20, drafted_players=None):
+        """
+        rank_available for many rosters from one scoring of the pool.
+
+        Need factors are a rosters x positions matrix, so every row costs one
+        gather and one partial sort instead of a rescan of the rankings.
+
+        Args:
+            rosters: (n, columns) LeagueLayout roster counts (one row per seat
+                or per simulated draft)
+            league_config: League configuration dict
+            season: Season to get recommendations for
+            limit: Number of players to return per roster
+            drafted_players: Drafted set shared by every row (default: the
+                live one), or a sequence of one set per row
+
+        Returns:
+            Tuple of (n, limit) arrays: positions in the season pool (-1 once
+            a row runs out of available players) and value scores, highest first
+        """
+        layout = compile_league_config(league_config)
+        lookups = self._get_position_lookups(season)
+        season_data, base_values = lookups['season_data'], lookups['base_values']
+        codes = self._get_position_codes(season, layout)
+        rosters = np.atleast_2d(rosters)
+
+        if drafted_players is None:
+            drafted_players = self.drafted_players
+        if isinstance(drafted_players, (set, frozenset)):
+            available = ~season_data.index.isin(drafted_players)
+        else:
+            available = np.array([~season_data.index.isin(drafted) for drafted in drafted_players])
+
+        # Players at positions outside the layout have no need
+        needs = layout.needs(rosters)
+        factor = self.need_factor(np.hstack([needs, np.zeros((len(rosters), 1), dtype=needs.dtype)]))
+        value = np.where(available, base_values * factor[:, codes], -np.inf)
+
+        # Top `limit` per row, highest first (ties keep ranking order like rank_available)
+        limit = min(limit, value.shape[1])
+        if limit < value.shape[1]:
+            top = np.argpartition(-value, limit - 1, axis=1)[:, :limit]
+        else:
+            top = np.broadcast_to(np.arange(value.shape[1]), value.shape)
+        top_values = np.take_along_axis(value, top, axis=1)
+        order = np.lexsort((top, -top_values))
+        top = np.take_along_axis(top, order, axis=1)
+        top_values = np.take_along_axis(top_values, order, axis=1)
+
+        return np.where(np.isfinite(top_values), top, -1), top_values
+
+    def get_recommendations_batch(self, rosters, league_config, season=2024, top_n=10, drafted_players=None):
+        """
+        get_recommendations for every row of a roster matrix at once.
 
-        # Sort by value and get top N
-        recs = available.nlargest(top_n * 2, 'value_score') # get 2n for FOL filtering
+        The pool is scored once, the FOL filter is evaluated as a rosters x
+        players mask and the output frame is built once and split per row.
 
-        fol_recs = self.apply_fol_filter(roster, recs, league_config, season)
+        Args:
+            rosters: (n, columns) LeagueLayout roster counts
+            league_config: League configuration dict
+            season: Season to get recommendations for
+            top_n: Number of recommendations per roster (as in get_recommendations)
+            drafted_players: See rank_available_batch (VORP always uses the
+                live replacement levels)
 
-        # Format output
+        Returns:
+            List of n DataFrames of recommended players with value scores
+        """
+        layout = compile_league_config(league_config)
+        lookups = self._get_position_lookups(season)
+        rosters = np.atleast_2d(rosters)
+        rows, values = self.rank_available_batch(rosters, league_config, season, top_n * 2, drafted_players)
+
+        # FOL: NeedsPosition ∧ ¬AtMax per roster and position, IsElite ∨ IsScarce per player
+        allowed = layout.needs_position(rosters) & ~layout.at_max(rosters)
+        allowed = np.hstack([allowed, np.zeros((len(rosters), 1), dtype=bool)])
+        valid = rows >= 0
+        players = np.where(valid, rows, 0)
+        codes = self._get_position_codes(season, layout)[players]
+        keep = valid & np.take_along_axis(allowed, codes, axis=1) & lookups['elite_or_scarce'][players]
+        keep = np.where(keep.any(axis=1, keepdims=True), keep, valid)
+        # A roster with no needs is full
+        keep &= (layout.needs(rosters) > 0).any(axis=1, keepdims=True)
+
+        selected = rows[keep]
+        recs = lookups['season_data'].iloc[selected]
+        vorp = self.get_replacement_tracker(league_config, season).vorp(recs.index).to_numpy()
         output_cols = [
             'position', 'points_per_game', 'fantasy_points',
-            'position_rank', 'position_percentile', 'value_score'
+            'position_rank', 'position_percentile', 'value_score', 'vorp'
         ]
+        frame = recs.assign(value_score=values[keep], vorp=vorp)[output_cols].round(2)
+
+        bounds = np.concatenate([[0], np.cumsum(keep.sum(axis=1))]).tolist()
+        return [frame.iloc[start:end] if end > start else pd.DataFrame()
+                for start, end in zip(bounds[:-1], bounds[1:])]
+
+    def top_positions(self, ranked, roster, league_config, season=2024, top_n=10, n=5):
+        """
+        First n distinct positions of get_recommendations(roster, top_n),
+        read from a deeper rank_available_batch row ranked before other
+        players were drafted (removing players never reorders the rest).
+
+        Args:
+            ranked: One row of rank_available_batch positions for this roster
+            roster: LeagueLayout roster counts (unchanged since the ranking)
+            league_config: League configuration dict
+            season: Season to get recommendations for
+            top_n: Number of recommendations get_recommendations would be asked for
+            n: Number of positions to return
+
+        Returns:
+            List of position names (e.g. "RB"), best first (empty if the roster is full)
+        """
+        layout = compile_league_config(league_config)
+        lookups = self._get_position_lookups(season)
+        counts = layout.encode(roster)
+        if not layout.needs(counts).any():
+            return []
+
+        rows = ranked[ranked >= 0]
+        remaining = rows[~lookups['season_data'].index[rows].isin(self.drafted_players)]
+        if len(remaining) < top_n * 2 and len(rows) == len(ranked):
+            # Too many of the ranked players were drafted since: rank again
+            ranked = self.rank_available_batch(counts, league_config, season, top_n * 2)[0][0]
+            remaining = ranked[ranked >= 0]
+        remaining = remaining[:top_n * 2]
+
+        allowed = np.append(layout.needs_position(counts) & ~layout.at_max(counts), False)
+        keep = allowed[self._get_position_codes(season, layout)[remaining]] & lookups['elite_or_scarce'][remaining]
+        if keep.any():
+            remaining = remaining[keep]
+        return list(dict.fromkeys(lookups['positions'][remaining].tolist()))[:n]
+
+    def finalize_recommendations(self, roster, recs, league_config, season=2024):
+        """
+        Apply the FOL filter to ranked players and format the output.
+
+        Args:
+            roster: Dict showing filled positions
+            recs: Ranked players from rank_available
+            league_config: League configuration dict
+            season: Season to get recommendations for
+
+        Returns:
+            DataFrame of recommended players with value scores
+        """
+        with Trace.span("recommend.fol"):
+            fol_recs = self.apply_fol_filter(roster, recs, league_config, season)
+
+        with Trace.span("recommend.format"):
+            # Value over the current replacement level
+            fol_recs = fol_recs.assign(vorp=self.get_replacement_tracker(league_config, season).vorp(fol_recs.index))
+
+            # Format output
+            output_cols = [
+                'position', 'points_per_game', 'fantasy_points',
+                'position_rank', 'position_percentile', 'value_score', 'vorp'
+            ]
+
+            return fol_recs[output_cols].round(2)
+
+    def get_replacement_tracker(self, league_config, season=2024):
+        """
+        Get the VORP tracker for a season, creating it on first use.
+
+        Args:
+            league_config: League configuration dict
+            season: Season the draft pool is taken from
+
+        Returns:
+            ReplacementTracker kept in sync with drafted players
+        """
+        if season not in self._replacement:
+            tracker = ReplacementTracker(self.rankings, league_config, season)
+            for player_index in self.drafted_players:
+                tracker.mark_drafted(player_index)
+            self._replacement[season] = tracker
+
+        return self._replacement[season]
+
+    def get_tier_tracker(self, season=2024):
+        """
+        Get the live tier counts for a season, creating them on first use.
 
-        return fol_recs[output_cols].round(2)
+        Args:
+            season: Season the draft pool is taken from
+
+        Returns:
+            TierTracker kept in sync with drafted players
+        """
+        if season not in self._tier_trackers:
+            tier_index = PositionAnalysis.for_rankings(self.rankings).tier_index
+            tracker = TierTracker(tier_index, self.rankings, season)
+            for player_index in self.drafted_players:
+                tracker.mark_drafted(player_index)
+            self._tier_trackers[season] = tracker
 
+        return self._tier_trackers[season]
 
     def mark_player_drafted(self, player_index):
         """Mark a player as drafted (no longer available)."""
         self.drafted_players.add(player_index)
+        for tracker in self._replacement.values():
+            tracker.mark_drafted(player_index)
+        for tracker in self._tier_trackers.values():
+            tracker.mark_drafted(player_index)
+
+    def unmark_player_drafted(self, player_index):
+        """Undo mark_player_drafted (player is available again)."""
+        self.drafted_players.discard(player_index)
+        for tracker in self._replacement.values():
+            tracker.unmark_drafted(player_index)
+        for tracker in self._tier_trackers.values():
+            tracker.unmark_drafted(player_index)
 
     def reset_draft(self):
         """Reset the draft (clear all drafted players)."""
         self.drafted_players = set()
-        self._scarcity_cache = {}
+        # Scarcity and base values only depend on the rankings, so they are kept
+        self._replacement = {}
+        self._tier_trackers = {}
+
+    def share_season_caches(self, other):
+        """
+        Share per-season scarcity and base values with another recommender
+        over the same rankings (each keeps its own draft state). Base values
+        depend on the strategy, so they are only shared between equal ones.
+        """
+        self._scarcity_cache = other._scarcity_cache
+        if self.strategy_config == other.strategy_config:
+            self._position_lookups = other._position_lookups
 
     def get_best_available_by_position(self, position, season=2024, n=5):
         """
@@ -224,6 +586,30 @@ class DraftRecommender:
             'position_rank', 'position_percentile'
         ]].round(2)
 
+    def get_comparables(self, player_index, k=5, index_path="models/comparables_index.pkl"):
+        """
+        Get historical player-seasons most similar to a player in the
+        model feature space.
+
+        Args:
+            player_index: Index of the player in the rankings
+            k: Number of comparables to return
+            index_path: Index built by Step4TrainModel.py (built from the
+                rankings instead if it has not been saved)
+
+        Returns:
+            DataFrame of comparable player-seasons with a 'distance' column
+        """
+        if self._comparables is None:
+            # Loaded on first use so scikit-learn is only imported when comparables are used
+            try:
+                self._comparables = DataLoader.load_comparables(index_path)
+            except FileNotFoundError:
+                from recommender.ComparablesIndex import ComparablesIndex
+                self._comparables = ComparablesIndex.from_rankings(self.rankings)
+
+        return self._comparables.comparables_for(player_index, k=k)
+
     def get_tier_breakdowns(self, position, season=2024):
         """
         Get tier breakdown for a position (useful for identifying
@@ -236,43 +622,7 @@ class DraftRecommender:
         Returns:
             Dict with tier statistics
         """
-        pos_data = self.rankings[
-            (self.rankings['season'] == season) &
-            (self.rankings['position'] == position)
-            ].sort_values('points_per_game', ascending=False)
-
-        if pos_data.empty:
-            return {}
-
-        # Define tiers based on percentiles
-        tiers = {
-            'Elite (Top 10%)': pos_data[pos_data['position_percentile'] >= 0.9],
-            'Tier 1 (Top 25%)': pos_data[
-                (pos_data['position_percentile'] >= 0.75) &
-                (pos_data['position_percentile'] < 0.9)
-                ],
-            'Tier 2 (Top 50%)': pos_data[
-                (pos_data['position_percentile'] >= 0.5) &
-                (pos_data['position_percentile'] < 0.75)
-                ],
-            'Tier 3 (Top 75%)': pos_data[
-                (pos_data['position_percentile'] >= 0.25) &
-                (pos_data['position_percentile'] < 0.5)
-                ],
-            'Tier 4 (Bottom 25%)': pos_data[pos_data['position_percentile'] < 0.25]
-        }
-
-        tier_summary = {}
-        for tier_name, tier_data in tiers.items():
-            if not tier_data.empty:
-                tier_summary[tier_name] = {
-                    'count': len(tier_data),
-                    'avg_ppg': tier_data['points_per_game'].mean(),
-                    'min_ppg': tier_data['points_per_game'].min(),
-                    'max_ppg': tier_data['points_per_game'].max()
-                }
-
-        return tier_summary
+        return PositionAnalysis.for_rankings(self.rankings).tier_breakdowns(position, season)
 
     def get_position_scarcity(self, season=2024):
         """
@@ -282,28 +632,8 @@ class DraftRecommender:
         Returns:
             DataFrame with scarcity metrics by position
         """
-        season_data = self.rankings[self.rankings['season'] == season]
-
-        scarcity = []
-        for position in season_data['position'].unique():
-            pos_data = season_data[season_data['position'] == position]
-
-            # Calculate drop-off from best to average
-            if len(pos_data) > 0:
-                top_10_pct = pos_data.nlargest(max(1, len(pos_data) // 10), 'points_per_game')
-                median_ppg = pos_data['points_per_game'].median()
-                top_10_ppg = top_10_pct['points_per_game'].mean()
-
-                scarcity.append({
-                    'position': position,
-                    'total_players': len(pos_data),
-                    'top_10_avg_ppg': round(top_10_ppg, 2),
-                    'median_ppg': round(median_ppg, 2),
-                    'drop_off': round(top_10_ppg - median_ppg, 2),
-                    'scarcity_score': round((top_10_ppg - median_ppg) / median_ppg, 2)
-                })
-
-        return pd.DataFrame(scarcity).sort_values('scarcity_score', ascending=False)
+        # Precomputed by Step4TrainModel.py (or once per rankings, see PositionAnalysis)
+        return PositionAnalysis.for_rankings(self.rankings).scarcity(season)
 
 
 # Example usage / testing
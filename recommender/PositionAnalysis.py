@@ -0,0 +1,207 @@
+"""
+Precomputed position scarcity and tier tables.
+
+Scarcity metrics and tier breakdowns only change when the rankings do, so
+Step 4 builds them for every season and position with groupby passes and
+saves them next to the rankings. Each saved analysis records the content
+hash of the rankings it was built from; a stale or missing file is ignored
+and the tables are rebuilt in memory (once per rankings DataFrame).
+"""
+import hashlib
+import weakref
+
+import numpy as np
+import pandas as pd
+
+from recommender import DataLoader
+from recommender.TierIndex import TIER_NAMES, TierIndex
+
+# Trend metric column of each tier's average PPG, e.g. 'tier_1_avg_ppg'
+TIER_AVG_COLUMNS = {name: name.split(' (')[0].lower().replace(' ', '_') + '_avg_ppg' for name in TIER_NAMES}
+TREND_METRICS = ['scarcity_score', 'drop_off', 'top_10_avg_ppg', 'median_ppg'] + list(TIER_AVG_COLUMNS.values())
+DEFAULT_TREND_WINDOW = 3
+DEFAULT_TREND_HALFLIFE = 1.0
+
+SCARCITY_COLUMNS = ['position', 'total_players', 'top_10_avg_ppg', 'median_ppg', 'drop_off', 'scarcity_score']
+
+# Analyses found or built this process: id(rankings) -> (weak reference to the rankings, analysis)
+_built = {}
+
+
+def rankings_hash(rankings):
+    """Content hash of a rankings DataFrame (values, index and column names)."""
+    digest = hashlib.sha256(",".join(map(str, rankings.columns)).encode())
+    digest.update(pd.util.hash_pandas_object(rankings, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+class PositionAnalysis:
+    """Scarcity and tier tables for every (season, position) of a rankings snapshot."""
+
+    def __init__(self, rankings_hash, scarcity, tiers, tier_index, trends=None):
+        """
+        Args:
+            rankings_hash: rankings_hash() of the rankings the tables describe
+            scarcity: DataFrame of scarcity metrics per (season, position)
+            tiers: DataFrame of tier statistics per (season, position, tier)
+            tier_index: TierIndex of the tier cut points
+            trends: Optional precomputed trends() table for the default windows
+        """
+        self.rankings_hash = rankings_hash
+        self.scarcity_table = scarcity
+        self.tier_table = tiers
+        self.tier_index = tier_index
+        self._scarcity = {season: rows[SCARCITY_COLUMNS] for season, rows in scarcity.groupby('season', sort=False)}
+        self._tiers = {key: rows for key, rows in tiers.groupby(['season', 'position'], sort=False, observed=True)}
+        self._trends = {}
+        if trends is not None:
+            self._trends[(DEFAULT_TREND_WINDOW, DEFAULT_TREND_HALFLIFE)] = trends
+        self._baselines = {}
+
+    @classmethod
+    def build(cls, rankings):
+        """
+        Compute the tables with one groupby pass per table.
+
+        Args:
+            rankings: Rankings DataFrame (season, position, points_per_game,
+                position_percentile)
+
+        Returns:
+            PositionAnalysis
+        """
+        data = rankings[['season', 'position', 'points_per_game', 'position_percentile']]
+
+        # Same Series arithmetic as the old per-position loop, so the rounded
+        # metrics match it exactly; groups keep their order of first appearance
+        rows = []
+        for (season, position), ppg in data.groupby(['season', 'position'], sort=False, observed=True)['points_per_game']:
+            top_10_ppg = ppg.nlargest(max(1, len(ppg) // 10)).mean()
+            median_ppg = ppg.median()
+            rows.append({
+                'season': season,
+                'position': position,
+                'total_players': len(ppg),
+                'top_10_avg_ppg': round(top_10_ppg, 2),
+                'median_ppg': round(median_ppg, 2),
+                'drop_off': round(top_10_ppg - median_ppg, 2),
+                'scarcity_score': round((top_10_ppg - median_ppg) / median_ppg, 2)
+            })
+        scarcity = pd.DataFrame(rows, columns=['season'] + SCARCITY_COLUMNS)
+
+        # Tier of every player by binary search on its group's cut points
+        tier_index = TierIndex.from_rankings(data)
+        ranked = data.dropna(subset=['position_percentile'])
+        tier_codes = np.empty(len(ranked), dtype=int)
+        for (season, position), rows in ranked.groupby(['season', 'position'], sort=False, observed=True).indices.items():
+            tier_codes[rows] = tier_index.assign(season, position, ranked['points_per_game'].to_numpy()[rows])
+        tiers = ranked.assign(tier=tier_codes).groupby(['season', 'position', 'tier'], observed=True)['points_per_game'].agg(
+            count='size', avg_ppg='mean', min_ppg='min', max_ppg='max'
+        ).reset_index()
+        tiers['tier'] = np.array(TIER_NAMES)[tiers['tier']]
+
+        analysis = cls(rankings_hash(rankings), scarcity, tiers, tier_index)
+        analysis.trends()  # Saved with the tables, so draft-time baselines are lookups
+        return analysis
+
+    @classmethod
+    def for_rankings(cls, rankings, path=DataLoader.POSITION_ANALYSIS_PATH):
+        """
+        Analysis of a rankings DataFrame: the saved one if it was built from
+        the same rankings, else built in memory. Shared per DataFrame.
+        """
+        entry = _built.get(id(rankings))
+        if entry is None or entry[0]() is not rankings:
+            analysis = DataLoader.load_position_analysis(path)
+            if analysis is None or analysis.rankings_hash != rankings_hash(rankings):
+                analysis = cls.build(rankings)
+            key = id(rankings)
+            entry = _built[key] = (weakref.ref(rankings, lambda _: _built.pop(key, None)), analysis)
+        return entry[1]
+
+    def save(self, path=DataLoader.POSITION_ANALYSIS_PATH):
+        """Persist the tables (with the rankings hash) as a pickle."""
+        pd.to_pickle({
+            'rankings_hash': self.rankings_hash,
+            'scarcity': self.scarcity_table,
+            'tiers': self.tier_table,
+            'tier_cuts': self.tier_index.cuts,
+            'trends': self.trends(),
+        }, path)
+
+    @classmethod
+    def load(cls, path=DataLoader.POSITION_ANALYSIS_PATH):
+        """Load tables saved by Step4TrainModel.py."""
+        saved = pd.read_pickle(path)
+        return cls(saved['rankings_hash'], saved['scarcity'], saved['tiers'], TierIndex(saved['tier_cuts']),
+                   saved['trends'])
+
+    def scarcity(self, season=2024):
+        """Scarcity metrics of a season's positions (see DraftRecommender.get_position_scarcity)."""
+        rows = self._scarcity.get(season)
+        if rows is None:
+            return pd.DataFrame(columns=SCARCITY_COLUMNS)
+        return rows.sort_values('scarcity_score', ascending=False).reset_index(drop=True)
+
+    def tier_breakdowns(self, position, season=2024):
+        """Tier statistics of a position (see DraftRecommender.get_tier_breakdowns)."""
+        rows = self._tiers.get((season, position))
+        if rows is None:
+            return {}
+        return {
+            tier: {'count': int(count), 'avg_ppg': float(avg), 'min_ppg': float(low), 'max_ppg': float(high)}
+            for tier, count, avg, low, high in zip(
+                rows['tier'], rows['count'], rows['avg_ppg'], rows['min_ppg'], rows['max_ppg'])
+        }
+
+    def trends(self, window=DEFAULT_TREND_WINDOW, halflife=DEFAULT_TREND_HALFLIFE):
+        """
+        Season-over-season trends of the scarcity metrics and tier averages.
+
+        Every metric in TREND_METRICS gets a '<metric>_rolling' column (mean
+        of the last `window` seasons) and a '<metric>_ewm' column
+        (exponentially weighted mean with the given half-life in seasons).
+        Both only look back, so a season's row blends that season and the
+        ones before it. Cached per (window, halflife).
+
+        Returns:
+            DataFrame with one row per (position, season), seasons ascending
+        """
+        key = (window, halflife)
+        if key not in self._trends:
+            metrics = self._season_metrics()
+            groups = metrics.groupby('position', sort=False, observed=True)[TREND_METRICS]
+            rolling = groups.rolling(window, min_periods=1).mean().reset_index(level=0, drop=True)
+            ewm = groups.ewm(halflife=halflife).mean().reset_index(level=0, drop=True)
+            self._trends[key] = metrics.join(rolling.add_suffix('_rolling')).join(ewm.add_suffix('_ewm'))
+        return self._trends[key]
+
+    def baseline_scarcity(self, season=2024, method='ewm', window=DEFAULT_TREND_WINDOW,
+                          halflife=DEFAULT_TREND_HALFLIFE):
+        """
+        Blended multi-season scarcity score of every position (cached).
+
+        Args:
+            season: Latest season in the blend
+            method: 'rolling' or 'ewm' (see trends), or 'season' for the season alone
+            window: Rolling window in seasons
+            halflife: EWM half-life in seasons
+
+        Returns:
+            Dict of position: scarcity score
+        """
+        key = (season, method, window, halflife)
+        if key not in self._baselines:
+            column = 'scarcity_score' if method == 'season' else f'scarcity_score_{method}'
+            rows = self.trends(window, halflife)
+            rows = rows[rows['season'] == season]
+            self._baselines[key] = dict(zip(rows['position'], rows[column].astype(float)))
+        return self._baselines[key]
+
+    def _season_metrics(self):
+        """Scarcity metrics and tier average PPG per (position, season)."""
+        tier_avgs = self.tier_table.pivot(index=['season', 'position'], columns='tier', values='avg_ppg')
+        tier_avgs = tier_avgs.reindex(columns=TIER_NAMES).rename(columns=TIER_AVG_COLUMNS)
+        metrics = self.scarcity_table.set_index(['season', 'position']).join(tier_avgs)
+        metrics = metrics.reset_index().sort_values(['position', 'season'], kind='stable')
+        return metrics[['position', 'season'] + TREND_METRICS].reset_index(drop=True)
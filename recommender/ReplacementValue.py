@@ -0,0 +1,137 @@
+"""
+Value over replacement player (VORP) tracking for a live draft.
+
+The replacement level for a position is the best player still available
+outside the league-wide starting pool:
+
+    starters_per_pos * league_size + share of (flex_spots * league_size)
+
+The flex share is split across flex_eligible positions in proportion to
+their starter counts. Each position keeps a pointer into its players sorted
+by PPG, so a pick only moves that pointer forward (amortized O(1)).
+"""
+import numpy as np
+import pandas as pd
+
+
+def get_replacement_counts(league_config):
+    """
+    Number of players at each position expected to start league-wide.
+
+    Args:
+        league_config: League configuration dict
+
+    Returns:
+        Dict of position: starters drafted before replacement level
+    """
+    league_size = league_config['league_size']
+    starters = league_config['starters_per_pos']
+
+    flex_total = league_config['flex_spots'] * league_size
+    flex_starters = sum(starters.get(pos, 0) for pos in league_config['flex_eligible'])
+
+    counts = {}
+    for pos, required in starters.items():
+        count = required * league_size
+        if pos in league_config['flex_eligible'] and flex_starters > 0:
+            count += flex_total * required / flex_starters
+        counts[pos] = int(round(count))
+
+    return counts
+
+
+class ReplacementTracker:
+    """Incrementally maintained replacement-level PPG per position."""
+
+    def __init__(self, rankings, league_config, season=2024):
+        """
+        Args:
+            rankings: Player rankings DataFrame
+            league_config: League configuration dict
+            season: Season the draft pool is taken from
+        """
+        season_data = rankings[rankings['season'] == season]
+        self.positions = list(league_config['starters_per_pos'].keys())
+        self.replacement_counts = get_replacement_counts(league_config)
+        pos_codes = {pos: code for code, pos in enumerate(self.positions)}
+
+        # Aligned with season_data for vectorized VORP
+        self._index = season_data.index
+        self._ppg = season_data['points_per_game'].to_numpy(dtype=float)
+        self._codes = season_data['position'].map(pos_codes).fillna(-1).to_numpy(dtype=int)
+
+        # Per position: PPG sorted descending and taken flags in that order
+        self._sorted_ppg = []
+        self._taken = []
+        self._slot = {}  # row index -> (position code, sorted slot)
+        self._pointer = np.zeros(len(self.positions), dtype=int)
+        self.replacement_ppg = np.zeros(len(self.positions))
+
+        for code, pos in enumerate(self.positions):
+            pos_data = season_data[season_data['position'] == pos].sort_values(
+                'points_per_game', ascending=False, kind='stable'
+            )
+            self._sorted_ppg.append(pos_data['points_per_game'].to_numpy(dtype=float))
+            self._taken.append(np.zeros(len(pos_data), dtype=bool))
+            for slot, row_id in enumerate(pos_data.index):
+                self._slot[row_id] = (code, slot)
+
+            self._pointer[code] = min(self.replacement_counts[pos], len(pos_data))
+            self._refresh(code)
+
+    def mark_drafted(self, player_index):
+        """Remove a drafted player from the pool and update its position's replacement level."""
+        if player_index not in self._slot:
+            return
+
+        code, slot = self._slot[player_index]
+        self._taken[code][slot] = True
+        if slot == self._pointer[code]:
+            self._advance(code)
+
+    def unmark_drafted(self, player_index):
+        """Return a player to the pool (undo of mark_drafted)."""
+        if player_index not in self._slot:
+            return
+
+        code, slot = self._slot[player_index]
+        self._taken[code][slot] = False
+        pos = self.positions[code]
+        if min(self.replacement_counts[pos], len(self._taken[code])) <= slot < self._pointer[code]:
+            self._pointer[code] = slot
+            self._refresh(code)
+
+    def get_replacement_levels(self):
+        """Replacement-level PPG per position as a dict."""
+        return {pos: round(float(ppg), 2) for pos, ppg in zip(self.positions, self.replacement_ppg)}
+
+    def vorp(self, index=None):
+        """
+        Value over replacement for players in the season pool.
+
+        Args:
+            index: Optional rankings indices to restrict the result to
+
+        Returns:
+            Series of PPG minus the current replacement level at the player's position
+        """
+        replacement = np.append(self.replacement_ppg, np.nan)[self._codes]
+        values = pd.Series(self._ppg - replacement, index=self._index)
+        if index is not None:
+            return values.reindex(index)
+        return values
+
+    def _advance(self, code):
+        """Move the pointer past drafted players."""
+        taken = self._taken[code]
+        pointer = self._pointer[code]
+        while pointer < len(taken) and taken[pointer]:
+            pointer += 1
+        self._pointer[code] = pointer
+        self._refresh(code)
+
+    def _refresh(self, code):
+        """Re-read the replacement PPG at the pointer (0 once the pool runs out)."""
+        pointer = self._pointer[code]
+        sorted_ppg = self._sorted_ppg[code]
+        self.replacement_ppg[code] = sorted_ppg[pointer] if pointer < len(sorted_ppg) else 0.0
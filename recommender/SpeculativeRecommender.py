@@ -0,0 +1,88 @@
+"""
+Speculative precomputation of the user's recommendations.
+
+While the computer seats pick, a background thread ranks the pool for the
+user's (unchanged) roster. The ranking goes deep enough to cover every
+player the opponents could take before the user's turn: top 2N for the FOL
+filter plus one per upcoming pick. Removing players never reorders the rest
+of the pool, so whatever the opponents actually draft, the remaining top 2N
+of the speculative ranking is exactly what get_recommendations would rank.
+The result is discarded if the user's roster or the request changed, or if
+the opponents somehow took more players than the ranking covered.
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from builder.LeagueLayout import compile_league_config
+
+
+class SpeculativeRecommender:
+    """Computes the user's next recommendations ahead of their turn."""
+
+    def __init__(self, recommender):
+        """
+        Args:
+            recommender: DraftRecommender for the draft in progress
+        """
+        self.recommender = recommender
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='speculate')
+        self._future = None
+        self._key = None
+        self._depth = 0
+        self.hits = 0
+        self.misses = 0
+
+    def speculate(self, roster, league_config, season=2024, top_n=10, upcoming_picks=0):
+        """
+        Start ranking the pool for the user's next turn in the background.
+
+        Args:
+            roster: The user's roster dict or count array (must not change before their turn)
+            league_config: League configuration dict
+            season: Season to get recommendations for
+            top_n: Number of recommendations the user's turn will ask for
+            upcoming_picks: Opponent picks before the user's next turn
+        """
+        recommender = self.recommender
+        position_needs = recommender.get_position_needs(roster, league_config)
+        if not position_needs:
+            self._future = None
+            return
+
+        # Warm the scarcity lookups here so the worker only reads shared state
+        recommender._get_position_lookups(season)
+
+        self._key = (compile_league_config(league_config).key(roster), season, top_n)
+        self._depth = top_n * 2 + upcoming_picks
+        self._future = self._executor.submit(
+            recommender.rank_available, position_needs, season, self._depth,
+            frozenset(recommender.drafted_players)
+        )
+
+    def get_recommendations(self, roster, league_config, season=2024, top_n=10):
+        """
+        Same as DraftRecommender.get_recommendations, using the speculative
+        ranking when it is still valid.
+        """
+        future, self._future = self._future, None
+
+        if future is not None and self._key == (compile_league_config(league_config).key(roster), season, top_n):
+            ranked = future.result()
+            remaining = ranked[~ranked.index.isin(self.recommender.drafted_players)]
+
+            # Valid if enough players are left, or the ranking already held the whole pool
+            if len(remaining) >= top_n * 2 or len(ranked) < self._depth:
+                self.hits += 1
+                if remaining.empty:
+                    return pd.DataFrame()
+                return self.recommender.finalize_recommendations(
+                    roster, remaining.head(top_n * 2), league_config, season
+                )
+
+        self.misses += 1
+        return self.recommender.get_recommendations(roster, league_config, season, top_n)
+
+    def shutdown(self):
+        """Stop the background worker."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,133 @@
+"""
+Tier cut points per (season, position) and live tier counts.
+
+Tiers are position_percentile bands. Percentiles rise with PPG within a
+position, so every band starts at a PPG cut point: the lowest PPG of the
+players at or above the band's percentile. With the cut points stored in
+ascending order, the tier of any batch of players is one np.searchsorted
+call instead of a boolean filter per tier.
+
+TierTracker keeps the number of undrafted players per (position, tier) for
+a season, so "players left in this tier" is an O(1) update per pick and an
+O(1) lookup.
+"""
+import numpy as np
+
+# Tier name -> lowest position_percentile in the tier (highest tier first)
+TIERS = {
+    'Elite (Top 10%)': 0.9,
+    'Tier 1 (Top 25%)': 0.75,
+    'Tier 2 (Top 50%)': 0.5,
+    'Tier 3 (Top 75%)': 0.25,
+    'Tier 4 (Bottom 25%)': -np.inf,
+}
+TIER_NAMES = list(TIERS)
+
+
+class TierIndex:
+    """PPG cut points of the percentile tiers for every (season, position)."""
+
+    def __init__(self, cuts):
+        """
+        Args:
+            cuts: Dict of (season, position) -> ascending array of the PPG
+                where Tier 3, Tier 2, Tier 1 and Elite start (inf when no
+                player reaches the tier)
+        """
+        self.cuts = cuts
+
+    @classmethod
+    def from_rankings(cls, rankings):
+        """Cut points from the rankings' points_per_game and position_percentile columns."""
+        data = rankings[['season', 'position', 'points_per_game', 'position_percentile']]
+        groups = list(data.groupby(['season', 'position'], sort=False, observed=True).groups)
+        bounds = np.array(list(TIERS.values())[-2::-1])  # Ascending, without the open bottom tier
+        cuts = {key: np.full(len(bounds), np.inf) for key in groups}
+        for i, bound in enumerate(bounds):
+            lowest = data[data['position_percentile'] >= bound].groupby(['season', 'position'], observed=True)['points_per_game'].min()
+            for key, ppg in lowest.items():
+                cuts[key][i] = ppg
+        return cls(cuts)
+
+    def assign(self, season, position, ppg):
+        """
+        Tier codes (0 = Elite, index into TIER_NAMES) for a batch of players.
+
+        Args:
+            season: Season
+            position: Position of every player (array), or one position for all
+            ppg: Points per game of every player
+
+        Returns:
+            Array of tier codes (-1 where the season/position has no tiers)
+        """
+        ppg = np.asarray(ppg, dtype=float)
+        if np.ndim(position) == 0:
+            cuts = self.cuts.get((season, position))
+            if cuts is None:
+                return np.full(ppg.shape, -1)
+            # Number of cut points at or below the PPG, counted from the bottom tier
+            return len(cuts) - np.searchsorted(cuts, ppg, side='right')
+
+        position = np.asarray(position)
+        tiers = np.full(ppg.shape, -1)
+        for pos in np.unique(position):
+            rows = position == pos
+            tiers[rows] = self.assign(season, pos, ppg[rows])
+        return tiers
+
+
+class TierTracker:
+    """Undrafted players per (position, tier) for one season, kept in sync with picks."""
+
+    def __init__(self, tier_index, rankings, season=2024):
+        """
+        Args:
+            tier_index: TierIndex of the rankings
+            rankings: Player rankings DataFrame
+            season: Season the draft pool is taken from
+        """
+        season_data = rankings[rankings['season'] == season]
+        self.positions = list(dict.fromkeys(season_data['position']))
+        self._codes = codes = {pos: code for code, pos in enumerate(self.positions)}
+        position_codes = season_data['position'].map(codes).to_numpy()
+        tiers = tier_index.assign(season, season_data['position'].to_numpy(), season_data['points_per_game'].to_numpy())
+
+        self.remaining = np.zeros((len(self.positions), len(TIER_NAMES)), dtype=int)
+        np.add.at(self.remaining, (position_codes, tiers), 1)
+        self.totals = self.remaining.copy()
+        # row index -> (position code, tier code)
+        self._slot = dict(zip(season_data.index.tolist(), zip(position_codes.tolist(), tiers.tolist())))
+        self._taken = set()
+
+    def mark_drafted(self, player_index):
+        """Remove a drafted player from its tier's count."""
+        slot = self._slot.get(player_index)
+        if slot is not None and player_index not in self._taken:
+            self._taken.add(player_index)
+            self.remaining[slot] -= 1
+
+    def unmark_drafted(self, player_index):
+        """Return a player to its tier's count (undo of mark_drafted)."""
+        if player_index in self._taken:
+            self._taken.discard(player_index)
+            self.remaining[self._slot[player_index]] += 1
+
+    def tier_of(self, player_index):
+        """Tier name of a player in the season pool (None if not in it)."""
+        slot = self._slot.get(player_index)
+        return None if slot is None else TIER_NAMES[slot[1]]
+
+    def tier_remaining(self, position, tier):
+        """Undrafted players left in a position's tier (name or code)."""
+        if position not in self._codes:
+            return 0
+        code = TIER_NAMES.index(tier) if isinstance(tier, str) else tier
+        return int(self.remaining[self._codes[position], code])
+
+    def player_tier_remaining(self, player_index):
+        """Tier name of a player and how many undrafted players are left in it."""
+        slot = self._slot.get(player_index)
+        if slot is None:
+            return None, 0
+        return TIER_NAMES[slot[1]], int(self.remaining[slot])
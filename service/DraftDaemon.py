@@ -0,0 +1,101 @@
+"""
+Warm daemon: keeps the rankings and recommenders loaded between commands.
+
+Listens on a Unix socket for newline-delimited JSON requests
+
+    {"method": "GET", "path": "/drafts/1/recommendations?seat=3", "body": {...}}
+
+and answers each with one line {"status": 200, "body": ...}, using the
+routes of service.DraftService. client.py is the thin front end.
+
+Run with: py -m service.DraftDaemon [--socket PATH]
+"""
+import argparse
+import asyncio
+import json
+import os
+
+from config.DaemonConfig import daemon_socket_path
+from service.DraftService import DraftManager, PlayerStore, to_json
+
+
+class DraftDaemon:
+    """Serves a DraftManager over a local Unix socket."""
+
+    def __init__(self, manager, socket_path=daemon_socket_path):
+        self.manager = manager
+        self.socket_path = socket_path
+        self.server = None
+
+    async def start(self):
+        """Bind the socket (replacing a stale one from a previous run)."""
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        self.server = await asyncio.start_unix_server(self._handle_connection, self.socket_path)
+        os.chmod(self.socket_path, 0o600)
+
+    async def serve_forever(self):
+        await self.start()
+        print(f"Draft daemon listening on {self.socket_path}")
+        try:
+            async with self.server:
+                await self.server.serve_forever()
+        except asyncio.CancelledError:
+            pass
+        finally:
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+
+    def handle(self, request):
+        """
+        Answer one request.
+
+        Returns:
+            Dict with 'status' and 'body'
+        """
+        method = str(request.get('method', 'GET')).upper()
+        path = request.get('path', '/')
+        if method == 'POST' and path == '/shutdown':
+            self.server.close()
+            return {'status': 200, 'body': {'stopping': True}}
+
+        body = request.get('body')
+        status, payload = self.manager.dispatch(method, path, to_json(body) if body is not None else b'')
+        return {'status': status, 'body': payload}
+
+    async def _handle_connection(self, reader, writer):
+        try:
+            while line := await reader.readline():
+                try:
+                    response = self.handle(json.loads(line))
+                except (ValueError, AttributeError) as e:
+                    response = {'status': 400, 'body': {'error': f"Bad request: {e}"}}
+                except Exception as e:
+                    # Answer instead of dropping the connection on an unexpected error
+                    response = {'status': 500, 'body': {'error': f"Internal error: {type(e).__name__}"}}
+                writer.write(to_json(response).encode() + b'\n')
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+def serve(socket_path=daemon_socket_path):
+    """Load the rankings once and serve until /shutdown."""
+    daemon = DraftDaemon(DraftManager(PlayerStore()), socket_path)
+    try:
+        asyncio.run(daemon.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Keep the draft assistant loaded behind a Unix socket")
+    parser.add_argument('--socket', default=daemon_socket_path)
+    args = parser.parse_args(argv)
+    serve(args.socket)
+
+
+if __name__ == "__main__":
+    main()
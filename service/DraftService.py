@@ -0,0 +1,272 @@
+"""
+Asyncio HTTP/JSON service hosting many drafts at once.
+
+Every draft shares one read-only PlayerStore (the rankings DataFrame is
+loaded once and never copied); a draft only owns its drafted set, rosters
+and small incremental caches (see live.LiveDraft.LiveDraftSession).
+
+Endpoints:
+    POST   /drafts                                  {"user_seat": 3} -> {"draft_id", ...}
+    GET    /drafts/<id>                             draft state
+    POST   /drafts/<id>/picks                       {"seat": 4, "position": "RB"} or {"seat": 4, "player": 937}
+    GET    /drafts/<id>/recommendations?seat=4&top_n=10
+    DELETE /drafts/<id>
+    GET    /analysis/scarcity                       position scarcity ranking
+    GET    /analysis/tiers/<POS>                    tier breakdown for a position
+
+Run with: py -m service.DraftService --port 8765
+"""
+import argparse
+import asyncio
+import itertools
+import json
+from urllib.parse import parse_qs, urlsplit
+
+from config.LeagueConfig import league_teams_default_config
+from live.LiveDraft import LiveDraftSession
+from recommender import DataLoader
+from recommender.DraftRecommender import DraftRecommender
+
+REASONS = {200: 'OK', 201: 'Created', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+           500: 'Internal Server Error'}
+
+
+def to_json(payload):
+    """JSON-encode a payload that may contain NumPy scalars."""
+    return json.dumps(payload, default=lambda value: value.item())
+
+
+class ServiceError(Exception):
+    """Request error reported to the client with an HTTP status."""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class PlayerStore:
+    """Rankings shared read-only by every hosted draft."""
+
+    def __init__(self, player_rankings_path="data/summary/player_rankings.csv", seasons=(2024,)):
+        """
+        Args:
+            player_rankings_path: Rankings CSV written by Step4TrainModel.py
+            seasons: Seasons whose scarcity and base values are computed up front
+        """
+        self.rankings = DataLoader.load_rankings(player_rankings_path)
+        # Never drafts from, so it also answers draft-independent analysis
+        self.analysis = DraftRecommender(rankings=self.rankings)
+        for season in seasons:
+            self.analysis._get_position_lookups(season)
+
+    def new_recommender(self):
+        """DraftRecommender over the shared rankings with its own draft state."""
+        recommender = DraftRecommender(rankings=self.rankings)
+        recommender.share_season_caches(self.analysis)
+        return recommender
+
+
+class DraftManager:
+    """Per-draft state plus request routing (transport independent)."""
+
+    def __init__(self, store, league_config=None):
+        self.store = store
+        self.league_config = league_config or league_teams_default_config
+        self.drafts = {}
+        self._ids = itertools.count(1)
+
+    def create_draft(self, user_seat=1, season=2024):
+        """Start a new draft; returns its state."""
+        if not 1 <= user_seat <= self.league_config['league_size']:
+            raise ServiceError(400, f"user_seat must be between 1 and {self.league_config['league_size']}")
+
+        draft_id = str(next(self._ids))
+        self.drafts[draft_id] = LiveDraftSession(
+            self.store.new_recommender(), self.league_config, user_seat, season
+        )
+        return self.get_state(draft_id)
+
+    def get_state(self, draft_id):
+        """Summary of a draft: seat on the clock, rosters and picks so far."""
+        session = self._get(draft_id)
+        return {
+            'draft_id': draft_id,
+            'league_size': session.num_teams,
+            'rounds': len(session.order) // session.num_teams,
+            'user_seat': session.user_seat,
+            'on_the_clock': session.current_seat(),
+            'picks_made': len(session.picks),
+            'rosters': {str(seat): roster for seat, roster in session.rosters.items()},
+        }
+
+    def pick(self, draft_id, event):
+        """Apply a pick event to a draft."""
+        session = self._get(draft_id)
+        try:
+            pick = session.apply_event({
+                'seat': int(event['seat']),
+                **({'player': int(event['player'])} if 'player' in event
+                   else {'position': str(event['position']).upper()}),
+                **({'overall_pick': int(event['overall_pick'])} if event.get('overall_pick') is not None else {}),
+            })
+        except (KeyError, TypeError, ValueError) as e:
+            raise ServiceError(400, f"Invalid pick: {e}")
+
+        return pick
+
+    def recommend(self, draft_id, seat, top_n=10):
+        """Recommendations for a seat (the user's seat reuses its ranked pool)."""
+        session = self._get(draft_id)
+        if seat not in session.rosters:
+            raise ServiceError(400, f"Unknown seat {seat}")
+
+        if seat == session.user_seat:
+            recs = session.get_recommendations(top_n=top_n)
+        else:
+            recs = session.recommender.get_recommendations(
+                session.rosters[seat], self.league_config, session.season, top_n
+            )
+        if recs.empty:
+            return []
+        return recs.head(top_n).rename_axis('player').reset_index().to_dict('records')
+
+    def get_scarcity(self, season=2024):
+        """Position scarcity ranking (see DraftRecommender.get_position_scarcity)."""
+        return self.store.analysis.get_position_scarcity(season).to_dict('records')
+
+    def get_tiers(self, position, season=2024):
+        """Tier breakdown for a position (see DraftRecommender.get_tier_breakdowns)."""
+        tiers = self.store.analysis.get_tier_breakdowns(position.upper(), season)
+        if not tiers:
+            raise ServiceError(404, f"No data available for {position}")
+        return tiers
+
+    def delete_draft(self, draft_id):
+        """Drop a finished draft."""
+        self._get(draft_id)
+        del self.drafts[draft_id]
+        return {'deleted': draft_id}
+
+    def dispatch(self, method, target, body=b''):
+        """
+        Route a request.
+
+        Returns:
+            Tuple of (HTTP status, JSON-serializable payload)
+        """
+        url = urlsplit(target)
+        parts = [part for part in url.path.split('/') if part]
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+
+        try:
+            payload = json.loads(body) if body else {}
+            if not isinstance(payload, dict):
+                raise ServiceError(400, "Request body must be a JSON object")
+            if parts == ['drafts'] and method == 'POST':
+                return 201, self.create_draft(int(payload.get('user_seat', 1)), int(payload.get('season', 2024)))
+            if len(parts) == 2 and parts[0] == 'drafts':
+                if method == 'GET':
+                    return 200, self.get_state(parts[1])
+                if method == 'DELETE':
+                    return 200, self.delete_draft(parts[1])
+                raise ServiceError(405, f"{method} not allowed")
+            if len(parts) == 3 and parts[0] == 'drafts' and parts[2] == 'picks':
+                if method != 'POST':
+                    raise ServiceError(405, f"{method} not allowed")
+                return 201, self.pick(parts[1], payload)
+            if len(parts) == 3 and parts[0] == 'drafts' and parts[2] == 'recommendations':
+                if method != 'GET':
+                    raise ServiceError(405, f"{method} not allowed")
+                seat = int(query.get('seat', self._get(parts[1]).user_seat))
+                return 200, self.recommend(parts[1], seat, int(query.get('top_n', 10)))
+            if parts[:1] == ['analysis'] and method == 'GET':
+                season = int(query.get('season', 2024))
+                if parts[1:] == ['scarcity']:
+                    return 200, self.get_scarcity(season)
+                if len(parts) == 3 and parts[1] == 'tiers':
+                    return 200, self.get_tiers(parts[2], season)
+            raise ServiceError(404, f"No route for {method} {url.path}")
+        except ServiceError as e:
+            return e.status, {'error': str(e)}
+        except (TypeError, ValueError) as e:
+            # Malformed JSON or fields of the wrong type (e.g. null where a number is expected)
+            return 400, {'error': str(e)}
+
+    def _get(self, draft_id):
+        if draft_id not in self.drafts:
+            raise ServiceError(404, f"Unknown draft {draft_id}")
+        return self.drafts[draft_id]
+
+
+class DraftService:
+    """Minimal HTTP/1.1 (keep-alive) JSON server around a DraftManager."""
+
+    def __init__(self, manager):
+        self.manager = manager
+        self.server = None
+
+    async def start(self, host='127.0.0.1', port=8765):
+        """Start listening; returns the bound port."""
+        self.server = await asyncio.start_server(self._handle_connection, host, port)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self, host='127.0.0.1', port=8765):
+        port = await self.start(host, port)
+        print(f"Draft service listening on http://{host}:{port}")
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def _handle_connection(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, target, _ = request_line.decode('latin-1').split(' ', 2)
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                length = int(headers.get('content-length', 0))
+                body = await reader.readexactly(length) if length else b''
+
+                try:
+                    status, payload = self.manager.dispatch(method, target, body)
+                except Exception as e:
+                    # Answer instead of dropping the connection on an unexpected error
+                    status, payload = 500, {'error': f"Internal error: {type(e).__name__}"}
+                data = to_json(payload).encode()
+                writer.write(
+                    f"HTTP/1.1 {status} {REASONS.get(status, 'Error')}\r\n"
+                    f"Content-Type: application/json\r\nContent-Length: {len(data)}\r\n\r\n".encode() + data
+                )
+                await writer.drain()
+
+                if headers.get('connection', '').lower() == 'close':
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve drafts over HTTP/JSON")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    args = parser.parse_args(argv)
+
+    service = DraftService(DraftManager(PlayerStore()))
+    try:
+        asyncio.run(service.serve_forever(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
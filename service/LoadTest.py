@@ -0,0 +1,144 @@
+"""
+Load test for the draft service: many drafts running concurrently.
+
+Each simulated client opens one keep-alive connection, creates a draft and
+then walks the snake order: for every pick it asks for recommendations for
+the seat on the clock and drafts the top recommended player. Reports
+throughput and latency percentiles over all requests.
+
+Run with: py -m service.LoadTest --drafts 200 --rounds 3
+(starts the service in a subprocess unless --port is given)
+"""
+import argparse
+import asyncio
+import json
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+
+class HttpClient:
+    """Tiny keep-alive HTTP/1.1 JSON client on asyncio streams."""
+
+    def __init__(self, reader, writer, latencies):
+        self.reader = reader
+        self.writer = writer
+        self.latencies = latencies
+
+    @classmethod
+    async def connect(cls, host, port, latencies):
+        reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer, latencies)
+
+    async def request(self, method, path, payload=None):
+        body = json.dumps(payload).encode() if payload is not None else b''
+        start = time.perf_counter()
+        self.writer.write(
+            f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body
+        )
+        await self.writer.drain()
+
+        status = int((await self.reader.readline()).split()[1])
+        length = 0
+        while True:
+            line = await self.reader.readline()
+            if line in (b'\r\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            if name.lower() == 'content-length':
+                length = int(value)
+        data = await self.reader.readexactly(length)
+        self.latencies.append(time.perf_counter() - start)
+        return status, json.loads(data)
+
+    def close(self):
+        self.writer.close()
+
+
+async def run_draft(host, port, rounds, latencies, errors):
+    """Drive one draft through `rounds` rounds of picks."""
+    client = await HttpClient.connect(host, port, latencies)
+    try:
+        status, draft = await client.request('POST', '/drafts', {'user_seat': 1})
+        draft_path = f"/drafts/{draft['draft_id']}"
+        num_teams = draft['league_size']
+
+        for overall in range(rounds * num_teams):
+            round_index, slot = divmod(overall, num_teams)
+            seat = slot + 1 if round_index % 2 == 0 else num_teams - slot
+
+            status, recs = await client.request('GET', f"{draft_path}/recommendations?seat={seat}&top_n=5")
+            if status != 200 or not recs:
+                errors.append(status)
+                break
+            status, _ = await client.request('POST', f"{draft_path}/picks", {'seat': seat, 'player': recs[0]['player']})
+            if status != 201:
+                errors.append(status)
+
+        await client.request('DELETE', draft_path)
+    finally:
+        client.close()
+
+
+async def run_load(host, port, drafts, rounds):
+    latencies, errors = [], []
+    start = time.perf_counter()
+    await asyncio.gather(*(run_draft(host, port, rounds, latencies, errors) for _ in range(drafts)))
+    elapsed = time.perf_counter() - start
+
+    latencies = np.array(latencies) * 1000
+    return {
+        'drafts': drafts,
+        'requests': len(latencies),
+        'errors': len(errors),
+        'elapsed_s': round(elapsed, 2),
+        'throughput_rps': round(len(latencies) / elapsed, 1),
+        'p50_ms': round(float(np.percentile(latencies, 50)), 2),
+        'p99_ms': round(float(np.percentile(latencies, 99)), 2),
+        'max_ms': round(float(latencies.max()), 2),
+    }
+
+
+async def _wait_for_port(host, port, timeout=30.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            _, writer = await asyncio.open_connection(host, port)
+            writer.close()
+            return
+        except OSError:
+            if time.monotonic() >= deadline:
+                raise
+            await asyncio.sleep(0.1)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test the draft service")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, help="Use a running service instead of starting one")
+    parser.add_argument('--drafts', type=int, default=200, help="Concurrent drafts")
+    parser.add_argument('--rounds', type=int, default=3, help="Rounds to draft in each")
+    args = parser.parse_args(argv)
+
+    server = None
+    port = args.port
+    if port is None:
+        port = 8799
+        server = subprocess.Popen([sys.executable, '-m', 'service.DraftService', '--port', str(port)],
+                                  stdout=subprocess.DEVNULL)
+    try:
+        asyncio.run(_wait_for_port(args.host, port))
+        result = asyncio.run(run_load(args.host, port, args.drafts, args.rounds))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    for key, value in result.items():
+        print(f"{key:>15}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Snake draft ordering helpers.
+"""
+
+
+def snake_order(num_teams, total_rounds):
+    """
+    Full pick order for a snake draft.
+
+    Args:
+        num_teams: Number of teams in the league
+        total_rounds: Number of rounds
+
+    Returns:
+        List of (round, overall_pick, seat) tuples; seats are 1-based
+    """
+    order = []
+    for current_round in range(1, total_rounds + 1):
+        if current_round % 2 == 1:  # Odd rounds: normal order
+            seats = range(1, num_teams + 1)
+        else:  # Even rounds: backwards draft order
+            seats = range(num_teams, 0, -1)
+        for seat in seats:
+            order.append((current_round, len(order) + 1, seat))
+
+    return order
+
+
+def picks_until_next_turn(seat, overall_pick, num_teams, total_rounds):
+    """
+    Seats that pick after the given pick and before this seat's next turn.
+
+    Args:
+        seat: Drafting seat (1-based)
+        overall_pick: Current overall pick number (1-based)
+        num_teams: Number of teams in the league
+        total_rounds: Number of rounds
+
+    Returns:
+        List of seats in pick order, or None if the seat has no later pick
+    """
+    upcoming = []
+    for _, pick, drafter in snake_order(num_teams, total_rounds)[overall_pick:]:
+        if drafter == seat:
+            return upcoming
+        upcoming.append(drafter)
+
+    return None
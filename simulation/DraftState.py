@@ -0,0 +1,240 @@
+"""
+Persistent, structurally shared draft state for what-if exploration.
+
+A DraftState is never modified; pick() returns a new state that shares
+everything it did not change with its parent:
+- drafted set: an int bitmask over the season pool (each position's
+  players are a contiguous bit range sorted by PPG)
+- rosters: a tuple of per-seat roster tuples; a pick replaces one seat
+- best-available pointers and scarcity: per-position tuples; a pick only
+  invalidates its own position
+- history: a linked list of (seat, player) back to the fork root
+Forking is O(1) (states can simply be shared), so thousands of branches
+can be simulated forward and compared side by side.
+"""
+import numpy as np
+
+from builder.LeagueLayout import compile_league_config
+from recommender.DraftRecommender import DraftRecommender
+from simulation.OpponentModel import OpponentModel
+
+
+class DraftPool:
+    """Season data shared by every branch (built once per draft)."""
+
+    def __init__(self, recommender, league_config, season=2024):
+        """
+        Args:
+            recommender: DraftRecommender for the draft in progress
+            league_config: League configuration dict
+            season: Season the draft pool is taken from
+        """
+        self.league_config = league_config
+        self.season = season
+        self.layout = compile_league_config(league_config)
+
+        # Opponent model over the full pool, so its tables index by PPG rank
+        full_pool = DraftRecommender(rankings=recommender.rankings, strategy_config=recommender.strategy_config)
+        full_pool.share_season_caches(recommender)
+        self.model = OpponentModel(full_pool, league_config, season)
+        self.positions = self.model.positions
+        self.codes = {pos: code for code, pos in enumerate(self.positions)}
+
+        sizes = [len(row_ids) for row_ids in self.model.row_ids]
+        self.offsets = np.concatenate([[0], np.cumsum(sizes)])
+        self.sizes = sizes
+        self.labels = np.concatenate(self.model.row_ids).tolist()
+        self.bit_of = {label: bit for bit, label in enumerate(self.labels)}
+        self.ppg = np.concatenate([self.model.ppg[code, :size] for code, size in enumerate(sizes)])
+
+    def root(self, all_rosters, drafted_players=()):
+        """
+        State of the draft as it stands.
+
+        Args:
+            all_rosters: (seats, columns) roster array as kept by run_draft (or dict of seat: roster dict)
+            drafted_players: Rankings indexes already drafted
+        """
+        drafted = 0
+        for label in drafted_players:
+            bit = self.bit_of.get(label)
+            if bit is not None:
+                drafted |= 1 << bit
+
+        rosters = tuple(map(tuple, self.layout.stack(all_rosters).tolist()))
+        return DraftState(self, drafted, rosters, tuple(self.offsets[:-1].tolist()),
+                          (None,) * len(self.positions), None)
+
+
+class DraftState:
+    """Immutable snapshot of a draft; see the module docstring."""
+
+    __slots__ = ('pool', 'drafted', 'rosters', '_pointers', '_scarcity', 'history')
+
+    def __init__(self, pool, drafted, rosters, pointers, scarcity, history):
+        self.pool = pool
+        self.drafted = drafted
+        self.rosters = rosters
+        self._pointers = pointers
+        self._scarcity = scarcity
+        self.history = history
+
+    def fork(self):
+        """O(1) copy that can diverge independently."""
+        return DraftState(self.pool, self.drafted, self.rosters, self._pointers, self._scarcity, self.history)
+
+    def roster(self, seat):
+        """Roster dict for a seat (a fresh copy)."""
+        return self.pool.layout.decode(self.rosters[seat - 1])
+
+    @property
+    def drafted_players(self):
+        """Frozenset of drafted rankings indexes."""
+        mask, labels = self.drafted, self.pool.labels
+        return frozenset(labels[bit] for bit in range(mask.bit_length()) if mask >> bit & 1)
+
+    def best_available(self, position):
+        """Rankings index of the best available player at a position (None if none left)."""
+        bit = self._best_bit(self.pool.codes[position])
+        return None if bit is None else self.pool.labels[bit]
+
+    def _best_bit(self, code):
+        pool = self.pool
+        end = pool.offsets[code + 1]
+        bit = self._pointers[code]
+        while bit < end and self.drafted >> bit & 1:
+            bit += 1
+        if bit != self._pointers[code]:
+            # Only a cache: advancing past drafted bits is valid for every fork sharing it
+            self._pointers = self._pointers[:code] + (bit,) + self._pointers[code + 1:]
+        return bit if bit < end else None
+
+    def pick(self, seat, position=None, player=None):
+        """
+        State after a seat drafts a player (or the best available at a position).
+
+        Raises:
+            ValueError: If the player is not available or the position is empty
+        """
+        pool = self.pool
+        if player is not None:
+            bit = pool.bit_of.get(player)
+            if bit is None or self.drafted >> bit & 1:
+                raise ValueError(f"Player {player} is not available")
+            code = int(np.searchsorted(pool.offsets, bit, side='right') - 1)
+        else:
+            code = pool.codes[position]
+            bit = self._best_bit(code)
+            if bit is None:
+                raise ValueError(f"No available players at {position}")
+
+        # Like run_draft, the player is taken even if the roster has no room
+        roster = np.array(self.rosters[seat - 1])
+        pool.layout.add_pick(roster, pool.positions[code])
+        rosters = self.rosters[:seat - 1] + (tuple(roster.tolist()),) + self.rosters[seat:]
+        scarcity = self._scarcity[:code] + (None,) + self._scarcity[code + 1:]
+
+        return DraftState(pool, self.drafted | 1 << bit, rosters, self._pointers, scarcity,
+                          (seat, pool.labels[bit], self.history))
+
+    def scarcity(self, position):
+        """Scarcity of the players still available at a position (as in get_live_scarcity)."""
+        code = self.pool.codes[position]
+        if self._scarcity[code] is None:
+            pool = self.pool
+            start, size = pool.offsets[code], pool.sizes[code]
+            bits = (self.drafted >> int(start)) & ((1 << size) - 1)
+            taken = np.unpackbits(np.frombuffer(bits.to_bytes((size + 7) // 8, 'little'), dtype=np.uint8),
+                                  bitorder='little')[:size].astype(bool)
+            ppg = pool.ppg[start:start + size][~taken]
+
+            stats = None
+            if len(ppg):
+                top_10_ppg = ppg[:max(1, len(ppg) // 10)].mean()  # pool is sorted by PPG
+                median_ppg = float(np.median(ppg))
+                stats = {
+                    'position': position,
+                    'total_players': len(ppg),
+                    'top_10_avg_ppg': round(top_10_ppg, 2),
+                    'median_ppg': round(median_ppg, 2),
+                    'drop_off': round(top_10_ppg - median_ppg, 2),
+                    'scarcity_score': round((top_10_ppg - median_ppg) / median_ppg, 2)
+                }
+            self._scarcity = self._scarcity[:code] + (stats,) + self._scarcity[code + 1:]
+        return self._scarcity[code]
+
+    def picks(self):
+        """(seat, player) picks made since the fork root, oldest first."""
+        picks, node = [], self.history
+        while node is not None:
+            seat, player, node = node
+            picks.append((seat, player))
+        return picks[::-1]
+
+    def simulate(self, seats, rng, branches=1):
+        """
+        Play picks forward with the computer drafters' policy (OpponentModel),
+        in independent branches simulated together as arrays.
+
+        Args:
+            seats: Seats to pick, in order
+            rng: numpy Generator
+            branches: Number of branches to simulate
+
+        Returns:
+            List of final DraftStates, one per branch
+        """
+        pool, model = self.pool, self.pool.model
+        n_positions = len(pool.positions)
+
+        # Simulated picks always take the best available, so a branch is fully
+        # described by how many of each position's available players it took
+        available = [
+            [bit for bit in range(self._pointers[code], int(pool.offsets[code + 1])) if not self.drafted >> bit & 1]
+            for code in range(n_positions)
+        ]
+        depth = max(len(bits) for bits in available)
+        ranks_table = np.array([
+            [bit - pool.offsets[code] for bit in bits] + [pool.sizes[code]] * (depth + 1 - len(bits))
+            for code, bits in enumerate(available)
+        ])
+
+        rosters = np.repeat(np.array(self.rosters)[None], branches, axis=0)
+        taken = np.zeros((branches, n_positions), dtype=int)
+        chosen_log = np.empty((len(seats), branches), dtype=int)
+        nth_log = np.empty((len(seats), branches), dtype=int)
+        rows = np.arange(branches)
+        for step, seat in enumerate(seats):
+            ranks = ranks_table[np.arange(n_positions), np.minimum(taken, depth)]
+            seat_rosters = rosters[:, seat - 1]
+            chosen = model.choose(seat_rosters, ranks, rng)
+            model.add_picks(seat_rosters, chosen)
+
+            picked = chosen >= 0
+            codes = np.where(picked, chosen, 0)
+            nth_log[step] = taken[rows, codes]
+            chosen_log[step] = chosen
+            taken[rows[picked], codes[picked]] += 1
+
+        states = []
+        for chosen, nths, counts, roster in zip(chosen_log.T.tolist(), nth_log.T.tolist(),
+                                                taken.tolist(), rosters.tolist()):
+            drafted, history = self.drafted, self.history
+            for seat, code, nth in zip(seats, chosen, nths):
+                if code >= 0:
+                    bit = available[code][nth]
+                    drafted |= 1 << bit
+                    history = (seat, pool.labels[bit], history)
+
+            pointers = tuple(
+                bits[count] if count < len(bits) else int(pool.offsets[code + 1])
+                for code, (bits, count) in enumerate(zip(available, counts))
+            )
+            scarcity = tuple(stats if count == 0 else None for stats, count in zip(self._scarcity, counts))
+            states.append(DraftState(pool, drafted, tuple(map(tuple, roster)), pointers, scarcity, history))
+        return states
+
+    def drafted_ppg(self, seat):
+        """Total PPG of the players a seat drafted since the fork root."""
+        pool = self.pool
+        return float(sum(pool.ppg[pool.bit_of[player]] for pick_seat, player in self.picks() if pick_seat == seat))
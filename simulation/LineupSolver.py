@@ -0,0 +1,132 @@
+"""
+Optimal starting lineups for batches of rosters.
+
+With dedicated starter slots per position plus FLEX slots shared by the
+flex_eligible positions, starting each position's best players and then
+filling FLEX with the best remaining eligible players is optimal (any other
+lineup can swap a better player in without losing points).
+
+Rosters are packed as (..., positions, depth) point arrays, one row per
+position in LeagueLayout order and 0 for empty spots. Every roster then has
+the same shape, so a batch is solved with array operations over whole
+roster-spot columns: no per-roster Python. An empty slot scores 0, so a player with
+negative points is left out rather than started.
+"""
+import numpy as np
+
+from builder.LeagueLayout import compile_league_config
+
+
+class LineupSolver:
+    """Best starting lineup points for packed rosters of projected points."""
+
+    def __init__(self, league_config):
+        """
+        Args:
+            league_config: League configuration dict (starters_per_pos,
+                flex_spots and flex_eligible are used)
+        """
+        self.layout = layout = compile_league_config(league_config)
+        self.positions = layout.positions
+        self.required = layout.required
+        self.flex_eligible = layout.flex_eligible
+        self.flex_spots = layout.flex_spots
+
+    def pack(self, positions, points, depth=None):
+        """
+        Pack rosters into a (rosters, positions, depth) array.
+
+        Args:
+            positions: Per roster, the position of each player
+            points: Per roster, each player's points (same shape as positions)
+            depth: Slots per position (default: the most players any roster
+                has at one position)
+
+        Returns:
+            Float array, 0 where a roster has no player
+        """
+        index = {pos: code for code, pos in enumerate(self.positions)}
+        codes = [[index[pos] for pos in roster] for roster in positions]
+        if depth is None:
+            depth = max([max(np.bincount(roster), default=0) for roster in codes], default=0)
+
+        packed = np.zeros((len(codes), len(self.positions), max(depth, 1)))
+        for row, (roster, roster_points) in enumerate(zip(codes, points)):
+            filled = [0] * len(self.positions)
+            for code, value in zip(roster, roster_points):
+                packed[row, code, filled[code]] = value
+                filled[code] += 1
+        return packed
+
+    def solve(self, points):
+        """
+        Optimal starting points per roster.
+
+        Args:
+            points: (..., positions, depth) packed points (see pack)
+
+        Returns:
+            (...) array of starting lineup points
+        """
+        return self.solve_columns([
+            [points[..., code, slot] for slot in range(points.shape[-1])]
+            for code in range(len(self.positions))
+        ])
+
+    def solve_columns(self, columns, overwrite=False):
+        """
+        solve() for rosters given as one list of (...) arrays per position,
+        an array per roster spot (in any order, 0 where empty). Positions can
+        have different depths, and contiguous arrays are faster than slices
+        of a packed array, so simulations can draw them directly.
+
+        Args:
+            columns: columns[code] is a list of equal-shape arrays
+            overwrite: Allow the arrays to be overwritten (saves a copy)
+
+        Returns:
+            (...) array of starting lineup points
+        """
+        total = 0.0
+        leftovers = []
+        for code, players in enumerate(columns):
+            required = int(self.required[code])
+            eligible = bool(self.flex_eligible[code])
+            # Only the best `required` (plus FLEX candidates) can start
+            keep = min(required + (self.flex_spots if eligible else 0), len(players))
+            if keep == 0:
+                continue
+
+            # Best first with a compare-exchange network over whole arrays
+            # (depth is tiny, so this beats np.sort's per-row cost)
+            players = [values if overwrite else np.array(values) for values in players]
+            _bubble(players, keep)
+
+            # Leaving a slot empty (0) beats starting a player with negative
+            # points; clamping after the sort keeps the order
+            for values in players[:required]:
+                total = total + np.maximum(values, 0)
+            if eligible:
+                leftovers.extend(players[required:keep])
+
+        # FLEX: best of the eligible players left over after the starters
+        flex_spots = min(self.flex_spots, len(leftovers))
+        if flex_spots:
+            _bubble(leftovers, flex_spots)
+            for values in leftovers[:flex_spots]:
+                total = total + np.maximum(values, 0)
+        return total
+
+
+def _bubble(columns, passes):
+    """
+    Bubble the `passes` largest of a list of equal-shape arrays to its front,
+    in order. Works in place with one spare buffer (the arrays are overwritten).
+    """
+    spare = np.empty_like(columns[0])
+    for done in range(passes):
+        for col in range(len(columns) - 1, done, -1):
+            low, high = columns[col], columns[col - 1]
+            np.maximum(low, high, out=spare)
+            np.minimum(low, high, out=low)
+            columns[col - 1], spare = spare, high
@@ -0,0 +1,226 @@
+"""
+Time-budgeted lookahead search for the user's pick.
+
+Depth-limited expectimax over the user's future picks. At each user turn the
+search tries every position the roster can still take (the best available
+player at that position); the opponents' picks until the user's next turn
+are sampled from OpponentModel, the same policy the computer drafters use.
+
+The search deepens one user pick at a time until the deadline. Results from
+the last fully searched depth are returned, so there is always a
+best-so-far answer when time runs out. Node values are cached in a
+transposition table keyed on (user roster counts, drafted-set hash).
+"""
+import time
+
+import numpy as np
+
+from simulation.DraftOrder import snake_order
+from simulation.OpponentModel import OpponentModel
+
+
+class _DeadlineReached(Exception):
+    """Raised inside the search when the wall-clock deadline passes."""
+
+
+class LookaheadSearch:
+    """Anytime expectimax search over the user's upcoming picks."""
+
+    def __init__(self, recommender, league_config, season=2024, samples=8, bench_weight=0.25):
+        """
+        Args:
+            recommender: DraftRecommender for the draft in progress
+            league_config: League configuration dict
+            season: Season the draft pool is taken from
+            samples: Sampled opponent outcomes per user action
+            bench_weight: Share of a bench player's PPG counted towards roster value
+        """
+        self.model = OpponentModel(recommender, league_config, season)
+        self.recommender = recommender
+        self.num_teams = league_config['league_size']
+        self.samples = samples
+        self.bench_weight = bench_weight
+        self._refreshed_for = None
+
+    def search(self, all_rosters, seat, overall_pick, total_rounds, time_budget=0.5,
+               candidates=None, max_depth=8, seed=None):
+        """
+        Search for the best position to draft now.
+
+        Args:
+            all_rosters: (seats, columns) roster array as kept by run_draft (or dict of seat: roster dict)
+            seat: The user's seat (1-based)
+            overall_pick: Current overall pick number (the user's pick)
+            total_rounds: Number of rounds in the draft
+            time_budget: Wall-clock budget in seconds
+            candidates: Optional positions allowed at the root
+            max_depth: Maximum number of user picks to look ahead
+            seed: Optional random seed
+
+        Returns:
+            Dict with the suggested 'position', per-position 'values',
+            the completed 'depth', searched 'nodes' and 'elapsed' seconds
+        """
+        # The budget covers the whole call, including re-reading the pool
+        start = time.perf_counter()
+        self._deadline = start + time_budget
+        self._rng = np.random.default_rng(seed)
+        self._table = {}
+        self._nodes = 0
+
+        model = self.model
+        drafted = frozenset(self.recommender.drafted_players)
+        pool_key = (id(self.recommender.rankings), drafted)
+        if pool_key != self._refreshed_for:
+            model.refresh()
+            self._refreshed_for = pool_key
+        self._drafted_hash = hash(drafted)
+
+        # segments[i] = opponent seats (0-based) picking after the user's i-th remaining pick
+        self._segments = []
+        for _, _, drafter in snake_order(self.num_teams, total_rounds)[overall_pick - 1:]:
+            if drafter == seat:
+                self._segments.append([])
+            elif self._segments:
+                self._segments[-1].append(drafter - 1)
+
+        opponents = model.layout.stack(all_rosters)
+        user = opponents[seat - 1]
+        taken = np.zeros(len(model.positions), dtype=int)
+
+        actions = self._actions(user, taken)
+        if candidates is not None:
+            allowed = [model.positions.index(pos) for pos in candidates if pos in model.positions]
+            actions = [code for code in actions if code in allowed]
+
+        if not actions:
+            return {'position': None, 'values': {}, 'depth': 0, 'nodes': 0,
+                    'elapsed': time.perf_counter() - start}
+
+        # Fallback before any depth completes: best immediate value
+        values = {code: self._gain(user, taken, code) for code in actions}
+        depth_done = 0
+
+        if time.perf_counter() >= self._deadline:
+            max_depth = 0  # The pool refresh used up the budget
+        for depth in range(1, max_depth + 1):
+            try:
+                values = {
+                    code: self._action_value(user, opponents, taken, code, level=0, depth=depth)
+                    for code in actions
+                }
+                depth_done = depth
+            except _DeadlineReached:
+                break
+            if depth >= len(self._segments):
+                break  # Searched to the user's last pick
+
+        best = max(actions, key=lambda code: values[code])
+        return {
+            'position': model.positions[best],
+            'values': {model.positions[code]: round(float(values[code]), 2) for code in actions},
+            'depth': depth_done,
+            'nodes': self._nodes,
+            'elapsed': time.perf_counter() - start,
+        }
+
+    def _node_value(self, user, opponents, taken, level, depth):
+        """Value-to-go of a user decision node (max over actions)."""
+        if depth == 0 or level >= len(self._segments):
+            return self._leaf_value(user, taken[None])[0]
+
+        key = (tuple(user), self._drafted_hash, tuple(taken), level)
+        cached = self._table.get(key)
+        if cached is not None and cached[0] >= depth:
+            return cached[1]
+
+        actions = self._actions(user, taken)
+        if not actions:
+            value = 0.0
+        else:
+            value = max(self._action_value(user, opponents, taken, code, level, depth) for code in actions)
+
+        self._table[key] = (depth, value)
+        return value
+
+    def _action_value(self, user, opponents, taken, code, level, depth):
+        """Gain of drafting a position now plus the expected value after the opponents pick."""
+        if time.perf_counter() > self._deadline:
+            raise _DeadlineReached()
+        self._nodes += 1
+
+        model = self.model
+        gain = self._gain(user, taken, code)
+        user_after = user[None].copy()
+        model.add_picks(user_after, np.array([code]))
+        user_after = user_after[0]
+
+        taken_after = taken.copy()
+        taken_after[code] += 1
+
+        segment = self._segments[level]
+        samples = self.samples if segment else 1
+        sampled_taken = np.repeat(taken_after[None], samples, axis=0)
+        sampled_opponents = np.repeat(opponents[None], samples, axis=0)
+        for slot in segment:
+            seat_rosters = sampled_opponents[:, slot]
+            chosen = model.choose(seat_rosters, sampled_taken, self._rng)
+            model.add_picks(seat_rosters, chosen)
+            picked = chosen >= 0
+            sampled_taken[picked, chosen[picked]] += 1
+
+        if depth == 1 or level + 1 >= len(self._segments):
+            return gain + self._leaf_value(user_after, sampled_taken).mean()
+
+        future = [
+            self._node_value(user_after, sampled_opponents[i], sampled_taken[i], level + 1, depth - 1)
+            for i in range(samples)
+        ]
+        return gain + float(np.mean(future))
+
+    def _actions(self, user, taken):
+        """Position codes the user can draft (player available and a roster spot open)."""
+        model = self.model
+        filled = user[:model.flex_col]
+        available = taken < np.array([len(row_ids) for row_ids in model.row_ids])
+        room = (filled < model.max_allowed) & (
+            (filled < model.required) |
+            (model.flex_eligible & (user[model.flex_col] < model.flex_spots)) |
+            (user[model.bench_col] < model.bench_spots)
+        )
+        return list(np.flatnonzero(available & room))
+
+    def _gain(self, user, taken, code):
+        """PPG added by drafting the best available player at a position."""
+        model = self.model
+        ppg = model.ppg[code, min(taken[code], model.depth)]
+        filled = user[code]
+        starts = filled < model.required[code] or (
+            model.flex_eligible[code] and user[model.flex_col] < model.flex_spots
+        )
+        return ppg if starts else ppg * self.bench_weight
+
+    def _leaf_value(self, user, taken):
+        """
+        Heuristic value of the rest of the draft: every open starting spot is
+        filled with the player a full round deeper in that position's pool.
+
+        Args:
+            user: (positions + 2,) user roster counts
+            taken: (n, positions) sampled players taken per position
+
+        Returns:
+            (n,) array of estimated PPG still to come
+        """
+        model = self.model
+        later = np.minimum(taken + self.num_teams, model.depth)
+        fill = model.ppg[np.arange(len(model.positions)), later]
+
+        open_starters = np.maximum(model.required - user[:model.flex_col], 0)
+        value = fill @ open_starters
+
+        open_flex = max(model.flex_spots - user[model.flex_col], 0)
+        if open_flex and model.flex_eligible.any():
+            value = value + open_flex * fill[:, model.flex_eligible].max(axis=1)
+
+        return value
@@ -0,0 +1,111 @@
+"""
+Average draft positions from batches of simulated drafts.
+
+Every seat drafts with the computer drafters' policy (OpponentModel), many
+drafts per array operation. Picks are written to a columnar pick log
+(builder/PickLog.py) batch by batch, and the report streams the log back
+through PickStats, so memory stays bounded however many drafts are run.
+
+Run with: py -m simulation.MockDrafts [--drafts 10000] [--log data/drafts/mock.picklog]
+"""
+import argparse
+import os
+import sys
+
+import numpy as np
+
+from builder.LeagueLayout import compile_league_config
+from builder.PickLog import PickLogWriter, PickStats
+from config.LeagueConfig import league_teams_default_config
+from recommender.DraftRecommender import DraftRecommender
+from simulation.DraftOrder import snake_order
+from simulation.OpponentModel import OpponentModel, simulate_drafts
+
+MOCK_LOG_PATH = "data/drafts/mock.picklog"
+
+
+def run_mock_drafts(model, writer, drafts, seed=None, batch_size=2000):
+    """
+    Simulate drafts and append their picks to a pick log.
+
+    Args:
+        model: OpponentModel every seat drafts with
+        writer: PickLogWriter (its next draft ids are used)
+        drafts: Number of drafts
+        seed: Optional random seed
+        batch_size: Drafts simulated per array operation
+    """
+    rng = np.random.default_rng(seed)
+    rounds = int(model.layout.capacity.sum())
+    order = snake_order(model.league_config['league_size'], rounds)
+    seats = np.array([seat for _, _, seat in order])
+    overall = np.array([pick for _, pick, _ in order])
+
+    done = 0
+    while done < drafts:
+        size = min(batch_size, drafts - done)
+        codes, ranks = simulate_drafts(model, seats.tolist(), size, rng)
+        draft_ids = writer.next_draft + np.arange(size)
+        writer.next_draft += size
+
+        picked = codes >= 0
+        rows, steps = np.nonzero(picked)
+        writer.extend(draft_ids[rows], overall[steps], seats[steps],
+                      model.players[codes[picked], ranks[picked]], codes[picked])
+        done += size
+    writer.flush()
+
+
+def print_report(stats, rankings, top=40):
+    """Print the ADP table and each round's position mix."""
+    adp = stats.adp()
+    print(f"\nAverage draft position over {stats.drafts} drafts ({stats.picks} picks)")
+    print(f"  {'ADP':>6s} {'range':>9s} {'drafted':>8s}  {'player':<10s} {'rank':>5s} {'PPG':>6s}")
+    for i in range(min(top, len(adp['player']))):
+        player = int(adp['player'][i])
+        row = rankings.loc[player]
+        pick_range = f"{adp['min_pick'][i]}-{adp['max_pick'][i]}"
+        print(f"  {adp['adp'][i]:6.1f} {pick_range:>9s} {adp['drafted_rate'][i]:8.0%}  "
+              f"{row['position']:<4s} {player:<5d} #{int(row['position_rank']):<4d} {row['points_per_game']:6.2f}")
+
+    frequencies = stats.round_position_frequencies()
+    print("\nPosition share of each round's picks")
+    print("  round " + "".join(f"{pos:>6s}" for pos in stats.positions))
+    for round_number, shares in enumerate(frequencies, 1):
+        print(f"  {round_number:5d} " + "".join(f"{share:6.0%}" for share in shares))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="ADP from simulated computer drafts")
+    parser.add_argument('--drafts', type=int, default=10000, help="Drafts to simulate (0 to only report)")
+    parser.add_argument('--log', default=MOCK_LOG_PATH, help="Pick log to write (appended to if it exists)")
+    parser.add_argument('--new', action='store_true', help="Start a new log instead of appending")
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--top', type=int, default=40, help="Players to list")
+    args = parser.parse_args(argv)
+
+    recommender = DraftRecommender()
+    recommender.reset_draft()
+    league_config = league_teams_default_config
+    if args.drafts:
+        model = OpponentModel(recommender, league_config)
+        layout = compile_league_config(league_config)
+        if os.path.exists(args.log) and not args.new:
+            try:
+                writer = PickLogWriter.append_to(args.log, model.season, league_config['league_size'],
+                                                 layout.positions)
+            except ValueError as e:
+                print(f"\n{e} - rerun with --new to start a new log")
+                return 1
+        else:
+            writer = PickLogWriter.create(args.log, model.season, league_config['league_size'], layout.positions)
+        with writer:
+            print(f"\nSimulating {args.drafts} drafts into {args.log}...")
+            run_mock_drafts(model, writer, args.drafts, args.seed)
+
+    print_report(PickStats.from_log(args.log), recommender.rankings, args.top)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,170 @@
+"""
+Vectorized model of how the computer drafters in run_draft pick.
+
+run_draft has each computer seat take the best available player at a
+position chosen uniformly from the five highest-valued positions in its
+FOL-filtered recommendations. Opponents always take the best available
+player at the chosen position, so the pool state of a simulated draft is
+just the number of players taken per position. That lets many rollouts run
+as array operations instead of one get_recommendations call per pick.
+"""
+import numpy as np
+
+from builder.LeagueLayout import compile_league_config
+
+
+class OpponentModel:
+    """Array form of the computer drafters' pick logic."""
+
+    def __init__(self, recommender, league_config, season=2024, choices=5):
+        """
+        Args:
+            recommender: DraftRecommender holding the rankings and drafted players
+            league_config: League configuration dict
+            season: Season the draft pool is taken from
+            choices: Number of top positions a computer drafter picks from
+        """
+        self.recommender = recommender
+        self.league_config = league_config
+        self.season = season
+        self.choices = choices
+
+        # Roster arrays are [position counts..., FLEX, BENCH] (see LeagueLayout)
+        self.layout = layout = compile_league_config(league_config)
+        self.positions = layout.positions
+        self.required = layout.required
+        self.max_allowed = layout.max_allowed
+        self.flex_eligible = layout.flex_eligible
+        self.flex_spots = layout.flex_spots
+        self.bench_spots = layout.bench_spots
+        self.flex_col = layout.flex_col
+        self.bench_col = layout.bench_col
+
+        scarcity = recommender.get_position_scarcity(season=season).drop_duplicates('position')
+        scarcity_scores = dict(zip(scarcity['position'], scarcity['scarcity_score']))
+        # IsScarce(position) from DraftRules
+        self.scarce = np.array([scarcity_scores.get(pos, 0) > 1.5 for pos in self.positions])
+
+        self.refresh()
+
+    def refresh(self):
+        """Re-read the available pool from the recommender."""
+        rankings = self.recommender.rankings
+        available = rankings[
+            (rankings['season'] == self.season) &
+            (~rankings.index.isin(self.recommender.drafted_players))
+        ]
+        base_values = self.recommender.get_base_values(available, self.season)
+
+        pools = []
+        for pos in self.positions:
+            pos_data = available[available['position'] == pos].sort_values(
+                'points_per_game', ascending=False, kind='stable'
+            )
+            pools.append(pos_data)
+
+        # Padded (positions x depth + 1) tables; the padding column marks an empty pool
+        self.depth = max(len(pool) for pool in pools)
+        self.values = np.full((len(self.positions), self.depth + 1), -np.inf)
+        self.ppg = np.zeros((len(self.positions), self.depth + 1))
+        self.elite = np.zeros((len(self.positions), self.depth + 1), dtype=bool)
+        self.players = np.full((len(self.positions), self.depth + 1), -1)
+        self.row_ids = []
+        for code, pool in enumerate(pools):
+            self.values[code, :len(pool)] = base_values.loc[pool.index].to_numpy()
+            self.ppg[code, :len(pool)] = pool['points_per_game'].to_numpy()
+            self.elite[code, :len(pool)] = pool['position_percentile'].to_numpy() >= 0.8
+            self.players[code, :len(pool)] = pool.index.to_numpy()
+            self.row_ids.append(pool.index.to_numpy())
+
+    def roster_array(self, roster):
+        """Convert a roster dict to a [positions..., FLEX, BENCH] count array."""
+        return self.layout.encode(roster)
+
+    def needs(self, rosters):
+        """Vectorized get_position_needs, (n, positions + 2) -> (n, positions)."""
+        return self.layout.needs(rosters)
+
+    def choose(self, rosters, taken, rng):
+        """
+        Pick a position for one computer seat in every rollout.
+
+        Args:
+            rosters: (n, positions + 2) roster counts for the picking seat
+            taken: (n, positions) players already taken per position
+            rng: numpy Generator
+
+        Returns:
+            (n,) array of position codes, -1 where nothing can be picked
+        """
+        n = len(rosters)
+        cols = np.minimum(taken, self.depth)
+        pos_idx = np.arange(len(self.positions))
+        best_value = self.values[pos_idx, cols]
+        best_elite = self.elite[pos_idx, cols]
+        valid = np.isfinite(best_value)
+
+        needs = self.needs(rosters)
+        value = best_value * self.recommender.need_factor(needs)
+
+        # FOL filter: NeedsPosition ∧ ¬AtMax ∧ (IsElite ∨ IsScarce), unless nothing qualifies
+        layout = self.layout
+        eligible = valid & layout.needs_position(rosters) & ~layout.at_max(rosters) & (best_elite | self.scarce)
+        candidates = np.where(eligible.any(axis=1, keepdims=True), eligible, valid)
+
+        value = np.where(candidates, value, -np.inf)
+        order = np.argsort(-value, axis=1, kind='stable')[:, :self.choices]
+        n_choices = np.minimum(candidates.sum(axis=1), self.choices)
+        picks = (rng.random(n) * n_choices).astype(int)
+
+        chosen = order[np.arange(n), np.minimum(picks, order.shape[1] - 1)]
+        return np.where(n_choices > 0, chosen, -1)
+
+    def add_picks(self, rosters, chosen):
+        """
+        Vectorized update_roster (starter, then FLEX, then BENCH), in place.
+
+        Args:
+            rosters: (n, positions + 2) roster counts for the picking seat
+            chosen: (n,) position codes from choose()
+        """
+        self.layout.add_picks(rosters, chosen)
+
+
+def simulate_drafts(model, order, drafts, rng, user_model=None, user_seats=None):
+    """
+    Run many complete drafts at once with every seat on the model's policy.
+
+    Args:
+        model: OpponentModel for the computer seats
+        order: Seat of every pick in draft order (e.g. from snake_order)
+        drafts: Number of drafts
+        rng: numpy Generator
+        user_model: Optional OpponentModel for one seat per draft
+        user_seats: (drafts,) seat using user_model in each draft
+
+    Returns:
+        Tuple of (drafts, picks) arrays: position code (-1 where the seat
+        could not pick) and rank within the position's pool; the player is
+        model.players[code, rank]
+    """
+    layout = model.layout
+    rosters = np.zeros((drafts, max(order), len(layout.columns)), dtype=int)
+    taken = np.zeros((drafts, len(layout.positions)), dtype=int)
+    codes = np.full((drafts, len(order)), -1)
+    ranks = np.zeros((drafts, len(order)), dtype=int)
+    rows = np.arange(drafts)
+    for step, seat in enumerate(order):
+        seat_rosters = rosters[:, seat - 1]
+        chosen = model.choose(seat_rosters, taken, rng)
+        if user_model is not None:
+            users = user_seats == seat
+            if users.any():
+                chosen[users] = user_model.choose(seat_rosters[users], taken[users], rng)
+        layout.add_picks(seat_rosters, chosen)
+
+        picked = chosen >= 0
+        codes[picked, step] = chosen[picked]
+        ranks[picked, step] = taken[rows[picked], chosen[picked]]
+        taken[rows[picked], chosen[picked]] += 1
+    return codes, np.minimum(ranks, model.depth)
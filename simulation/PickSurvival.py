@@ -0,0 +1,85 @@
+"""
+Probability that each available player is still on the board at the
+user's next pick in a snake draft.
+
+Rollouts of the opponent pick model (see OpponentModel) are run in batches
+until the rollout count or the time budget is reached, whichever is first.
+"""
+import time
+
+import numpy as np
+import pandas as pd
+
+from simulation.OpponentModel import OpponentModel
+
+
+class PickSurvivalEngine:
+    """Monte Carlo survival estimates for the picks before the user's next turn."""
+
+    def __init__(self, recommender, league_config, season=2024):
+        """
+        Args:
+            recommender: DraftRecommender for the draft in progress
+            league_config: League configuration dict
+            season: Season the draft pool is taken from
+        """
+        self.model = OpponentModel(recommender, league_config, season)
+        self.last_rollouts = 0
+
+    def estimate(self, all_rosters, upcoming_seats, n_rollouts=2000, time_budget=0.2,
+                 batch_size=250, seed=None):
+        """
+        Estimate survival probabilities for every available player.
+
+        Args:
+            all_rosters: (seats, columns) roster array as kept by run_draft (or dict of seat: roster dict)
+            upcoming_seats: Seats picking before the user's next turn, in order
+            n_rollouts: Maximum number of rollouts
+            time_budget: Wall-clock budget in seconds (at least one batch always runs)
+            batch_size: Rollouts simulated together
+            seed: Optional random seed
+
+        Returns:
+            Series of survival probabilities indexed by rankings index
+        """
+        model = self.model
+        model.refresh()
+        rng = np.random.default_rng(seed)
+        deadline = time.perf_counter() + time_budget
+
+        seats = sorted(set(upcoming_seats))
+        seat_slot = {seat: slot for slot, seat in enumerate(seats)}
+        start_rosters = model.layout.stack(all_rosters)[np.array(seats) - 1] if seats else None
+
+        # histogram[p, k] = rollouts in which exactly k players were taken at position p
+        histogram = np.zeros((len(model.positions), model.depth + 1))
+        done = 0
+        while done < n_rollouts:
+            size = min(batch_size, n_rollouts - done)
+            taken = np.zeros((size, len(model.positions)), dtype=int)
+
+            if seats:
+                rosters = np.repeat(start_rosters[None], size, axis=0)
+                for seat in upcoming_seats:
+                    seat_rosters = rosters[:, seat_slot[seat]]
+                    chosen = model.choose(seat_rosters, taken, rng)
+                    model.add_picks(seat_rosters, chosen)
+                    picked = chosen >= 0
+                    taken[picked, chosen[picked]] += 1
+
+            for code in range(len(model.positions)):
+                histogram[code] += np.bincount(np.minimum(taken[:, code], model.depth),
+                                               minlength=model.depth + 1)
+            done += size
+            if time.perf_counter() > deadline:
+                break
+
+        self.last_rollouts = done
+
+        # A player in sorted slot k survives when at most k players were taken ahead of them
+        survival = np.cumsum(histogram, axis=1) / done
+        values = []
+        for code, row_ids in enumerate(model.row_ids):
+            values.append(pd.Series(survival[code, :len(row_ids)], index=row_ids))
+
+        return pd.concat(values).rename('survival')
@@ -0,0 +1,298 @@
+"""
+Parameter sweep over the value weights in the strategy config.
+
+Each candidate overrides some of default_strategy_config's weights. It is
+scored by simulating whole drafts in which one seat picks greedily with
+the candidate's values, while the other seats use run_draft's computer
+policy under the default weights (both through OpponentModel, many drafts
+per array operation). Each final roster then plays simulated seasons
+(SeasonSimulator). Every candidate sees the same seeds, so candidates are
+compared on the same draft and season draws (common random numbers).
+
+Candidates are spread over a process pool. Each result is appended to a
+JSONL checkpoint as soon as it is done, and a restarted sweep skips the
+candidates already in the checkpoint. The checkpoint's first line records
+the settings its results were computed under (drafts, seasons, seed,
+league and rankings content); resuming with different settings is refused.
+
+Run with: py -m simulation.StrategySweep [--random 40] [--drafts 40] [--workers 4]
+"""
+import argparse
+import hashlib
+import itertools
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from builder.LeagueLayout import compile_league_config
+from config.LeagueConfig import league_teams_default_config
+from config.StrategyConfig import default_strategy_config
+from recommender import DataLoader
+from recommender.DraftRecommender import DraftRecommender
+from simulation.DraftOrder import snake_order
+from simulation.OpponentModel import OpponentModel, simulate_drafts
+from simulation.SeasonSimulator import SeasonSimulator
+
+CHECKPOINT_PATH = "data/sweeps/strategy_sweep.jsonl"
+
+DEFAULT_GRID = {
+    'need_boost': [0.1, 0.2, 0.3],
+    'off_need_factor': [0.3, 0.5, 0.7],
+    'elite_bonus': [1.15, 1.3, 1.45],
+}
+
+RANDOM_RANGES = {
+    'position_diff_weight': (0.0, 1.0),
+    'need_boost': (0.0, 0.5),
+    'off_need_factor': (0.1, 1.0),
+    'elite_bonus': (1.0, 1.6),
+}
+
+METRICS = ('win_rate', 'playoff_prob', 'points_for')
+
+
+def grid_candidates(grid=None):
+    """Every combination of the grid's values (list of override dicts)."""
+    grid = DEFAULT_GRID if grid is None else grid
+    names = sorted(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*(grid[name] for name in names))]
+
+
+def random_candidates(n, ranges=None, seed=None):
+    """n override dicts drawn uniformly from the ranges (rounded to 3 places)."""
+    ranges = RANDOM_RANGES if ranges is None else ranges
+    rng = np.random.default_rng(seed)
+    return [
+        {name: round(float(rng.uniform(low, high)), 3) for name, (low, high) in sorted(ranges.items())}
+        for _ in range(n)
+    ]
+
+
+def candidate_key(overrides):
+    """Stable checkpoint key for a candidate."""
+    return json.dumps(overrides, sort_keys=True)
+
+
+def sweep_settings(drafts, seasons, seed, league_config, rankings_path):
+    """
+    Settings a sweep's results depend on (the checkpoint header). The league
+    and rankings are fingerprinted by content, so retraining Step 4 (which
+    rewrites the same rankings file) invalidates the checkpoint too.
+    """
+    league = hashlib.sha256(json.dumps(league_config, sort_keys=True).encode()).hexdigest()[:16]
+    digest = hashlib.sha256()
+    with open(rankings_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return {'drafts': drafts, 'seasons': seasons, 'seed': seed, 'league': league,
+            'rankings': digest.hexdigest()[:16]}
+
+
+class StrategyEvaluator:
+    """Scores strategy configs by simulated drafts and seasons."""
+
+    def __init__(self, rankings, league_config, season=2024, seasons=500):
+        """
+        Args:
+            rankings: Rankings DataFrame
+            league_config: League configuration dict
+            season: Season the draft pool is taken from
+            seasons: Seasons simulated per draft
+        """
+        self.rankings = rankings
+        self.league_config = league_config
+        self.season = season
+        self.seasons = seasons
+        self.layout = compile_league_config(league_config)
+        self.baseline = DraftRecommender(rankings=rankings)
+        self.opponents = OpponentModel(self.baseline, league_config, season)
+        self.simulator = SeasonSimulator(league_config)
+        self.order = [seat for _, _, seat in snake_order(league_config['league_size'], int(self.layout.capacity.sum()))]
+
+    def evaluate(self, strategy_config, drafts=40, seed=0):
+        """
+        Average season results of the seat drafting with a strategy.
+
+        Args:
+            strategy_config: Full strategy config dict
+            drafts: Simulated drafts (the strategy's seat cycles through every seat)
+            seed: Random seed (use the same one to compare strategies)
+
+        Returns:
+            Dict of mean 'win_rate', 'playoff_prob' and 'points_for'
+        """
+        recommender = DraftRecommender(rankings=self.rankings, strategy_config=strategy_config)
+        recommender.share_season_caches(self.baseline)
+        # The strategy's seat takes the best valued position (no random pick among the top 5)
+        model = OpponentModel(recommender, self.league_config, self.season, choices=1)
+        opponents, layout = self.opponents, self.layout
+        num_teams = self.league_config['league_size']
+        rng = np.random.default_rng(seed)
+
+        user_seats = np.arange(drafts) % num_teams + 1
+        codes, ranks = simulate_drafts(opponents, self.order, drafts, rng, model, user_seats)
+
+        # Both models sort each position's pool by PPG, so (position, rank) is the player
+        ppg = opponents.ppg[np.maximum(codes, 0), ranks]
+        results = {metric: [] for metric in METRICS}
+        seats = np.array(self.order) - 1
+        for draft in range(drafts):
+            positions = [[] for _ in range(num_teams)]
+            points = [[] for _ in range(num_teams)]
+            for seat, code, value in zip(seats.tolist(), codes[draft].tolist(), ppg[draft].tolist()):
+                if code >= 0:
+                    positions[seat].append(layout.positions[code])
+                    points[seat].append(value)
+            mean, sd = self.simulator.pack_rosters(positions, points)
+            outlook = self.simulator.simulate(mean, sd, seasons=self.seasons, seed=seed + draft)
+            for metric in METRICS:
+                results[metric].append(float(outlook[metric][user_seats[draft] - 1]))
+
+        return {metric: float(np.mean(values)) for metric, values in results.items()}
+
+
+_evaluator = None
+
+
+def _init_worker(rankings_path, league_config, seasons):
+    global _evaluator
+    _evaluator = StrategyEvaluator(DataLoader.load_rankings(rankings_path), league_config, seasons=seasons)
+
+
+def _evaluate(overrides, drafts, seed):
+    return overrides, _evaluator.evaluate({**default_strategy_config, **overrides}, drafts, seed)
+
+
+def load_checkpoint(path, settings=None):
+    """
+    Finished results from a checkpoint file (key -> result dict).
+
+    Raises:
+        ValueError: If settings are given and the checkpoint was written
+            under different ones (or has no settings header)
+    """
+    done = {}
+    if os.path.exists(path):
+        with open(path) as f:
+            header = True
+            for line in f:
+                try:
+                    result = json.loads(line)
+                except ValueError:
+                    continue  # Torn final line from an interrupted sweep
+                if header:
+                    header = False
+                    found = result.get('settings')
+                    if settings is not None and found != settings:
+                        raise ValueError(f"Checkpoint {path} was written with settings {found}, not {settings}; "
+                                         f"use another checkpoint file or delete it")
+                    if found is not None:
+                        continue
+                done[candidate_key(result['overrides'])] = result
+    return done
+
+
+def run_sweep(candidates, drafts=40, seasons=500, workers=None, checkpoint_path=CHECKPOINT_PATH,
+              seed=0, league_config=None, rankings_path=DataLoader.RANKINGS_PATH, progress=None):
+    """
+    Evaluate strategy candidates in a process pool, checkpointing each result.
+
+    Args:
+        candidates: List of override dicts for default_strategy_config
+        drafts: Simulated drafts per candidate
+        seasons: Seasons simulated per draft
+        workers: Worker processes (default: CPU count; 1 runs in this process)
+        checkpoint_path: JSONL file of finished results (None to disable)
+        seed: Random seed shared by every candidate
+        league_config: League configuration dict (default: league_teams_default_config)
+        rankings_path: Rankings CSV
+        progress: Optional callback(result, finished, total)
+
+    Returns:
+        List of result dicts ('overrides' plus the metrics), in candidate order
+
+    Raises:
+        ValueError: If the checkpoint holds results of different settings
+    """
+    league_config = league_teams_default_config if league_config is None else league_config
+    settings = sweep_settings(drafts, seasons, seed, league_config, rankings_path)
+    done = load_checkpoint(checkpoint_path, settings) if checkpoint_path else {}
+    pending = [overrides for overrides in candidates if candidate_key(overrides) not in done]
+    workers = workers or os.cpu_count() or 1
+
+    checkpoint = None
+    if checkpoint_path:
+        os.makedirs(os.path.dirname(checkpoint_path) or '.', exist_ok=True)
+        checkpoint = open(checkpoint_path, 'a')
+        if checkpoint.tell() == 0:
+            checkpoint.write(json.dumps({'settings': settings}) + "\n")
+            checkpoint.flush()
+
+    def record(overrides, metrics):
+        result = {'overrides': overrides, **metrics}
+        done[candidate_key(overrides)] = result
+        if checkpoint is not None:
+            checkpoint.write(json.dumps(result) + "\n")
+            checkpoint.flush()
+        if progress is not None:
+            progress(result, len(candidates) - len(pending) + finished, len(candidates))
+
+    try:
+        finished = 0
+        if workers == 1:
+            _init_worker(rankings_path, league_config, seasons)
+            for overrides in pending:
+                finished += 1
+                record(*_evaluate(overrides, drafts, seed))
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(rankings_path, league_config, seasons)) as pool:
+                futures = [pool.submit(_evaluate, overrides, drafts, seed) for overrides in pending]
+                for future in as_completed(futures):
+                    finished += 1
+                    record(*future.result())
+    finally:
+        if checkpoint is not None:
+            checkpoint.close()
+
+    return [done[candidate_key(overrides)] for overrides in candidates]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sweep strategy config weights with simulated drafts")
+    parser.add_argument('--random', type=int, default=0, help="Random candidates (default: the grid)")
+    parser.add_argument('--drafts', type=int, default=40, help="Simulated drafts per candidate")
+    parser.add_argument('--seasons', type=int, default=500, help="Seasons simulated per draft")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes")
+    parser.add_argument('--checkpoint', default=CHECKPOINT_PATH)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--objective', choices=METRICS, default='win_rate')
+    parser.add_argument('--top', type=int, default=10, help="Settings to report")
+    args = parser.parse_args(argv)
+
+    candidates = random_candidates(args.random, seed=args.seed) if args.random else grid_candidates()
+    # Always include the current defaults to compare against
+    candidates = [{}] + candidates
+
+    def progress(result, finished, total):
+        print(f"  [{finished}/{total}] {args.objective} {result[args.objective]:.3f}  {candidate_key(result['overrides'])}")
+
+    print(f"\nEvaluating {len(candidates)} candidates x {args.drafts} drafts x {args.seasons} seasons")
+    results = run_sweep(candidates, args.drafts, args.seasons, args.workers, args.checkpoint, args.seed,
+                        progress=progress)
+
+    baseline = results[0]
+    ranked = sorted(results, key=lambda result: -result[args.objective])
+    print(f"\nBest settings by {args.objective} (defaults: {baseline[args.objective]:.3f})")
+    print(f"  {'win rate':>8s} {'playoffs':>8s} {'points':>7s}  overrides")
+    for result in ranked[:args.top]:
+        print(f"  {result['win_rate']:8.3f} {result['playoff_prob']:8.1%} {result['points_for']:7.1f}  "
+              f"{candidate_key(result['overrides']) if result['overrides'] else '(defaults)'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,28 @@
+import copy
+
+import pytest
+
+from builder.RosterBuilder import build_roster_skeleton
+from config.LeagueConfig import league_teams_default_config
+
+# Snapshot before any test mutates the shared default config
+_DEFAULT_LEAGUE_CONFIG = copy.deepcopy(league_teams_default_config)
+
+
+@pytest.fixture
+def league_config():
+    """Fresh copy of the default league config."""
+    return copy.deepcopy(_DEFAULT_LEAGUE_CONFIG)
+
+
+@pytest.fixture
+def empty_roster(league_config):
+    """Roster dict of the league with every slot empty."""
+    return {pos: 0 for pos in build_roster_skeleton(league_config)}
+
+
+@pytest.fixture
+def empty_rosters(league_config):
+    """An empty roster dict per seat (1-based)."""
+    skeleton = build_roster_skeleton(league_config)
+    return {seat: {pos: 0 for pos in skeleton} for seat in range(1, league_config['league_size'] + 1)}
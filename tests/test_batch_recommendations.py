@@ -0,0 +1,58 @@
+import random
+
+from builder.LeagueLayout import compile_league_config
+from recommender.DraftRecommender import DraftRecommender
+
+
+def random_rosters(layout, n, rng):
+    rosters = layout.empty(n)
+    for roster in rosters:
+        for _ in range(rng.randrange(20)):
+            layout.add_pick(roster, rng.choice(layout.positions))
+    return rosters
+
+
+def test_batch_matches_single_calls(league_config):
+    rng = random.Random(0)
+    layout = compile_league_config(league_config)
+    recommender = DraftRecommender()
+    pool = recommender.rankings[recommender.rankings['season'] == 2024].index.tolist()
+    for player in rng.sample(pool, 60):
+        recommender.mark_player_drafted(player)
+
+    rosters = random_rosters(layout, 12, rng)
+    batch = recommender.get_recommendations_batch(rosters, league_config, top_n=10)
+
+    for roster, recs in zip(rosters, batch):
+        expected = recommender.get_recommendations(layout.decode(roster), league_config, top_n=10)
+        assert recs.equals(expected) or (recs.empty and expected.empty)
+
+
+def test_rows_can_have_their_own_drafted_sets(league_config):
+    layout = compile_league_config(league_config)
+    recommender = DraftRecommender()
+    rosters = layout.empty(2)
+    best = recommender.get_recommendations(layout.decode(rosters[0]), league_config, top_n=1).index[0]
+
+    rows, _ = recommender.rank_available_batch(rosters, league_config, limit=1,
+                                               drafted_players=[set(), {best}])
+    season_index = recommender.rankings[recommender.rankings['season'] == 2024].index
+
+    assert season_index[rows[0, 0]] == best and season_index[rows[1, 0]] != best
+
+
+def test_top_positions_from_a_ranking_made_before_later_picks(league_config):
+    rng = random.Random(1)
+    layout = compile_league_config(league_config)
+    recommender = DraftRecommender()
+    rosters = random_rosters(layout, 10, rng)
+    ranked, _ = recommender.rank_available_batch(rosters, league_config, limit=2 * 10 + 9)
+
+    # Nine other seats pick before the last one
+    for _ in range(9):
+        position = rng.choice(layout.positions)
+        recommender.mark_player_drafted(recommender.get_best_available_by_position(position, n=1).index[0])
+
+    recs = recommender.get_recommendations(layout.decode(rosters[9]), league_config, top_n=10)
+    expected = list(dict.fromkeys(recs['position']))[:5]
+    assert recommender.top_positions(ranked[9], rosters[9], league_config, top_n=10) == expected
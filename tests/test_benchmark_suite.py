@@ -0,0 +1,17 @@
+from benchmarks.BenchmarkSuite import compare, run_suite
+
+
+def test_compare_flags_slowdowns_beyond_threshold():
+    baseline = {'results': {'a': {'median': 1.0}, 'b': {'median': 1.0}, 'c': {'median': 1.0}}}
+    current = {'results': {'a': {'median': 1.2}, 'b': {'median': 1.3}, 'c': {'median': 0.5}, 'd': {'median': 1.0}}}
+
+    status = {row[0]: row[4] for row in compare(baseline, current, threshold=0.25)}
+
+    assert status == {'a': 'ok', 'b': 'SLOWER', 'c': 'faster', 'd': 'new'}
+
+
+def test_run_suite_times_selected_cases():
+    results = run_suite(only='get_position_scarcity', repeat=1, progress=None)
+
+    assert set(results['results']) == {'get_position_scarcity[real]', 'get_position_scarcity[synthetic]'}
+    assert all(timing['median'] > 0 for timing in results['results'].values())
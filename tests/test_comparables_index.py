@@ -0,0 +1,46 @@
+import pandas as pd
+
+from recommender.ComparablesIndex import ComparablesIndex
+
+FEATURES = ['position_encoded', 'prev_season_ppg', 'ppg_vs_position_avg']
+
+
+def build_data():
+    return pd.DataFrame({
+        'position': ['QB', 'QB', 'QB', 'RB', 'RB'],
+        'season': [2022, 2023, 2024, 2023, 2024],
+        'points_per_game': [30.0, 31.0, 45.0, 12.0, 13.0],
+        'fantasy_points': [510.0, 527.0, 765.0, 204.0, 221.0],
+        'games_played_season': [17, 17, 17, 17, 17],
+        'position_encoded': [3, 3, 3, 4, 4],
+        'prev_season_ppg': [29.0, 30.0, 40.0, 11.0, 12.0],
+        'ppg_vs_position_avg': [-5.0, -4.0, 10.0, -0.5, 0.5],
+    }, index=[10, 11, 12, 20, 21])
+
+
+def test_comparables_stay_within_position_and_skip_self():
+    index = ComparablesIndex.build(build_data(), FEATURES)
+
+    comparables = index.comparables_for(10, k=2)
+
+    assert list(comparables.index) == [11, 12]
+    assert set(comparables['position']) == {'QB'}
+
+
+def test_query_raw_features():
+    index = ComparablesIndex.build(build_data(), FEATURES)
+
+    nearest = index.query('RB', {'prev_season_ppg': 12.1, 'ppg_vs_position_avg': 0.4}, k=1)
+
+    assert list(nearest.index) == [21]
+
+
+def test_missing_saved_index_is_built_from_rankings(tmp_path):
+    from recommender.DraftRecommender import DraftRecommender
+
+    recommender = DraftRecommender()
+    player = recommender.get_best_available_by_position('RB', n=1).index[0]
+    comparables = recommender.get_comparables(player, k=3, index_path=str(tmp_path / 'missing.pkl'))
+
+    assert len(comparables) == 3 and player not in comparables.index
+    assert set(comparables['position']) == {'RB'}
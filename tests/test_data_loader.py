@@ -0,0 +1,41 @@
+import subprocess
+import sys
+
+import pytest
+
+from recommender import DataLoader
+from recommender.DraftRecommender import DraftRecommender
+
+
+def test_main_import_defers_pandas():
+    check = "import sys, main; sys.exit('pandas' in sys.modules or 'numpy' in sys.modules)"
+    assert subprocess.run([sys.executable, '-c', check]).returncode == 0
+
+
+def test_rankings_load_once_and_lazily():
+    DataLoader.prefetch()
+    recommender = DraftRecommender()
+    assert recommender._rankings is None
+    assert recommender.rankings is DataLoader.load_rankings()
+    assert DraftRecommender().rankings is recommender.rankings
+
+
+def test_missing_artifact_is_not_cached(tmp_path):
+    path = tmp_path / 'rankings.csv'
+    with pytest.raises(FileNotFoundError):
+        DataLoader.load_rankings(str(path))
+
+    path.write_text("season,position\n2024,QB\n")
+    assert len(DataLoader.load_rankings(str(path))) == 1
+
+
+def test_failed_future_still_in_cache_is_retried(tmp_path):
+    from concurrent.futures import Future
+
+    path = tmp_path / 'rankings.csv'
+    path.write_text("season,position\n2024,QB\n")
+    # A failure whose eviction has not happened yet must not be handed out again
+    failed = Future()
+    failed.set_exception(FileNotFoundError(str(path)))
+    DataLoader._futures[('rankings', str(path))] = failed
+    assert len(DataLoader.load_rankings(str(path))) == 1
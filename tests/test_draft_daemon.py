@@ -0,0 +1,40 @@
+import asyncio
+import os
+import threading
+import time
+
+from client import DaemonClient
+from service.DraftDaemon import DraftDaemon
+from service.DraftService import DraftManager, PlayerStore
+
+
+def test_client_round_trip_and_shutdown(tmp_path, league_config):
+    socket_path = str(tmp_path / 'draft.sock')
+    daemon = DraftDaemon(DraftManager(PlayerStore(), league_config), socket_path)
+    thread = threading.Thread(target=asyncio.run, args=(daemon.serve_forever(),), daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 5
+    while not os.path.exists(socket_path) and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    client = DaemonClient(socket_path, autostart=False)
+    status, draft = client.request('POST', '/drafts', {'user_seat': 2})
+    assert status == 201
+    status, tiers = client.request('GET', '/analysis/tiers/rb')
+    assert status == 200 and 'Elite (Top 10%)' in tiers
+    status, recs = client.request('GET', f"/drafts/{draft['draft_id']}/recommendations?top_n=3")
+    assert status == 200 and len(recs) == 3
+    assert client.request('GET', '/drafts/42')[0] == 404
+
+    # An unexpected error is answered and the connection stays usable
+    dispatch = daemon.manager.dispatch
+    daemon.manager.dispatch = lambda *args: {}['boom']
+    assert client.request('GET', '/drafts/1') == (500, {'error': "Internal error: KeyError"})
+    daemon.manager.dispatch = dispatch
+    assert client.request('GET', '/drafts/42')[0] == 404
+
+    assert client.request('POST', '/shutdown')[0] == 200
+    client.close()
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    assert not os.path.exists(socket_path)
@@ -0,0 +1,46 @@
+import numpy as np
+
+from builder.DraftLog import BENCH, DraftLog, REJECTED, read_log, replay, resume_draft
+from builder.RosterBuilder import update_roster
+from recommender.DraftRecommender import DraftRecommender
+
+
+def test_replay_matches_update_roster(league_config, empty_rosters):
+    positions = np.array(['QB', 'RB', 'WR', 'TE', 'K', 'D/ST', 'IDP'])
+    rng = np.random.default_rng(3)
+    seats = rng.integers(1, 11, 400)
+    players = rng.integers(0, len(positions), 400)
+
+    picks = np.zeros(400, dtype=[('seat', 'u1'), ('player', '<u4')])
+    picks['seat'], picks['player'] = seats, players
+    state = replay(picks, positions, league_config)
+
+    rosters = empty_rosters
+    accepted = [update_roster(rosters[seat], positions[player], league_config) for seat, player in zip(seats, players)]
+    assert state['rosters'] == rosters
+    assert list(state['slot'] != REJECTED) == accepted
+    assert (state['slot'] == BENCH).any()
+
+
+def test_resume_ignores_torn_record(tmp_path, league_config):
+    path = str(tmp_path / 'draft.draftlog')
+    recommender = DraftRecommender()
+    season = recommender.rankings[recommender.rankings['season'] == 2024]
+    picks = [(1, season.index[0]), (2, season.index[1]), (2, season.index[2])]
+
+    log = DraftLog.create(path, seed=7, season=2024, league_size=10, user_seat=2)
+    for seat, player in picks:
+        log.append(seat, int(player))
+    log.close()
+    with open(path, 'ab') as f:
+        f.write(b'\x03\x01')  # Crash mid-record
+
+    state = resume_draft(path, recommender, league_config)
+    assert state['header']['seed'] == 7 and state['picks_made'] == 3
+    assert recommender.drafted_players == {int(player) for _, player in picks}
+    assert sum(state['rosters'][2].values()) == 2
+
+    log = DraftLog.append_to(path)
+    log.append(3, int(season.index[3]))
+    log.close()
+    assert read_log(path)[1]['seat'].tolist() == [1, 2, 2, 3]
@@ -0,0 +1,61 @@
+import asyncio
+
+from service.DraftService import DraftManager, DraftService, PlayerStore
+from service.LoadTest import HttpClient
+
+
+def test_drafts_share_store_but_not_state(league_config):
+    manager = DraftManager(PlayerStore(), league_config)
+    first = manager.create_draft(user_seat=1)['draft_id']
+    second = manager.create_draft(user_seat=2)['draft_id']
+
+    top = manager.recommend(first, 1, top_n=5)[0]
+    status, pick = manager.dispatch('POST', f'/drafts/{first}/picks', f'{{"seat": 1, "player": {top["player"]}}}')
+
+    assert status == 201 and pick['player'] == top['player']
+    assert manager.drafts[first].recommender.rankings is manager.drafts[second].recommender.rankings
+    assert top['player'] not in manager.drafts[second].recommender.drafted_players
+    assert manager.dispatch('GET', '/drafts/99')[0] == 404
+    assert manager.dispatch('POST', f'/drafts/{first}/picks', '{"seat": 1, "position": "XX"}')[0] == 400
+    for body in ('[1, 2]', '"x"'):
+        status, error = manager.dispatch('POST', f'/drafts/{first}/picks', body)
+        assert status == 400 and 'JSON object' in error['error']
+    for body in ('{"user_seat": null}', '{"season": null}', '{"user_seat": [1]}'):
+        assert manager.dispatch('POST', '/drafts', body)[0] == 400
+
+
+def test_http_keep_alive_round_trip(league_config):
+    async def scenario():
+        service = DraftService(DraftManager(PlayerStore(), league_config))
+        port = await service.start(port=0)
+        latencies = []
+        client = await HttpClient.connect('127.0.0.1', port, latencies)
+        status, draft = await client.request('POST', '/drafts', {'user_seat': 4})
+        _, recs = await client.request('GET', f"/drafts/{draft['draft_id']}/recommendations?seat=1&top_n=3")
+        _, state = await client.request('GET', f"/drafts/{draft['draft_id']}")
+        client.close()
+        service.server.close()
+        await service.server.wait_closed()
+        return status, recs, state, latencies
+
+    status, recs, state, latencies = asyncio.run(scenario())
+    assert status == 201
+    assert recs and {'player', 'position', 'value_score', 'vorp'} <= set(recs[0])
+    assert state['user_seat'] == 4 and state['on_the_clock'] == 1
+    assert len(latencies) == 3
+
+
+def test_unexpected_error_gets_a_500_response(league_config):
+    async def scenario():
+        manager = DraftManager(PlayerStore(), league_config)
+        service = DraftService(manager)
+        port = await service.start(port=0)
+        client = await HttpClient.connect('127.0.0.1', port, [])
+        manager.get_state = lambda draft_id: {}[draft_id]  # Raises KeyError
+        status, payload = await client.request('GET', '/drafts/1')
+        client.close()
+        service.server.close()
+        await service.server.wait_closed()
+        return status, payload
+
+    assert asyncio.run(scenario()) == (500, {'error': "Internal error: KeyError"})
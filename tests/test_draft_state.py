@@ -0,0 +1,36 @@
+import numpy as np
+
+from recommender.DraftRecommender import DraftRecommender
+from simulation.DraftState import DraftPool
+
+
+def test_forks_diverge_without_copying(league_config, empty_rosters):
+    recommender = DraftRecommender()
+    root = DraftPool(recommender, league_config).root(empty_rosters)
+    best_rb = root.best_available('RB')
+
+    rb = root.pick(1, position='RB')
+    wr = root.fork().pick(1, position='WR')
+
+    assert best_rb in rb.drafted_players and best_rb not in wr.drafted_players
+    assert rb.roster(1)['RB'] == 1 and wr.roster(1)['RB'] == 0 and root.roster(1)['RB'] == 0
+    assert rb.rosters[1] is root.rosters[1]  # Untouched seats are shared
+    assert rb.best_available('RB') != best_rb and root.best_available('RB') == best_rb
+    assert rb.scarcity('RB')['total_players'] == root.scarcity('RB')['total_players'] - 1
+
+
+def test_simulated_branches_match_replayed_picks(league_config, empty_rosters):
+    recommender = DraftRecommender()
+    pool = DraftPool(recommender, league_config)
+    root = pool.root(empty_rosters, drafted_players=[int(pool.labels[0])])
+    seats = list(range(2, 11)) + list(range(10, 0, -1))
+
+    branches = root.pick(1, position='QB').simulate(seats, np.random.default_rng(1), branches=50)
+    for branch in branches:
+        replayed = root
+        for seat, player in branch.picks():
+            replayed = replayed.pick(seat, player=player)
+        assert replayed.rosters == branch.rosters
+        assert replayed.drafted == branch.drafted
+        assert replayed.best_available('WR') == branch.best_available('WR')
+        assert replayed.scarcity('RB') == branch.scarcity('RB')
@@ -0,0 +1,74 @@
+import random
+
+import numpy as np
+
+from builder.LeagueLayout import compile_league_config
+from builder.RosterBuilder import build_roster_skeleton, update_roster
+from logic import DraftRules
+
+
+def random_rosters(league_config, empty_roster, n=200, seed=0):
+    """Roster dicts built by random picks through update_roster."""
+    rng = random.Random(seed)
+    positions = list(league_config['starters_per_pos'])
+    rosters = []
+    for _ in range(n):
+        roster = dict(empty_roster)
+        for _ in range(rng.randrange(20)):
+            update_roster(roster, rng.choice(positions), league_config)
+        rosters.append(roster)
+    return rosters
+
+
+def test_add_pick_matches_update_roster(league_config, empty_roster):
+    layout = compile_league_config(league_config)
+    rng = random.Random(1)
+    roster = empty_roster
+    counts = layout.empty()
+
+    for _ in range(40):
+        position = rng.choice(layout.positions)
+        assert layout.add_pick(counts, position) == update_roster(roster, position, league_config)
+        assert layout.decode(counts) == roster
+
+    assert layout.is_full(counts) == all(roster[pos] >= n for pos, n in build_roster_skeleton(league_config).items())
+
+
+def test_vector_checks_match_roster_dicts(league_config, empty_roster):
+    layout = compile_league_config(league_config)
+    rules = DraftRules(league_config)
+    rosters = random_rosters(league_config, empty_roster)
+    counts = layout.stack(dict(enumerate(rosters, 1)))
+
+    needs = layout.needs(counts)
+    needs_position = layout.needs_position(counts)
+    at_max = layout.at_max(counts)
+    for row, roster in enumerate(rosters):
+        assert layout.needs_dict(counts[row]) == layout.needs_dict(roster)
+        for code, pos in enumerate(layout.positions):
+            assert needs_position[row, code] == rules.needs_position(roster, pos)
+            assert at_max[row, code] == rules.at_max(roster, pos)
+        assert {pos: n for pos, n in zip(layout.positions, needs[row].tolist()) if n} == layout.needs_dict(roster)
+
+
+def test_needs_of_an_empty_roster(league_config):
+    needs = compile_league_config(league_config).needs_dict({})
+    # Starters + one FLEX (RB/WR/TE) + one bench spot
+    assert needs == {'QB': 2, 'RB': 4, 'WR': 4, 'TE': 3, 'IDP': 2, 'D/ST': 2, 'K': 2}
+
+
+def test_batched_add_picks(league_config):
+    layout = compile_league_config(league_config)
+    rosters = layout.empty(3)
+    rosters[2, layout.index['K']] = 2  # At max
+
+    added = layout.add_picks(rosters, np.array([layout.index['RB'], -1, layout.index['K']]))
+
+    assert added.tolist() == [True, False, False]
+    assert rosters[0, layout.index['RB']] == 1 and rosters[1].sum() == 0
+
+
+def test_edited_config_is_recompiled(league_config):
+    assert compile_league_config(league_config) is compile_league_config(league_config)
+    league_config['bench_spots'] = 6
+    assert compile_league_config(league_config).bench_spots == 6
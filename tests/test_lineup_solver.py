@@ -0,0 +1,57 @@
+from functools import lru_cache
+
+import numpy as np
+
+from simulation.LineupSolver import LineupSolver
+
+
+def brute_force(positions, points, league_config):
+    """Best lineup by trying every player in every slot (or leaving it empty)."""
+    slots = [[pos] for pos, n in league_config['starters_per_pos'].items() for _ in range(n)]
+    slots += [league_config['flex_eligible']] * league_config['flex_spots']
+
+    @lru_cache(None)
+    def best(slot, used):
+        if slot == len(slots):
+            return 0.0
+        value = best(slot + 1, used)
+        for player, (pos, player_points) in enumerate(zip(positions, points)):
+            if not used >> player & 1 and pos in slots[slot]:
+                value = max(value, player_points + best(slot + 1, used | 1 << player))
+        return value
+
+    return best(0, 0)
+
+
+def test_matches_brute_force(league_config):
+    solver = LineupSolver(league_config)
+    rng = np.random.default_rng(0)
+    rosters, points = [], []
+    for _ in range(100):
+        size = rng.integers(3, 13)
+        rosters.append([str(pos) for pos in rng.choice(solver.positions, size)])
+        points.append(rng.normal(8, 8, size))
+
+    solved = solver.solve(solver.pack(rosters, points))
+
+    expected = [brute_force(tuple(r), tuple(p), league_config) for r, p in zip(rosters, points)]
+    np.testing.assert_allclose(solved, expected)
+
+
+def test_flex_takes_best_leftover(league_config):
+    solver = LineupSolver(league_config)
+    roster = ['QB', 'RB', 'RB', 'RB', 'WR', 'WR', 'WR', 'TE', 'TE', 'K']
+    points = [20, 15, 12, 11, 14, 13, 9, 8, 10, 7]
+
+    # QB 20, RB 15+12, WR 14+13, TE 10, K 7; FLEX 11 (RB) + 9 (WR) over TE 8
+    assert solver.solve(solver.pack([roster], [points]))[0] == 20 + 27 + 27 + 10 + 7 + 11 + 9
+
+
+def test_batches_broadcast_over_leading_axes(league_config):
+    solver = LineupSolver(league_config)
+    packed = np.random.default_rng(1).gamma(2.0, 5.0, (3, 4, len(solver.positions), 4))
+
+    solved = solver.solve(packed)
+
+    assert solved.shape == (3, 4)
+    assert np.isclose(solved[2, 1], solver.solve(packed[2, 1][None])[0])
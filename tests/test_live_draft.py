@@ -0,0 +1,56 @@
+from live.LiveDraft import LiveDraftSession
+from live.PickEvents import FileTailSource, parse_event
+from recommender.DraftRecommender import DraftRecommender
+
+
+def test_parse_event_formats():
+    assert parse_event('4 rb') == {'seat': 4, 'position': 'RB'}
+    assert parse_event('{"seat": 2, "player": 17}') == {'seat': 2, 'player': 17}
+
+
+def test_null_fields_are_rejected_not_raised(league_config):
+    session = LiveDraftSession(DraftRecommender(), league_config, user_seat=3)
+    lines = ['{"seat": null, "position": "QB"}', '{"seat": 1, "player": null}', '{"seat": 1, "position": null}',
+             '{"seat": 1, "position": "QB", "overall_pick": [1]}']
+    results = session.ingest(lines)
+    assert all(isinstance(result, str) and result.startswith("Rejected") for result in results)
+    assert session.picks == []
+
+
+def test_file_tail_burst_updates_session(tmp_path, league_config):
+    path = tmp_path / 'picks.txt'
+    source = FileTailSource(str(path))
+    session = LiveDraftSession(DraftRecommender(), league_config, user_seat=3)
+    best_qb = session.best_available('QB')
+    before = session.get_recommendations(top_n=10)
+
+    with open(path, 'a') as f:
+        f.write('1 QB\n{"seat": 2, "position": "WR"}\n2 BOGUS\n')
+    results = session.ingest(source.poll(timeout=1.0))
+    source.close()
+
+    assert [r['position'] for r in results[:2]] == ['QB', 'WR']
+    assert isinstance(results[2], str)
+    assert session.current_seat() == 3
+    assert best_qb in session.recommender.drafted_players
+    assert session.best_available('QB') != best_qb
+    assert session.remaining['QB'] == 21
+
+    after = session.get_recommendations(top_n=10)
+    expected = session.recommender.get_recommendations(session.rosters[3], league_config, top_n=10)
+    assert best_qb in before.index
+    assert after.equals(expected)
+
+
+def test_picks_off_the_clock_are_rejected(league_config):
+    session = LiveDraftSession(DraftRecommender(), league_config, user_seat=3)
+    session.apply_event({'seat': 1, 'position': 'QB'})
+
+    results = session.ingest(['1 QB', '3 RB', '{"seat": 4, "position": "WR", "overall_pick": 5}'])
+    assert all(isinstance(result, str) for result in results)  # Duplicate, out of order, wrong pick number
+    assert session.rosters[1]['QB'] == 1 and len(session.picks) == 1
+
+    # A traded pick is accepted when it names the current pick
+    pick = session.apply_event({'seat': 4, 'position': 'WR', 'overall_pick': 2})
+    assert pick['expected_seat'] == 2 and pick['seat'] == 4
+    assert session.current_seat() == 3
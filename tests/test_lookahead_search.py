@@ -0,0 +1,38 @@
+import time
+
+from recommender.DraftRecommender import DraftRecommender
+from simulation.LookaheadSearch import LookaheadSearch
+
+
+def test_search_respects_depth_and_candidates(league_config, empty_rosters):
+    search = LookaheadSearch(DraftRecommender(), league_config)
+
+    result = search.search(empty_rosters, 3, 3, 16, time_budget=60, candidates=['RB', 'WR'], max_depth=2, seed=1)
+
+    assert result['depth'] == 2
+    assert result['position'] in ('RB', 'WR')
+    assert set(result['values']) == {'RB', 'WR'}
+
+
+def test_search_with_no_time_still_answers(league_config, empty_rosters):
+    search = LookaheadSearch(DraftRecommender(), league_config)
+
+    result = search.search(empty_rosters, 1, 1, 16, time_budget=0)
+
+    assert result['depth'] == 0
+    assert result['position'] is not None
+
+
+def test_pool_refresh_counts_against_the_budget(league_config, empty_rosters):
+    search = LookaheadSearch(DraftRecommender(), league_config)
+    refresh = search.model.refresh
+
+    def slow_refresh():
+        refresh()
+        time.sleep(0.05)
+
+    search.model.refresh = slow_refresh
+    result = search.search(empty_rosters, 1, 1, 16, time_budget=0.01)
+
+    assert result['depth'] == 0 and result['nodes'] == 0
+    assert result['position'] is not None
@@ -0,0 +1,94 @@
+import numpy as np
+import pytest
+
+from builder.DraftLog import DraftLog
+from builder.LeagueLayout import compile_league_config
+from builder.PickLog import PickLogWriter, PickStats, iter_chunks, read_pick_log, record_draft
+
+POSITIONS = ['QB', 'RB', 'WR']
+
+
+def test_chunks_round_trip_and_resume(tmp_path):
+    path = str(tmp_path / 'picks.picklog')
+    with PickLogWriter.create(path, 2024, 4, POSITIONS, chunk_size=5) as writer:
+        for pick in range(1, 13):
+            writer.append(0, pick, (pick - 1) % 4 + 1, 100 + pick, pick % 3)
+        writer.extend(1, np.arange(1, 9), np.arange(8) % 4 + 1, np.arange(200, 208), 0)
+
+    assert [len(chunk['draft']) for chunk in iter_chunks(path)] == [5, 5, 5, 5]
+    with open(path, 'ab') as f:
+        f.write(b'\x03\x00\x00\x00\x01')  # Crash mid-chunk
+
+    writer = PickLogWriter.append_to(path)
+    assert writer.new_draft() == 2
+    writer.append(2, 1, 1, 300, 2)
+    writer.close()
+
+    header, columns = read_pick_log(path)
+    assert header['positions'] == POSITIONS and header['league_size'] == 4
+    assert columns['draft'].tolist() == [0] * 12 + [1] * 8 + [2]
+    assert columns['player'][-1] == 300 and columns['pick'][12:20].tolist() == list(range(1, 9))
+
+
+def test_streaming_stats_match_full_computation(tmp_path):
+    rng = np.random.default_rng(5)
+    drafts, picks_per_draft = 300, 12
+    draft = np.repeat(np.arange(drafts), picks_per_draft)
+    pick = np.tile(np.arange(1, picks_per_draft + 1), drafts)
+    player = rng.integers(0, 40, len(draft))
+    position = player % 3
+
+    path = str(tmp_path / 'picks.picklog')
+    with PickLogWriter.create(path, 2024, 4, POSITIONS, chunk_size=97) as writer:
+        writer.extend(draft, pick, (pick - 1) % 4 + 1, player, position)
+    stats = PickStats.from_log(path)
+
+    # Merging halves gives the same tables
+    half = PickStats(4, POSITIONS)
+    half.update({'pick': pick[:1000], 'player': player[:1000], 'position': position[:1000]})
+    rest = PickStats(4, POSITIONS)
+    rest.update({'pick': pick[1000:], 'player': player[1000:], 'position': position[1000:]})
+    merged = half.merge(rest)
+    assert np.array_equal(merged.pick_counts, stats.pick_counts) and merged.drafts == stats.drafts == drafts
+
+    adp = stats.adp()
+    for target in (0, 17, 39):
+        assert np.isclose(adp['adp'][adp['player'] == target][0], pick[player == target].mean())
+        assert adp['min_pick'][adp['player'] == target][0] == pick[player == target].min()
+        assert adp['max_pick'][adp['player'] == target][0] == pick[player == target].max()
+    assert np.all(np.diff(adp['adp']) >= 0)
+    assert stats.pick_histogram(17).sum() == (player == 17).sum()
+
+    frequencies = stats.round_position_frequencies()
+    assert frequencies.shape == (3, 3)
+    first_round = pick <= 4
+    assert np.isclose(frequencies[0, 1], (position[first_round] == 1).mean())
+
+
+def test_record_draft_from_draft_log(tmp_path, league_config):
+    from recommender import DataLoader
+
+    rankings = DataLoader.load_rankings()
+    layout = compile_league_config(league_config)
+    players = rankings.index[rankings['season'] == 2024][:3].tolist()
+    draft_log = str(tmp_path / 'draft.draftlog')
+    log = DraftLog.create(draft_log, seed=1, season=2024, league_size=10, user_seat=1)
+    for seat, player in zip((1, 2, 3), players):
+        log.append(seat, int(player))
+    log.close()
+
+    path = str(tmp_path / 'history.picklog')
+    assert record_draft(path, draft_log, rankings, layout) == 0
+    assert record_draft(path, draft_log, rankings, layout) == 1
+
+    _, columns = read_pick_log(path)
+    assert columns['player'].tolist() == players * 2
+    codes = [layout.positions.index(pos) for pos in rankings.loc[players, 'position']]
+    assert columns['position'].tolist() == codes * 2
+
+    # A draft of another league is not coded against this log's header
+    other_log = str(tmp_path / 'other.draftlog')
+    DraftLog.create(other_log, seed=1, season=2024, league_size=12, user_seat=1).close()
+    with pytest.raises(ValueError, match="league_size"):
+        record_draft(path, other_log, rankings, layout)
+    assert read_pick_log(path)[1]['player'].tolist() == players * 2
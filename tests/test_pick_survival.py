@@ -0,0 +1,28 @@
+from recommender.DraftRecommender import DraftRecommender
+from simulation.DraftOrder import picks_until_next_turn, snake_order
+from simulation.PickSurvival import PickSurvivalEngine
+
+
+def test_snake_order_reverses_each_round():
+    seats = [seat for _, _, seat in snake_order(3, 2)]
+
+    assert seats == [1, 2, 3, 3, 2, 1]
+
+
+def test_picks_until_next_turn():
+    assert picks_until_next_turn(2, 2, 3, 3) == [3, 3]
+    assert picks_until_next_turn(3, 3, 3, 3) == []
+    assert picks_until_next_turn(1, 6, 3, 2) is None
+
+
+def test_survival_is_monotone_within_position(league_config, empty_rosters):
+    recommender = DraftRecommender()
+    engine = PickSurvivalEngine(recommender, league_config)
+
+    survival = engine.estimate(empty_rosters, picks_until_next_turn(1, 1, 10, 16), n_rollouts=500, seed=7)
+
+    for row_ids in engine.model.row_ids:
+        probabilities = survival.loc[row_ids].to_numpy()
+        assert (probabilities[1:] >= probabilities[:-1]).all()
+    assert survival.between(0, 1).all()
+    assert engine.last_rollouts == 500
@@ -0,0 +1,105 @@
+import numpy as np
+import pandas as pd
+
+from recommender.DraftRecommender import DraftRecommender
+from recommender.PositionAnalysis import PositionAnalysis, rankings_hash
+
+
+def make_rankings(seed=0):
+    rng = np.random.default_rng(seed)
+    rows = []
+    for season in (2023, 2024):
+        for position, count in (('QB', 12), ('RB', 25), ('K', 7)):
+            ppg = rng.gamma(4.0, 3.0, count).round(2)
+            for value, pct in zip(ppg, pd.Series(ppg).rank(pct=True)):
+                rows.append({'position': position, 'season': season, 'points_per_game': value,
+                             'position_percentile': pct})
+    return pd.DataFrame(rows).sample(frac=1, random_state=seed).reset_index(drop=True)
+
+
+def test_tables_match_per_position_computation():
+    rankings = make_rankings()
+    analysis = PositionAnalysis.build(rankings)
+
+    for season in (2023, 2024):
+        season_data = rankings[rankings['season'] == season]
+        scarcity = analysis.scarcity(season)
+        assert list(scarcity['position']) == list(scarcity.sort_values('scarcity_score', ascending=False)['position'])
+        for row in scarcity.to_dict('records'):
+            ppg = season_data.loc[season_data['position'] == row['position'], 'points_per_game']
+            top = ppg.nlargest(max(1, len(ppg) // 10)).mean()
+            assert row['total_players'] == len(ppg)
+            assert row['top_10_avg_ppg'] == round(top, 2)
+            assert row['scarcity_score'] == round((top - ppg.median()) / ppg.median(), 2)
+
+        pos_data = season_data[season_data['position'] == 'RB']
+        tiers = analysis.tier_breakdowns('RB', season)
+        elite = pos_data[pos_data['position_percentile'] >= 0.9]['points_per_game']
+        assert next(iter(tiers)) == 'Elite (Top 10%)'
+        assert tiers['Elite (Top 10%)']['count'] == len(elite)
+        assert np.isclose(tiers['Elite (Top 10%)']['avg_ppg'], elite.mean())
+        assert sum(tier['count'] for tier in tiers.values()) == len(pos_data)
+
+    assert analysis.scarcity(1999).empty
+    assert analysis.tier_breakdowns('TE', 2024) == {}
+
+
+def test_saved_tables_are_used_only_for_matching_rankings(tmp_path):
+    path = str(tmp_path / 'position_analysis.pkl')
+    rankings = make_rankings()
+    saved = PositionAnalysis.build(rankings)
+    saved.scarcity_table['scarcity_score'] = 9.99  # Marks tables read from the file
+    saved.save(path)
+
+    assert (PositionAnalysis.for_rankings(rankings, path).scarcity(2024)['scarcity_score'] == 9.99).all()
+
+    # Different rankings content: the saved tables are stale and rebuilt
+    changed = rankings.copy()
+    changed.loc[0, 'points_per_game'] += 1
+    assert rankings_hash(changed) != rankings_hash(rankings)
+    assert (PositionAnalysis.for_rankings(changed, path).scarcity(2024)['scarcity_score'] != 9.99).all()
+
+
+def test_recommender_reads_analysis():
+    rankings = make_rankings(1)
+    recommender = DraftRecommender(rankings=rankings)
+
+    expected = PositionAnalysis.build(rankings)
+    pd.testing.assert_frame_equal(recommender.get_position_scarcity(2023), expected.scarcity(2023))
+    assert recommender.get_tier_breakdowns('QB', 2024) == expected.tier_breakdowns('QB', 2024)
+
+
+def test_trends_blend_earlier_seasons():
+    rankings = make_rankings(2)
+    analysis = PositionAnalysis.build(rankings)
+    trends = analysis.trends(window=2, halflife=1.0)
+
+    rb = trends[trends['position'] == 'RB'].set_index('season')
+    scores = rb['scarcity_score']
+    assert rb.loc[2023, 'scarcity_score_rolling'] == scores[2023]
+    assert np.isclose(rb.loc[2024, 'scarcity_score_rolling'], scores.mean())
+    # Half-life of one season: the previous season weighs half as much
+    assert np.isclose(rb.loc[2024, 'scarcity_score_ewm'], (scores[2024] + 0.5 * scores[2023]) / 1.5)
+    assert np.isclose(rb.loc[2024, 'elite_avg_ppg'], analysis.tier_breakdowns('RB', 2024)['Elite (Top 10%)']['avg_ppg'])
+
+    assert analysis.baseline_scarcity(2024, 'rolling', window=2)['RB'] == rb.loc[2024, 'scarcity_score_rolling']
+
+
+def test_recommender_blended_scarcity_baseline():
+    from config.StrategyConfig import default_strategy_config
+
+    rankings = make_rankings(3)
+    seasonal = DraftRecommender(rankings=rankings)
+    blended = DraftRecommender(rankings=rankings,
+                               strategy_config={**default_strategy_config, 'scarcity_baseline': 'ewm'})
+
+    expected = PositionAnalysis.build(rankings)
+    assert seasonal.get_scarcity_scores(2024) == dict(zip(expected.scarcity(2024)['position'],
+                                                          expected.scarcity(2024)['scarcity_score']))
+    assert blended.get_scarcity_scores(2024) == expected.baseline_scarcity(2024, 'ewm')
+
+    season = rankings[rankings['season'] == 2024]
+    multiplier = blended.get_scarcity_multiplier(blended.get_scarcity_scores(2024)['QB'])
+    qb = season[season['position'] == 'QB']
+    base = qb['points_per_game'] * np.where(qb['position_percentile'] >= 0.8, 1.3, 1.0) * multiplier
+    np.testing.assert_allclose(blended.get_base_values(qb, 2024), base)
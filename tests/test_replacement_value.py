@@ -0,0 +1,34 @@
+import pandas as pd
+
+from recommender.ReplacementValue import ReplacementTracker, get_replacement_counts
+
+
+def test_replacement_counts_split_flex_by_starters(league_config):
+    counts = get_replacement_counts(league_config)
+
+    assert counts['QB'] == 10
+    assert counts['RB'] == 28
+    assert counts['WR'] == 28
+    assert counts['TE'] == 14
+
+
+def test_replacement_level_moves_with_picks(league_config):
+    league_config['league_size'] = 1
+    rankings = pd.DataFrame({
+        'position': ['K'] * 4,
+        'season': [2024] * 4,
+        'points_per_game': [10.0, 9.0, 8.0, 7.0],
+    })
+    tracker = ReplacementTracker(rankings, league_config, season=2024)
+    assert tracker.get_replacement_levels()['K'] == 9.0
+
+    # Drafting a starter-level player leaves the replacement level alone
+    tracker.mark_drafted(0)
+    assert tracker.get_replacement_levels()['K'] == 9.0
+
+    tracker.mark_drafted(1)
+    assert tracker.get_replacement_levels()['K'] == 8.0
+    assert tracker.vorp([2, 3]).tolist() == [0.0, -1.0]
+
+    tracker.unmark_drafted(1)
+    assert tracker.get_replacement_levels()['K'] == 9.0
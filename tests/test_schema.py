@@ -0,0 +1,40 @@
+import pandas as pd
+import pytest
+
+from config.SchemaConfig import categorical_columns
+from recommender.DraftRecommender import DraftRecommender
+from utility import Schema
+
+
+def test_read_csv_uses_fixed_categories():
+    rankings = Schema.read_csv("data/summary/player_rankings.csv")
+
+    for column in ['position', 'player_type']:
+        assert list(rankings[column].cat.categories) == categorical_columns[column]
+    plain = pd.read_csv("data/summary/player_rankings.csv")
+    assert rankings.astype({'position': str, 'player_type': str}).equals(plain.astype({'position': str, 'player_type': str}))
+    assert rankings.memory_usage(deep=True).sum() < plain.memory_usage(deep=True).sum()
+
+
+def test_unknown_values_are_rejected():
+    with pytest.raises(ValueError, match="Unknown position values: LS"):
+        Schema.categorize(pd.DataFrame({'position': ['QB', 'LS']}))
+    names = Schema.categorize(pd.DataFrame({'player_name': ['A', 'B', 'A']}))['player_name']
+    assert list(names.cat.categories) == ['A', 'B']
+
+
+def test_recommendations_match_string_rankings(league_config, empty_roster):
+    plain = pd.read_csv("data/summary/player_rankings.csv")
+    roster = empty_roster
+    roster['RB'] = 2
+
+    results = []
+    for rankings in [plain, Schema.categorize(plain)]:
+        recommender = DraftRecommender(rankings=rankings)
+        recommender.reset_draft()
+        for player in rankings[rankings['season'] == 2024].nlargest(15, 'points_per_game').index:
+            recommender.mark_player_drafted(player)
+        recs = recommender.get_recommendations(roster, league_config, top_n=10)
+        results.append(recs.astype({'position': str}))
+
+    pd.testing.assert_frame_equal(results[0], results[1])
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from simulation.SeasonSimulator import SeasonSimulator, round_robin
+
+
+def test_round_robin_plays_everyone_once():
+    schedule = round_robin(10, 9)
+
+    for week in schedule:
+        assert sorted(week.ravel().tolist()) == list(range(10))
+    pairs = {tuple(sorted(game)) for game in schedule.reshape(-1, 2).tolist()}
+    assert len(pairs) == 45
+
+    with pytest.raises(ValueError):
+        round_robin(9, 9)
+
+
+def test_stronger_rosters_win_more(league_config):
+    simulator = SeasonSimulator(league_config, weeks=14, playoff_teams=4)
+    roster = ['QB', 'RB', 'RB', 'WR', 'WR', 'TE', 'IDP', 'D/ST', 'K', 'RB', 'WR', 'QB']
+    # Team i's players all score 10 + i points per game
+    positions = [roster] * 10
+    ppg = [[10.0 + team] * len(roster) for team in range(10)]
+    mean = simulator.solver.pack(positions, ppg)
+    sd = mean * 0.5
+
+    outlook = simulator.simulate(mean, sd, seasons=3000, seed=0)
+
+    assert np.all(np.diff(outlook['win_rate']) > 0)
+    assert np.isclose(outlook['expected_wins'].sum(), 14 * 10 / 2)
+    assert np.isclose(outlook['playoff_prob'].sum(), 4)
+
+
+def test_fixed_scores_start_the_optimal_lineup(league_config):
+    simulator = SeasonSimulator(league_config, weeks=14)
+    roster = ['QB', 'QB', 'RB', 'RB', 'RB', 'WR', 'WR', 'WR', 'TE', 'IDP', 'D/ST', 'K']
+    ppg = [20, 30, 15, 12, 11, 14, 13, 9, 8, 6, 5, 7]
+    mean = simulator.solver.pack([roster] * 10, [ppg] * 10)
+
+    outlook = simulator.simulate(mean, np.zeros_like(mean), seasons=10, seed=0)
+
+    # QB 30, RB 15+12, WR 14+13, TE 8, IDP 6, D/ST 5, K 7, FLEX 11+9
+    assert np.allclose(outlook['points_for'], 30 + 27 + 27 + 8 + 6 + 5 + 7 + 11 + 9)
+    assert np.allclose(outlook['win_rate'], 0.5)  # Every game is a tie
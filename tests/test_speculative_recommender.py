@@ -0,0 +1,32 @@
+from recommender.DraftRecommender import DraftRecommender
+from recommender.SpeculativeRecommender import SpeculativeRecommender
+
+
+def test_speculation_matches_recommendations_after_opponent_picks(league_config, empty_roster):
+    recommender = DraftRecommender()
+    speculator = SpeculativeRecommender(recommender)
+    roster = empty_roster
+
+    speculator.speculate(roster, league_config, top_n=10, upcoming_picks=3)
+    for position in ['QB', 'WR', 'QB']:
+        recommender.mark_player_drafted(recommender.get_best_available_by_position(position, n=1).index[0])
+
+    speculative = speculator.get_recommendations(roster, league_config, top_n=10)
+    expected = recommender.get_recommendations(roster, league_config, top_n=10)
+    speculator.shutdown()
+
+    assert speculator.hits == 1
+    assert speculative.equals(expected)
+
+
+def test_speculation_discarded_when_roster_changes(league_config, empty_roster):
+    recommender = DraftRecommender()
+    speculator = SpeculativeRecommender(recommender)
+    roster = empty_roster
+
+    speculator.speculate(roster, league_config, top_n=10)
+    roster['QB'] = 1
+    speculator.get_recommendations(roster, league_config, top_n=10)
+    speculator.shutdown()
+
+    assert speculator.misses == 1
@@ -0,0 +1,60 @@
+import json
+import shutil
+
+import pytest
+
+from config.StrategyConfig import default_strategy_config
+from recommender import DataLoader
+from recommender.DraftRecommender import DraftRecommender
+from simulation.StrategySweep import grid_candidates, random_candidates, run_sweep
+
+
+def test_scarcity_multiplier_tiers():
+    multiplier = DraftRecommender.get_scarcity_multiplier
+    assert [multiplier(score) for score in (2.0, 1.5, 1.0, 0.6, 0.3)] == [1.25, 1.15, 1.05, 1.0, 0.95]
+
+    flat = {**default_strategy_config, 'scarcity_tiers': [], 'low_scarcity_multiplier': 1.0}
+    assert multiplier(2.0, flat) == multiplier(0.3, flat) == 1.0
+
+
+def test_candidates_cover_grid_and_ranges():
+    grid = grid_candidates({'need_boost': [0.1, 0.2], 'elite_bonus': [1.1, 1.2, 1.3]})
+    assert len(grid) == 6
+    assert {'need_boost': 0.2, 'elite_bonus': 1.1} in grid
+
+    drawn = random_candidates(20, {'need_boost': (0.0, 0.5)}, seed=0)
+    assert all(0.0 <= candidate['need_boost'] <= 0.5 for candidate in drawn)
+    assert drawn == random_candidates(20, {'need_boost': (0.0, 0.5)}, seed=0)
+
+
+def test_sweep_resumes_from_checkpoint(tmp_path):
+    path = tmp_path / "sweep.jsonl"
+    rankings = tmp_path / "player_rankings.csv"
+    shutil.copy(DataLoader.RANKINGS_PATH, rankings)
+    candidates = [{}, {'need_boost': 0.4}]
+
+    first = run_sweep(candidates[:1], drafts=4, seasons=50, workers=1, checkpoint_path=str(path),
+                      rankings_path=str(rankings))
+    evaluated = []
+    results = run_sweep(candidates, drafts=4, seasons=50, workers=1, checkpoint_path=str(path),
+                        rankings_path=str(rankings),
+                        progress=lambda result, finished, total: evaluated.append(result['overrides']))
+
+    # Only the new candidate is simulated; the checkpointed one is reused
+    assert evaluated == [{'need_boost': 0.4}]
+    assert results[0] == first[0]
+    header, *lines = path.read_text().splitlines()
+    assert json.loads(header)['settings']['drafts'] == 4
+    assert [json.loads(line)['overrides'] for line in lines] == candidates
+    assert all(0 <= result['win_rate'] <= 1 for result in results)
+
+    # Results of other settings are never mixed in
+    for changed in ({'drafts': 8}, {'seasons': 60}, {'seed': 1}, {'league_config': {'league_size': 12}}):
+        with pytest.raises(ValueError, match="settings"):
+            run_sweep(candidates, **{'drafts': 4, 'seasons': 50, **changed}, workers=1, checkpoint_path=str(path),
+                      rankings_path=str(rankings))
+
+    # Retrained rankings written to the same file
+    rankings.write_text("".join(rankings.read_text().splitlines(keepends=True)[:-1]))
+    with pytest.raises(ValueError, match="settings"):
+        run_sweep(candidates, drafts=4, seasons=50, workers=1, checkpoint_path=str(path), rankings_path=str(rankings))
@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+
+from benchmarks.SyntheticData import (CONSOLIDATED_COLUMNS, DataProfile, synthetic_consolidated,
+                                      synthetic_league_config, synthetic_rankings, synthetic_step3_inputs)
+import Step3ConsolidateData
+
+
+def test_consolidated_scales_and_matches_real_distributions():
+    real = pd.read_csv("data/cleaned/consolidated_player_data.csv")
+    profile = DataProfile.from_consolidated(real)
+
+    synthetic = synthetic_consolidated(profile, scale=10, seed=1)
+
+    assert list(synthetic.columns) == CONSOLIDATED_COLUMNS
+    assert len(synthetic) == len(real) * 10
+    assert synthetic.equals(synthetic_consolidated(profile, scale=10, seed=1))
+    quantiles = [0.1, 0.5, 0.9]
+    real_q = real.groupby('position')['points_per_game'].quantile(quantiles)
+    synthetic_q = synthetic.groupby('position')['points_per_game'].quantile(quantiles)
+    np.testing.assert_allclose(synthetic_q, real_q.loc[synthetic_q.index], rtol=0.05, atol=0.1)
+
+
+def test_rankings_follow_the_real_draft_pool():
+    real = pd.read_csv("data/summary/player_rankings.csv")
+
+    rankings = synthetic_rankings(scale=5, seed=2)
+
+    assert list(rankings.columns) == list(real.columns)
+    assert len(rankings) == len(real) * 5
+    assert rankings.groupby(['season', 'position'])['position_rank'].min().eq(1).all()
+    assert rankings['position_percentile'].between(0, 1).all()
+    medians = rankings.groupby('position')['points_per_game'].median()
+    np.testing.assert_allclose(medians, real.groupby('position')['points_per_game'].median()[medians.index],
+                               rtol=0.05)
+
+
+def test_league_config_and_step3_inputs(tmp_path):
+    config = synthetic_league_config(league_size=32, bench_spots=10)
+    starting = sum(config['starters_per_pos'].values()) + config['flex_spots']
+    assert config['league_size'] == 32
+    assert sum(config['max_per_position'].values()) >= starting + config['bench_spots']
+
+    for file_name, table in synthetic_step3_inputs(scale=0.5, seasons=[2024], seed=3).items():
+        table.to_csv(tmp_path / file_name, index=False)
+    consolidated = Step3ConsolidateData.main(tmp_path)
+
+    assert list(consolidated.columns) == CONSOLIDATED_COLUMNS
+    assert set(consolidated['position']) == {'QB', 'RB', 'WR', 'TE', 'IDP', 'K', 'D/ST'}
+    assert (consolidated['games_played_season'] >= 4).all()
@@ -0,0 +1,49 @@
+import numpy as np
+
+from recommender.DraftRecommender import DraftRecommender
+from recommender.TierIndex import TIER_NAMES, TIERS, TierIndex, TierTracker
+
+
+def percentile_tiers(percentiles):
+    """Tier codes from the percentile bands, one boolean filter per tier."""
+    codes = np.full(len(percentiles), len(TIERS) - 1)
+    for code, bound in reversed(list(enumerate(TIERS.values()))):
+        codes[percentiles >= bound] = code
+    return codes
+
+
+def test_search_matches_percentile_bands():
+    rankings = DraftRecommender().rankings
+    index = TierIndex.from_rankings(rankings)
+
+    for (season, position), group in rankings.groupby(['season', 'position']):
+        tiers = index.assign(season, position, group['points_per_game'].to_numpy())
+        assert np.array_equal(tiers, percentile_tiers(group['position_percentile'].to_numpy()))
+
+    # Mixed positions in one batch
+    season = rankings[rankings['season'] == 2024]
+    tiers = index.assign(2024, season['position'].to_numpy(), season['points_per_game'].to_numpy())
+    assert np.array_equal(tiers, percentile_tiers(season['position_percentile'].to_numpy()))
+    assert index.assign(1999, 'QB', [20.0]).tolist() == [-1]
+
+
+def test_tracker_counts_follow_picks():
+    recommender = DraftRecommender()
+    recommender.reset_draft()
+    rankings = recommender.rankings
+    season = rankings[(rankings['season'] == 2024) & (rankings['position'] == 'RB')]
+    elite = season.index[season['position_percentile'] >= 0.9]
+
+    recommender.mark_player_drafted(int(elite[0]))
+    tracker = recommender.get_tier_tracker()
+    assert tracker.tier_of(int(elite[0])) == TIER_NAMES[0]
+    assert tracker.tier_remaining('RB', TIER_NAMES[0]) == len(elite) - 1
+
+    recommender.mark_player_drafted(int(elite[1]))
+    assert tracker.player_tier_remaining(int(elite[2])) == (TIER_NAMES[0], len(elite) - 2)
+    recommender.unmark_player_drafted(int(elite[0]))
+    assert tracker.tier_remaining('RB', 0) == len(elite) - 1
+    assert tracker.remaining.sum() == tracker.totals.sum() - 1
+
+    fresh = TierTracker(TierIndex.from_rankings(rankings), rankings, 2024)
+    assert fresh.totals.sum() == (rankings['season'] == 2024).sum()
@@ -0,0 +1,101 @@
+import json
+import os
+
+from utility import Trace
+
+
+def test_spans_are_noops_while_disabled():
+    Trace.disable()
+
+    with Trace.span("recommend.needs") as first:
+        pass
+
+    assert first is Trace.span("recommend.fol")
+    assert not Trace.enabled()
+
+
+def test_recommendation_stages_are_traced(tmp_path, league_config, empty_roster):
+    from recommender.DraftRecommender import DraftRecommender
+
+    recommender = DraftRecommender()
+    roster = empty_roster
+    path = str(tmp_path / "trace.json")
+    Trace.enable(path)
+    try:
+        recommender.get_recommendations(roster, league_config, top_n=5)
+    finally:
+        Trace.disable()
+
+    with open(path) as f:
+        events = {event['name']: event for event in json.load(f)['traceEvents']}
+    outer = events['recommend.get_recommendations']
+    for stage in ['recommend.needs', 'recommend.filter', 'recommend.score', 'recommend.top', 'recommend.fol']:
+        assert events[stage]['ph'] == 'X'
+        assert outer['ts'] <= events[stage]['ts'] <= events[stage]['ts'] + events[stage]['dur'] <= outer['ts'] + outer['dur']
+    assert outer['args'] == {'season': 2024, 'top_n': 5}
+
+
+def test_json_lines_output_and_summary(tmp_path):
+    path = str(tmp_path / "trace.jsonl")
+    Trace.enable(path)
+    for _ in range(3):
+        with Trace.span("step3.score"):
+            pass
+    stage = Trace.span("step3.save", rows=10)
+    stage.end()
+    stage.end()
+    Trace.disable()
+
+    events = Trace.read_trace(path)
+    assert [event['name'] for event in events] == ["step3.score"] * 3 + ["step3.save"]
+    assert events[-1]['args'] == {'rows': 10}
+    assert {row[0]: row[1] for row in Trace.summarize(events)} == {"step3.score": 3, "step3.save": 1}
+
+
+def test_memory_peaks_nest_and_budgets_fail_the_stage():
+    import pandas as pd
+    import pytest
+
+    tracer = Trace.enable(memory='tracemalloc', stage_budgets_mb={'step4.save': 4})
+    try:
+        with Trace.span("step4.features"):
+            with Trace.span("step4.rankings"):
+                buffer = bytearray(8 * 1024 * 1024)
+                del buffer
+            Trace.frame_memory('data', pd.DataFrame({'points_per_game': range(1000)}))
+        with pytest.raises(Trace.MemoryBudgetExceeded, match="step4.save"):
+            with Trace.span("step4.save"):
+                buffer = bytearray(8 * 1024 * 1024)
+                del buffer
+    finally:
+        Trace.disable()
+
+    peaks = {name: (peak, growth) for name, _, peak, growth in Trace.memory_summary(tracer.json_events())}
+    assert peaks['step4.rankings'][1] >= 8
+    assert peaks['step4.features'][1] >= peaks['step4.rankings'][1]  # Child peak counts for the parent
+    assert peaks['step4.save'][1] >= 8
+    assert tracer.frames[0]['stage'] == 'step4.features' and tracer.frames[0]['rows'] == 1000
+
+
+def test_rss_peaks_are_per_span():
+    import numpy as np
+    import pytest
+
+    if not os.path.exists('/proc/self/statm'):
+        pytest.skip("rss memory mode needs /proc")
+    with open('/proc/self/statm') as f:
+        baseline_mb = int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / Trace.MB
+    tracer = Trace.enable(memory='rss', stage_budgets_mb={'small': baseline_mb + 100})
+    try:
+        with Trace.span("big"):
+            block = np.ones(300 * 1024 * 1024 // 8)
+        del block
+        with Trace.span("small"):  # A later, light stage must not inherit big's peak or fail its budget
+            pass
+    finally:
+        Trace.disable()
+
+    peaks = {name: (peak, growth) for name, _, peak, growth in Trace.memory_summary(tracer.json_events())}
+    assert peaks['big'][1] >= 250
+    assert peaks['small'][1] < 50
+    assert peaks['small'][0] < peaks['big'][0] - 200
@@ -0,0 +1,49 @@
+"""
+Categorical dtypes of the player data.
+
+position, player_type and team have fixed category lists (see
+config/SchemaConfig.py) shared by Step 3, Step 4 and the recommender, so a
+column read in any stage has the same integer codes: grouping, sorting and
+equality masks run on the codes and every value is stored once.
+player_name is interned the same way with the names found in the data.
+"""
+import pandas as pd
+
+from config.SchemaConfig import categorical_columns, interned_columns
+
+DTYPES = {column: pd.CategoricalDtype(categories) for column, categories in categorical_columns.items()}
+
+
+def categorize(df):
+    """
+    Convert a DataFrame's schema columns to their categorical dtypes.
+
+    Args:
+        df: DataFrame (not modified)
+
+    Returns:
+        DataFrame with categorical schema columns (df itself if nothing changes)
+
+    Raises:
+        ValueError: If a column has values outside its fixed categories
+    """
+    dtypes = {}
+    for column in df.columns.intersection(list(DTYPES)):
+        dtype = DTYPES[column]
+        if df[column].dtype == dtype:
+            continue
+        values = df[column].dropna().unique()
+        unknown = sorted(set(map(str, values)) - set(dtype.categories))
+        if unknown:
+            raise ValueError(f"Unknown {column} values: {', '.join(unknown)} (see config/SchemaConfig.py)")
+        dtypes[column] = dtype
+    for column in df.columns.intersection(interned_columns):
+        if not isinstance(df[column].dtype, pd.CategoricalDtype):
+            dtypes[column] = 'category'
+    return df.astype(dtypes) if dtypes else df
+
+
+def read_csv(path, **kwargs):
+    """pd.read_csv with the schema columns parsed straight to categoricals."""
+    columns = list(DTYPES) + interned_columns
+    return categorize(pd.read_csv(path, dtype={column: 'category' for column in columns}, **kwargs))
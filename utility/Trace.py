@@ -0,0 +1,439 @@
+"""
+Timing spans around hot paths and pipeline stages.
+
+Tracing is off unless FFBDRAFT_TRACE names an output file (see
+config/TraceConfig.py) or enable() is called. While off, span() returns a
+shared no-op object, so an instrumented call costs one function call and a
+None check.
+
+    with Trace.span("recommend.fol", season=season):
+        ...
+
+    stage = Trace.span("step3.load")   # Starts timing now
+    ...
+    stage.end()
+
+Spans are buffered in memory and written when tracing is disabled or the
+process exits: as JSON lines, or in Chrome trace format for a .json path.
+FFBDRAFT_PROFILE additionally captures a cProfile of the traced run.
+
+With FFBDRAFT_MEMORY set, every span also records its memory peak
+(tracemalloc, or RSS) and Trace.frame_memory() records the size of a
+DataFrame within the current span. A stage-by-stage memory report is printed
+at the end, and a span over its budget raises MemoryBudgetExceeded.
+
+    FFBDRAFT_TRACE=data/trace.jsonl py main.py
+    FFBDRAFT_MEMORY=tracemalloc FFBDRAFT_MEMORY_BUDGET_MB=2048 py Step3ConsolidateData.py
+    py -m utility.Trace data/trace.jsonl     # Time (and memory) per span name
+"""
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+
+from config import TraceConfig
+
+MB = 1024 * 1024
+MEMORY_MODES = ('tracemalloc', 'rss')
+# Seconds between RSS samples in rss memory mode
+RSS_SAMPLE_INTERVAL = 0.005
+
+# Active Tracer, or None while tracing is off
+_tracer = None
+
+
+class MemoryBudgetExceeded(RuntimeError):
+    """A traced span's memory peak went over its configured budget."""
+
+    def __init__(self, name, peak_mb, budget_mb):
+        super().__init__(f"{name} peaked at {peak_mb:.1f} MB, over its {budget_mb:.1f} MB budget")
+        self.name = name
+        self.peak_mb = peak_mb
+        self.budget_mb = budget_mb
+
+
+class _NullSpan:
+    """Span returned while tracing is off."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def end(self):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """A timed region; timing starts when the span is created."""
+
+    __slots__ = ('tracer', 'name', 'args', 'start', 'memory')
+
+    def __init__(self, tracer, name, args):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+        self.memory = tracer.memory.enter(self) if tracer.memory is not None else None
+        self.start = time.perf_counter_ns()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.end(check_budget=exc_type is None)
+        return False
+
+    def end(self, check_budget=True):
+        """Record the span (only the first call counts)."""
+        tracer = self.tracer
+        if tracer is None:
+            return
+        end = time.perf_counter_ns()
+        self.tracer = None
+        if self.memory is not None:
+            self.args.update(tracer.memory.exit(self))
+        tracer.record(self.name, self.start, end, self.args)
+        if self.memory is not None and check_budget:
+            tracer.check_budget(self.name, self.args)
+
+
+class MemoryMeter:
+    """
+    Memory peaks of nested spans on the thread that enabled tracing.
+
+    tracemalloc keeps one process-wide peak, so entering a span folds the
+    peak so far into the enclosing span and resets it; each span's peak is
+    then the highest of its own and its children's. In rss mode the peak is
+    the highest current RSS (/proc/self/statm) seen at span boundaries and by
+    a background sampler every RSS_SAMPLE_INTERVAL seconds, reset the same
+    way (ru_maxrss can't be used: it is the process lifetime high-water mark).
+    """
+
+    def __init__(self, mode):
+        if mode not in MEMORY_MODES:
+            raise ValueError(f"Unknown memory mode {mode!r} (use one of {', '.join(MEMORY_MODES)})")
+        self.mode = mode
+        self.thread = threading.get_ident()
+        self.stack = []
+        self.started_tracemalloc = False
+        self.sampler = None
+        if mode == 'tracemalloc':
+            import tracemalloc
+            self._tracemalloc = tracemalloc
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self.started_tracemalloc = True
+        else:
+            if not os.path.exists('/proc/self/statm'):
+                raise ValueError("Memory mode 'rss' needs /proc/self/statm (Linux); use 'tracemalloc'")
+            self._page_size = os.sysconf('SC_PAGE_SIZE')
+            self._rss_peak = self._rss()
+            # Serializes the sampler's read-max-write with resets, so a sample
+            # taken before a reset can't restore the previous span's peak
+            self._peak_lock = threading.Lock()
+            self._stop = threading.Event()
+            self.sampler = threading.Thread(target=self._sample_rss, name='trace-rss-sampler', daemon=True)
+            self.sampler.start()
+
+    def _rss(self):
+        """Current resident set size in bytes."""
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * self._page_size
+
+    def _sample_rss(self):
+        while not self._stop.wait(RSS_SAMPLE_INTERVAL):
+            with self._peak_lock:
+                self._rss_peak = max(self._rss_peak, self._rss())
+
+    def current(self):
+        """(current, peak since the last reset) in bytes."""
+        if self.mode == 'tracemalloc':
+            return self._tracemalloc.get_traced_memory()
+        with self._peak_lock:
+            rss = self._rss()
+            return rss, max(self._rss_peak, rss)
+
+    def reset_peak(self, current):
+        if self.mode == 'tracemalloc':
+            self._tracemalloc.reset_peak()
+        else:
+            with self._peak_lock:
+                self._rss_peak = current
+
+    def enter(self, span):
+        """Start measuring a span; returns its frame (None on other threads)."""
+        if threading.get_ident() != self.thread:
+            return None
+        current, peak = self.current()
+        if self.stack:
+            self.stack[-1]['peak'] = max(self.stack[-1]['peak'], peak)
+        self.reset_peak(current)
+        frame = {'name': span.name, 'start': current, 'peak': current}
+        self.stack.append(frame)
+        return frame
+
+    def exit(self, span):
+        """Memory args of a finished span (MB)."""
+        current, peak = self.current()
+        frame = span.memory
+        # A span closed out of order (explicit .end()) also closes the ones opened after it
+        if any(open_frame is frame for open_frame in self.stack):
+            while self.stack.pop() is not frame:
+                pass
+        frame['peak'] = max(frame['peak'], peak)
+        if self.stack:
+            self.stack[-1]['peak'] = max(self.stack[-1]['peak'], frame['peak'])
+        # The enclosing span's peak from here on starts at the current level again
+        self.reset_peak(current)
+        return {
+            'mem_start_mb': round(frame['start'] / MB, 2),
+            'mem_end_mb': round(current / MB, 2),
+            'mem_peak_mb': round(frame['peak'] / MB, 2),
+            'mem_growth_mb': round((frame['peak'] - frame['start']) / MB, 2),
+        }
+
+    def stage(self):
+        """Name of the innermost open span (None outside spans)."""
+        return self.stack[-1]['name'] if self.stack else None
+
+    def close(self):
+        if self.started_tracemalloc:
+            self._tracemalloc.stop()
+        if self.sampler is not None:
+            self._stop.set()
+            self.sampler.join()
+
+
+class Tracer:
+    """Collects spans and writes them as JSON lines or a Chrome trace."""
+
+    def __init__(self, path=None, profile_path=None, memory=None, budget_mb=None, stage_budgets_mb=None):
+        """
+        Args:
+            path: Output file (.json for Chrome trace format), or None to
+                keep the spans in memory only (see events)
+            profile_path: Optional cProfile stats output file
+            memory: Optional memory mode, 'tracemalloc' or 'rss'
+            budget_mb: Memory budget of every span (MB), or None
+            stage_budgets_mb: Dict of span name -> budget overriding budget_mb
+        """
+        self.path = path
+        self.profile_path = profile_path
+        self.events = []
+        self.frames = []
+        self.origin = time.perf_counter_ns()
+        self.pid = os.getpid()
+        self.memory = MemoryMeter(memory) if memory else None
+        self.budget_mb = budget_mb
+        self.stage_budgets_mb = stage_budgets_mb or {}
+        self.profiler = None
+        if profile_path:
+            import cProfile
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+
+    def record(self, name, start_ns, end_ns, args):
+        """Add a finished span (list.append is atomic, so threads can share the tracer)."""
+        self.events.append((name, start_ns, end_ns, threading.get_ident(), args))
+
+    def check_budget(self, name, args):
+        """Raise MemoryBudgetExceeded if a span's peak is over its budget."""
+        budget = self.stage_budgets_mb.get(name, self.budget_mb)
+        if budget is not None and args.get('mem_peak_mb', 0) > budget:
+            raise MemoryBudgetExceeded(name, args['mem_peak_mb'], budget)
+
+    def record_frame(self, name, frame):
+        """Add a DataFrame size sample (deep memory usage) in the current span."""
+        if self.memory is None or threading.get_ident() != self.memory.thread:
+            return
+        self.frames.append({
+            'name': name,
+            'stage': self.memory.stage(),
+            'ts': (time.perf_counter_ns() - self.origin) / 1000,
+            'rows': len(frame),
+            'mb': round(frame.memory_usage(deep=True).sum() / MB, 2),
+        })
+
+    def close(self):
+        """Stop profiling and write the output files."""
+        if self.profiler is not None:
+            self.profiler.disable()
+            self.profiler.dump_stats(self.profile_path)
+            self.profiler = None
+        if self.memory is not None:
+            self.memory.close()
+            print_memory_report(self.json_events(), self.frames, file=sys.stderr)
+        if self.path:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.path, 'w') as f:
+                if self.path.endswith('.json'):
+                    json.dump({'traceEvents': self.chrome_events(), 'displayTimeUnit': 'ms'}, f)
+                else:
+                    for event in self.json_events() + [dict(frame, frame=True) for frame in self.frames]:
+                        f.write(json.dumps(event) + "\n")
+
+    def json_events(self):
+        """Spans as dicts with name, ts and dur (microseconds), tid and args."""
+        return [
+            {'name': name, 'ts': (start - self.origin) / 1000, 'dur': (end - start) / 1000, 'tid': tid, 'args': args}
+            for name, start, end, tid, args in self.events
+        ]
+
+    def chrome_events(self):
+        """Spans as Chrome trace 'complete' events and frame samples as instant events."""
+        events = [
+            {'name': name, 'cat': name.split('.')[0], 'ph': 'X', 'ts': (start - self.origin) / 1000,
+             'dur': (end - start) / 1000, 'pid': self.pid, 'tid': tid, 'args': args}
+            for name, start, end, tid, args in self.events
+        ]
+        events += [
+            {'name': f"frame {frame['name']}", 'cat': 'memory', 'ph': 'i', 's': 't', 'ts': frame['ts'],
+             'pid': self.pid, 'tid': self.memory.thread, 'args': {**frame, 'frame': True}}
+            for frame in self.frames
+        ]
+        return events
+
+
+def span(name, **args):
+    """
+    Time a region: use as a context manager or call .end() on the result.
+
+    Args:
+        name: Span name, '<area>.<stage>' (the area is the trace category)
+        **args: JSON-serializable details recorded with the span
+
+    Returns:
+        Span object (a shared no-op while tracing is off)
+    """
+    tracer = _tracer
+    if tracer is None:
+        return _NULL_SPAN
+    return _Span(tracer, name, args)
+
+
+def frame_memory(name, frame):
+    """Record a DataFrame's deep memory size in the current span (memory mode only)."""
+    tracer = _tracer
+    if tracer is not None:
+        tracer.record_frame(name, frame)
+
+
+def enabled():
+    """Whether spans are being recorded."""
+    return _tracer is not None
+
+
+def enable(path=None, profile_path=None, memory=None, budget_mb=None, stage_budgets_mb=None):
+    """
+    Start recording spans (see Tracer for the arguments).
+
+    Returns:
+        The Tracer; its spans are written by disable() or at exit
+    """
+    global _tracer
+    disable()
+    _tracer = Tracer(path, profile_path, memory, budget_mb, stage_budgets_mb)
+    return _tracer
+
+
+def disable():
+    """Stop recording and write the active tracer's output."""
+    global _tracer
+    tracer, _tracer = _tracer, None
+    if tracer is not None:
+        tracer.close()
+    return tracer
+
+
+def read_trace(path):
+    """Spans of a trace file (either format) as dicts with name, ts, dur (microseconds) and args."""
+    with open(path) as f:
+        if path.endswith('.json'):
+            return json.load(f)['traceEvents']
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def split_frames(events):
+    """(spans, DataFrame samples) of read_trace() events."""
+    frames = [event.get('args', event) for event in events if event.get('frame') or event.get('args', {}).get('frame')]
+    spans = [event for event in events if not (event.get('frame') or event.get('args', {}).get('frame'))]
+    return spans, frames
+
+
+def summarize(events):
+    """
+    Total, count and mean/max duration per span name, slowest total first.
+
+    Returns:
+        List of (name, count, total ms, mean ms, max ms)
+    """
+    durations = {}
+    for event in events:
+        durations.setdefault(event['name'], []).append(event['dur'] / 1000)
+    rows = [(name, len(d), sum(d), sum(d) / len(d), max(d)) for name, d in durations.items()]
+    return sorted(rows, key=lambda row: row[2], reverse=True)
+
+
+def memory_summary(events):
+    """
+    Highest memory peak and growth per span name, in first-seen order.
+
+    Returns:
+        List of (name, count, peak MB, growth MB); spans without memory args are skipped
+    """
+    rows = {}
+    for event in events:
+        args = event.get('args', {})
+        if 'mem_peak_mb' not in args:
+            continue
+        count, peak, growth = rows.get(event['name'], (0, 0.0, 0.0))
+        rows[event['name']] = (count + 1, max(peak, args['mem_peak_mb']), max(growth, args['mem_growth_mb']))
+    return [(name, *values) for name, values in rows.items()]
+
+
+def print_memory_report(events, frames, file=sys.stdout):
+    """Print the stage-by-stage memory peaks and the DataFrame sizes recorded in each stage."""
+    rows = memory_summary(events)
+    if not rows and not frames:
+        return
+    print(f"\n  {'stage':32s} {'count':>7s} {'peak MB':>10s} {'growth MB':>10s}", file=file)
+    for name, count, peak, growth in rows:
+        print(f"  {name:32s} {count:7d} {peak:10.1f} {growth:10.1f}", file=file)
+    if frames:
+        print(f"\n  {'DataFrame':32s} {'stage':20s} {'rows':>10s} {'MB':>8s}", file=file)
+        for frame in frames:
+            print(f"  {frame['name']:32s} {frame['stage'] or '-':20s} {frame['rows']:10,d} {frame['mb']:8.1f}",
+                  file=file)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 1:
+        print("Usage: py -m utility.Trace <trace file>")
+        return 1
+    spans, frames = split_frames(read_trace(argv[0]))
+    print(f"\n  {'span':32s} {'count':>7s} {'total ms':>10s} {'mean ms':>9s} {'max ms':>9s}")
+    for name, count, total, mean, longest in summarize(spans):
+        print(f"  {name:32s} {count:7d} {total:10.2f} {mean:9.3f} {longest:9.3f}")
+    print_memory_report(spans, frames)
+    return 0
+
+
+if TraceConfig.trace_path or TraceConfig.profile_path or TraceConfig.memory_mode:
+    enable(TraceConfig.trace_path, TraceConfig.profile_path, TraceConfig.memory_mode,
+           TraceConfig.memory_budget_mb, TraceConfig.stage_memory_budgets_mb)
+atexit.register(disable)
+
+
+if __name__ == "__main__":
+    sys.exit(main())